@@ -3,10 +3,10 @@
 
 a = Analysis(
     ['server.py'],
-    pathex=[],
+    pathex=['verify'],
     binaries=[],
     datas=[('public', 'public'), ('verify', 'verify')],
-    hiddenimports=['winreg'],
+    hiddenimports=['winreg', 'verify_dmca'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -0,0 +1,127 @@
+"""
+End-to-end batch throughput against the local Steam stand-in.
+
+Starts bench/fake_steam.py in-process, points server.py at it through the
+PZ_STEAM_COMMUNITY_URL / PZ_STEAM_API_URL overrides, then runs what a
+"Run All Searches" batch does - one search_workshop per mod ID, a profile
+fetch and a batched existence check of everything found - and reports
+wall time, effective request rate and how often the fake's quota model
+had to reject a request. The scraping limiter's settings can be changed
+per run (--rpm / --max-rpm / --burst), and the Web API limiter's with
+--api-rpm / --api-max-rpm, to tune them against a given quota. A starting
+rate above the limiter's max raises the max to match, with a warning,
+rather than being clamped to it:
+
+    python bench/bench_e2e.py --community-rpm 20 --rpm 18 --max-rpm 18
+    python bench/bench_e2e.py --community-rpm 20 --rpm 10 --max-rpm 40 --retry-after 0
+
+The real workshop details cache, search jobs and learned rate-limit
+state are never touched: PZ_TRACKER_DATA_DIR points server.py at a
+scratch directory before it's imported, and the limiters start fresh.
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR))
+sys.path.insert(0, str(BENCH_DIR.parent))
+
+import fake_steam  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark a search batch end-to-end against fake_steam.py")
+    parser.add_argument("--mods", type=int, default=5, help="Number of mod IDs to search (default 5)")
+    parser.add_argument("--max-pages", type=int, default=5, help="search_workshop max_pages (default 5)")
+    parser.add_argument("--profiles", type=int, default=1, help="Profiles to fetch (default 1)")
+    parser.add_argument("--rpm", type=float, default=None, help="Scraping limiter's starting requests/minute")
+    parser.add_argument("--max-rpm", type=float, default=None, help="Scraping limiter's max requests/minute")
+    parser.add_argument("--burst", type=int, default=None, help="Scraping limiter's bucket size")
+    parser.add_argument("--api-rpm", type=float, default=None, help="Web API limiter's starting requests/minute")
+    parser.add_argument("--api-max-rpm", type=float, default=None, help="Web API limiter's max requests/minute")
+    parser.add_argument("--verbose", action="store_true", help="Show the tracker's own log output")
+    fake_steam.add_fake_arguments(parser)
+    args = parser.parse_args()
+
+    fake = fake_steam.fake_from_args(args)
+    httpd = fake_steam.serve(fake)
+    host, port = httpd.server_address[:2]
+    base = f"http://{host}:{port}"
+    os.environ["PZ_STEAM_COMMUNITY_URL"] = base
+    os.environ["PZ_STEAM_API_URL"] = base
+    tmp = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+    os.environ["PZ_TRACKER_DATA_DIR"] = tmp.name
+
+    quiet = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+    with contextlib.redirect_stdout(io.StringIO()):
+        import server
+
+    overrides = {"community": {"rpm": args.rpm, "max_rpm": args.max_rpm, "burst": args.burst},
+                 "webapi": {"rpm": args.api_rpm, "max_rpm": args.api_max_rpm}}
+    for name, options in overrides.items():
+        defaults = server.STEAM_RATE_LIMIT_DEFAULTS[name]
+        defaults.update({k: v for k, v in options.items() if v is not None})
+        if defaults["rpm"] > defaults["max_rpm"]:
+            print(f"Warning: {name} rpm {defaults['rpm']:g} is above its max_rpm {defaults['max_rpm']:g}; "
+                  f"raising max_rpm to {defaults['rpm']:g}")
+            defaults["max_rpm"] = defaults["rpm"]
+    server.steam_rate_limiters = server._create_steam_rate_limiters()
+    server.steam_rate_limiter = server.steam_rate_limiters["community"]
+
+    print(f"Fake Steam at {base}")
+    for name, limiter in server.steam_rate_limiters.items():
+        print(f"  {name} limiter: {limiter.rate:g} rpm (max {limiter.max_rpm:g}), burst {limiter.burst}")
+
+    found = []
+    blocked = []
+    started = time.time()
+    with quiet:
+        for i in range(args.mods):
+            mod_id = f"BenchMod{i:03d}"
+            items, error = server.search_workshop(mod_id, max_pages=args.max_pages, force_refresh=True)
+            if error:
+                blocked.append((mod_id, error.get("statusCode")))
+            else:
+                found.extend(it["workshopId"] for it in items)
+        for i in range(args.profiles):
+            items, error = server.search_profile_workshop(str(76561190000000000 + i), max_pages=10)
+            if error:
+                blocked.append((f"profile {i}", error.get("statusCode")))
+            else:
+                found.extend(it["workshopId"] for it in items)
+        searches_done = time.time()
+        existence = server.check_workshop_exists_batch(found) if found else []
+    elapsed = time.time() - started
+
+    stats = fake.snapshot()
+    learned = {name: limiter.snapshot() for name, limiter in server.steam_rate_limiters.items()}
+    httpd.shutdown()
+    tmp.cleanup()
+
+    print(f"\nSearches: {args.mods} mod(s) + {args.profiles} profile(s) in {searches_done - started:.1f}s, "
+          f"{len(found)} item(s), {len(blocked)} blocked")
+    for name, status in blocked:
+        print(f"  blocked: {name} (status {status})")
+    print(f"Existence check: {len(existence)} item(s), "
+          f"{sum(1 for e in existence if not e['exists'])} reported removed, "
+          f"{sum(1 for e in existence if e.get('error'))} errored")
+    print(f"Total wall time: {elapsed:.1f}s\n")
+    print(f"{'group':10} {'requests':>9} {'served':>7} {'quota':>6} {'errors':>7} {'captcha':>8} {'served/min':>11}")
+    for group, s in stats["groups"].items():
+        print(f"{group:10} {s['requests']:>9} {s['served']:>7} {s['quotaLimited']:>6} "
+              f"{s['injectedErrors']:>7} {s['captchas']:>8} {s['servedPerMinute']:>11.1f}")
+    print()
+    for name, snap in learned.items():
+        print(f"{name} limiter ended at {snap['rate']} rpm (penalty {snap['penaltySeconds']}s left)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+"""
+Offline benchmark for the workshop HTML parsers in server.py.
+
+Runs _parse_workshop_items over every page in bench/fixtures/ and reports,
+per fixture, which parser path produced the items along with items/sec,
+MB/sec and tracemalloc peak memory. Fixtures are recorded from Steam by
+record_fixtures.py, or generated by make_fixtures.py for layouts that
+can't be recorded and as stand-ins until they are; the report and the
+baseline say which each one is (fixtures/sources.json).
+
+Each fixture is also run through a reference parse - the stdlib
+html.parser tokenizing the same page - timed alternately with the real
+one in the same run. The baseline stores the ratio of the two ("rel"),
+not absolute throughput, so it holds across machines and load. Results
+are checked against bench/baseline.json: a fixture that parses a
+different number of items, via a different path, or whose rel cost (or
+peak memory) grows by more than the threshold counts as a regression and
+the run exits 1.
+
+Usage:
+    python bench/bench_parsers.py
+    python bench/bench_parsers.py --threshold 0.5
+    python bench/bench_parsers.py --update-baseline
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from html.parser import HTMLParser
+from pathlib import Path
+
+import make_fixtures
+
+BENCH_DIR = Path(__file__).resolve().parent
+FIXTURES_DIR = BENCH_DIR / "fixtures"
+BASELINE_FILE = BENCH_DIR / "baseline.json"
+
+sys.path.insert(0, str(BENCH_DIR.parent))
+# Importing server.py opens its details cache and rate-limit state; keep
+# those in a scratch directory rather than the real ones.
+_data_dir = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+os.environ["PZ_TRACKER_DATA_DIR"] = _data_dir.name
+with contextlib.redirect_stdout(io.StringIO()):
+    import server  # noqa: E402
+
+
+def _parse_quietly(html, page_type):
+    # The parsers log which path they took via print(); keep that out of
+    # both the report and the timings.
+    with contextlib.redirect_stdout(io.StringIO()):
+        return server._parse_workshop_items(html, page_type)
+
+
+def _reference_parse(html):
+    parser = HTMLParser(convert_charrefs=False)
+    parser.feed(html)
+    parser.close()
+
+
+def bench_fixture(path, min_seconds):
+    html = path.read_text(encoding="utf-8")
+    size_mb = len(html.encode("utf-8")) / (1024 * 1024)
+
+    # Fixtures are named <page type>_*.html. Each starts with no remembered
+    # path for its page type; the first parse below warms that up, so the
+    # timings are the steady state of a multi-page search.
+    page_type = path.stem.split("_", 1)[0]
+    server._preferred_parse_template.clear()
+    items, total_pages, parser_path = _parse_quietly(html, page_type)
+
+    # Best-of-N timing; at least 3 rounds, more for fast fixtures so the
+    # figure isn't dominated by timer resolution. Each round times the
+    # reference parse right after the real one, so both see the same
+    # machine state; rel is the median of the per-round ratios.
+    best = float("inf")
+    ratios = []
+    started = time.perf_counter()
+    while len(ratios) < 3 or time.perf_counter() - started < min_seconds:
+        t0 = time.perf_counter()
+        _parse_quietly(html, page_type)
+        t1 = time.perf_counter()
+        _reference_parse(html)
+        t2 = time.perf_counter()
+        best = min(best, t1 - t0)
+        ratios.append((t1 - t0) / (t2 - t1))
+    rounds = len(ratios)
+
+    tracemalloc.start()
+    _parse_quietly(html, page_type)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "path": parser_path,
+        "items": len(items),
+        "totalPages": total_pages,
+        "sizeMb": round(size_mb, 3),
+        "seconds": best,
+        "itemsPerSec": round(len(items) / best, 1),
+        "mbPerSec": round(size_mb / best, 2),
+        "rel": round(statistics.median(ratios), 4),
+        "peakKb": round(peak / 1024, 1),
+        "rounds": rounds,
+    }
+
+
+def compare(name, result, baseline, threshold):
+    """Return a list of regression messages for one fixture."""
+    problems = []
+    for key in ("path", "items", "totalPages"):
+        if result[key] != baseline.get(key):
+            problems.append(f"{key} {baseline.get(key)!r} -> {result[key]!r}")
+    base_rel = baseline.get("rel")
+    if base_rel and result["rel"] > base_rel * (1 + threshold):
+        problems.append(f"rel cost {base_rel} -> {result['rel']}")
+    base_peak = baseline.get("peakKb")
+    if base_peak and result["peakKb"] > base_peak * (1 + threshold):
+        problems.append(f"peak memory {base_peak} -> {result['peakKb']} KB")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the workshop HTML parsers against recorded fixtures")
+    parser.add_argument("--threshold", type=float, default=0.30,
+                        help="Allowed fractional slowdown / memory growth before failing (default 0.30)")
+    parser.add_argument("--min-seconds", type=float, default=0.5,
+                        help="Minimum timing time per fixture (default 0.5)")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Record this run as the new baseline instead of comparing")
+    args = parser.parse_args()
+
+    fixtures = sorted(FIXTURES_DIR.glob("*.html"))
+    if not fixtures:
+        print(f"No fixtures in {FIXTURES_DIR} - run bench/record_fixtures.py and bench/make_fixtures.py")
+        return 1
+
+    baseline = {}
+    if BASELINE_FILE.exists() and not args.update_baseline:
+        baseline = json.loads(BASELINE_FILE.read_text(encoding="utf-8")).get("fixtures", {})
+
+    sources = make_fixtures.load_sources()
+    print(f"{'fixture':36} {'source':10} {'path':14} {'items':>6} {'items/s':>10} {'MB/s':>8} {'rel':>7} {'peak KB':>9}  status")
+    results = {}
+    regressions = 0
+    for path in fixtures:
+        name = path.stem
+        result = bench_fixture(path, args.min_seconds)
+        result["source"] = sources.get(name)
+        results[name] = result
+
+        if args.update_baseline:
+            status = "baselined"
+        elif name not in baseline:
+            status = "no baseline"
+        else:
+            problems = compare(name, result, baseline[name], args.threshold)
+            status = "ok" if not problems else "REGRESSION: " + "; ".join(problems)
+            regressions += bool(problems)
+
+        print(f"{name:36} {str(result['source']):10} {str(result['path']):14} {result['items']:>6} "
+              f"{result['itemsPerSec']:>10.0f} {result['mbPerSec']:>8.2f} {result['rel']:>7.3f} "
+              f"{result['peakKb']:>9.1f}  {status}")
+
+    missing = sorted(set(baseline) - set(results))
+    for name in missing:
+        print(f"{name:36} missing fixture (present in baseline)")
+    regressions += len(missing)
+
+    if args.update_baseline:
+        BASELINE_FILE.write_text(json.dumps({
+            "python": sys.version.split()[0],
+            "fixtures": {
+                name: {k: r[k] for k in ("source", "path", "items", "totalPages", "sizeMb", "rel", "peakKb")}
+                for name, r in results.items()
+            },
+        }, indent=2) + "\n", encoding="utf-8")
+        print(f"\nBaseline written to {BASELINE_FILE}")
+        return 0
+
+    if regressions:
+        print(f"\n{regressions} fixture(s) regressed beyond {args.threshold:.0%}")
+        return 1
+    print("\nNo regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,350 @@
+"""
+Local stand-in for the parts of Steam the tracker talks to.
+
+Serves, from a deterministic fake catalogue:
+- /workshop/browse/                   SSR browse pages (renderContext JSON)
+- /profiles/<id>/myworkshopfiles/     legacy profile pages (also /id/<vanity>/)
+- /ISteamRemoteStorage/GetPublishedFileDetails/v1/
+
+and can misbehave on purpose so search_workshop, search_profile_workshop,
+the rate limiter and the verifier's details lookups can be exercised
+without touching real Steam:
+- per-minute quotas per endpoint group ("community" pages, "webapi"),
+  answered with 429 (or 403) plus an optional lockout period once blown
+- randomly injected 429/403 responses and CAPTCHA pages
+- fixed + jittered latency
+
+Point the tracker at it with the base-URL overrides read by server.py:
+
+    python bench/fake_steam.py --port 8765 --community-rpm 10
+    set PZ_STEAM_COMMUNITY_URL=http://127.0.0.1:8765
+    set PZ_STEAM_API_URL=http://127.0.0.1:8765
+    python server.py
+
+GET /__stats returns per-endpoint counters, POST /__reset clears them.
+bench/bench_e2e.py runs a whole batch against it in-process.
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import sys
+import time
+import urllib.parse
+from collections import deque
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from threading import Lock, Thread
+
+import make_fixtures
+
+CAPTCHA_PAGE = (
+    '<html><head><title>Steam Community :: Error</title></head><body>'
+    '<div class="error_ctn"><h3>Please verify you are human</h3>'
+    '<div class="g-recaptcha" data-sitekey="fake"></div></div></body></html>'
+)
+
+
+class FakeSteam:
+    """
+    Fake catalogue, quota model and fault injection, shared by every
+    request the HTTP server handles. All randomness comes from one seeded
+    generator, and the catalogue is derived from hashes of the query, so
+    the same settings replay the same run.
+    """
+
+    def __init__(self, community_rpm=0, webapi_rpm=0, limit_status=429, retry_after=None,
+                 lockout_seconds=0, error_rate=0.0, error_status=429, captcha_rate=0.0,
+                 latency_ms=0, jitter_ms=0, results_per_search=45, profile_items=75,
+                 removed_every=0, page_kb=160, seed=108600):
+        self.quotas = {"community": community_rpm, "webapi": webapi_rpm}
+        self.limit_status = limit_status
+        self.retry_after = retry_after
+        self.lockout_seconds = lockout_seconds
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.captcha_rate = captcha_rate
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.results_per_search = results_per_search
+        self.profile_items = profile_items
+        self.removed_every = removed_every
+        self.page_kb = page_kb
+        self.seed = seed
+
+        self.lock = Lock()
+        self.rng = random.Random(seed)
+        self.chrome = make_fixtures.page_chrome(random.Random(seed), page_kb)
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.windows = {group: deque() for group in self.quotas}
+            self.locked_until = {group: 0.0 for group in self.quotas}
+            self.stats = {group: {"requests": 0, "served": 0, "quotaLimited": 0,
+                                  "injectedErrors": 0, "captchas": 0}
+                          for group in self.quotas}
+            self.started = time.time()
+
+    def snapshot(self):
+        with self.lock:
+            elapsed = max(time.time() - self.started, 1e-9)
+            return {
+                "elapsedSeconds": round(elapsed, 2),
+                "groups": {
+                    group: dict(s, servedPerMinute=round(s["served"] * 60 / elapsed, 2))
+                    for group, s in self.stats.items()
+                },
+            }
+
+    # ------------------------------------------------------------------
+    # Quota / fault model
+    # ------------------------------------------------------------------
+    def admit(self, group):
+        """Decide what happens to one request: (status, retry_after) for a
+        rejection, "captcha", or None to serve it normally."""
+        with self.lock:
+            now = time.time()
+            stats = self.stats[group]
+            stats["requests"] += 1
+
+            window = self.windows[group]
+            while window and window[0] <= now - 60:
+                window.popleft()
+
+            if now < self.locked_until[group]:
+                stats["quotaLimited"] += 1
+                return self.limit_status, self._retry_after(self.locked_until[group] - now)
+
+            quota = self.quotas[group]
+            if quota and len(window) >= quota:
+                stats["quotaLimited"] += 1
+                if self.lockout_seconds:
+                    self.locked_until[group] = now + self.lockout_seconds
+                    wait = self.lockout_seconds
+                else:
+                    wait = window[0] + 60 - now
+                return self.limit_status, self._retry_after(wait)
+
+            window.append(now)
+            if self.error_rate and self.rng.random() < self.error_rate:
+                stats["injectedErrors"] += 1
+                return self.error_status, None
+            if group == "community" and self.captcha_rate and self.rng.random() < self.captcha_rate:
+                stats["captchas"] += 1
+                return "captcha"
+            stats["served"] += 1
+            return None
+
+    def _retry_after(self, wait):
+        if self.retry_after is None:
+            return None
+        return self.retry_after if self.retry_after > 0 else max(1, int(wait + 0.999))
+
+    def delay(self):
+        with self.lock:
+            jitter = self.rng.uniform(0, self.jitter_ms) if self.jitter_ms else 0
+        if self.latency_ms or jitter:
+            time.sleep((self.latency_ms + jitter) / 1000)
+
+    # ------------------------------------------------------------------
+    # Catalogue
+    # ------------------------------------------------------------------
+    def _rng_for(self, *key):
+        digest = hashlib.sha1(repr((self.seed,) + key).encode()).digest()
+        return random.Random(int.from_bytes(digest[:8], "big"))
+
+    def _catalogue(self, key, count):
+        return make_fixtures.fake_items(self._rng_for(key), count)
+
+    def browse_page(self, searchtext, page):
+        items = self._catalogue(("search", searchtext), self.results_per_search)
+        per_page = 30
+        total_pages = -(-len(items) // per_page)
+        page_items = items[(page - 1) * per_page:page * per_page]
+        return make_fixtures.ssr_page(None, page_items, total_pages, 0, chrome=self.chrome)
+
+    def profile_page(self, profile, page, per_page):
+        items = self._catalogue(("profile", profile), self.profile_items)
+        page_items = items[(page - 1) * per_page:page * per_page]
+        if not page_items:
+            return make_fixtures.legacy_zero_page(None, 0, chrome=self.chrome)
+        return make_fixtures.legacy_profile_page(None, page_items, len(items), 0, chrome=self.chrome)
+
+    def file_details(self, workshop_id):
+        rng = self._rng_for("details", workshop_id)
+        if self.removed_every and int(workshop_id) % self.removed_every == 0:
+            return {"publishedfileid": workshop_id, "result": 9}
+        mod_id = "FakeMod" + workshop_id[-5:]
+        return {
+            "publishedfileid": workshop_id,
+            "result": 1,
+            "creator": str(76561190000000000 + rng.randint(0, 9_999_999)),
+            "consumer_app_id": 108600,
+            "title": f"Fake Workshop Item {workshop_id}",
+            "description": f"Anonymized item.\nWorkshop ID: {workshop_id}\nMod ID: {mod_id}\n",
+            "file_size": rng.randint(10_000, 50_000_000),
+            "hcontent_file": str(rng.randint(10 ** 17, 10 ** 19)),
+            "time_created": rng.randint(1_500_000_000, 1_600_000_000),
+            "time_updated": rng.randint(1_600_000_000, 1_760_000_000),
+            "subscriptions": rng.randint(0, 250_000),
+        }
+
+
+class _ThreadedServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class FakeSteamHandler(BaseHTTPRequestHandler):
+    fake = None  # set by serve()
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def _send(self, status, body, content_type="text/html; charset=utf-8", headers=None):
+        data = body.encode("utf-8") if isinstance(body, str) else body
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _gate(self, group):
+        """Apply latency + the quota/fault model. Returns True if the
+        request was already answered."""
+        self.fake.delay()
+        verdict = self.fake.admit(group)
+        if verdict is None:
+            return False
+        if verdict == "captcha":
+            self._send(200, CAPTCHA_PAGE)
+            return True
+        status, retry_after = verdict
+        headers = {"Retry-After": str(retry_after)} if retry_after is not None else None
+        self._send(status, f"<html><body>Error {status}</body></html>", headers=headers)
+        return True
+
+    def do_GET(self):
+        parsed = urllib.parse.urlsplit(self.path)
+        query = urllib.parse.parse_qs(parsed.query)
+
+        def _int(name, default):
+            try:
+                return max(1, int(query.get(name, [default])[0]))
+            except ValueError:
+                return default
+
+        if parsed.path == "/__stats":
+            return self._send(200, json.dumps(self.fake.snapshot()), "application/json")
+
+        if parsed.path.rstrip("/") == "/workshop/browse":
+            if self._gate("community"):
+                return
+            searchtext = query.get("searchtext", [""])[0]
+            return self._send(200, self.fake.browse_page(searchtext, _int("p", 1)))
+
+        m = re.match(r"^/(profiles|id)/([^/]+)/myworkshopfiles/?$", parsed.path)
+        if m:
+            if self._gate("community"):
+                return
+            return self._send(200, self.fake.profile_page(m.group(2), _int("p", 1), _int("numperpage", 9)))
+
+        self._send(404, "Not found")
+
+    def do_POST(self):
+        parsed = urllib.parse.urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length).decode("utf-8", errors="ignore") if length else ""
+
+        if parsed.path == "/__reset":
+            self.fake.reset()
+            return self._send(200, "{}", "application/json")
+
+        if parsed.path.rstrip("/") == "/ISteamRemoteStorage/GetPublishedFileDetails/v1":
+            if self._gate("webapi"):
+                return
+            form = urllib.parse.parse_qs(body)
+            ids = [v[0] for k, v in sorted(form.items()) if k.startswith("publishedfileids[")]
+            details = [self.fake.file_details(wid) for wid in ids if wid.isdigit()]
+            payload = {"response": {"result": 1, "resultcount": len(details),
+                                    "publishedfiledetails": details}}
+            return self._send(200, json.dumps(payload), "application/json")
+
+        self._send(404, "Not found")
+
+
+def serve(fake, host="127.0.0.1", port=0):
+    """Start the fake on a background thread; returns the HTTP server
+    (server.server_address has the bound port, server.shutdown() stops it)."""
+    handler = type("BoundFakeSteamHandler", (FakeSteamHandler,), {"fake": fake})
+    httpd = _ThreadedServer((host, port), handler)
+    Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd
+
+
+def add_fake_arguments(parser):
+    """CLI options for the quota / fault model, shared with bench_e2e.py."""
+    parser.add_argument("--community-rpm", type=int, default=0,
+                        help="Per-minute quota for browse/profile pages (0 = unlimited)")
+    parser.add_argument("--webapi-rpm", type=int, default=0,
+                        help="Per-minute quota for GetPublishedFileDetails (0 = unlimited)")
+    parser.add_argument("--limit-status", type=int, default=429, choices=(403, 429),
+                        help="Status returned once a quota is exceeded (default 429)")
+    parser.add_argument("--retry-after", type=int, default=None,
+                        help="Send Retry-After on quota rejections: N seconds, or 0 for the real remaining wait")
+    parser.add_argument("--lockout", type=float, default=0,
+                        help="Reject everything in a group for this many seconds after its quota is blown")
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="Fraction of admitted requests answered with --error-status anyway")
+    parser.add_argument("--error-status", type=int, default=429, choices=(403, 429))
+    parser.add_argument("--captcha-rate", type=float, default=0.0,
+                        help="Fraction of admitted page requests answered with a CAPTCHA page")
+    parser.add_argument("--latency-ms", type=float, default=0, help="Fixed latency per request")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="Extra random latency, 0..N ms")
+    parser.add_argument("--results-per-search", type=int, default=45,
+                        help="Items every browse search returns (30 per page)")
+    parser.add_argument("--profile-items", type=int, default=75, help="Items on every profile")
+    parser.add_argument("--removed-every", type=int, default=0,
+                        help="Report workshop IDs divisible by N as removed (result 9)")
+    parser.add_argument("--seed", type=int, default=108600)
+
+
+def fake_from_args(args):
+    return FakeSteam(
+        community_rpm=args.community_rpm, webapi_rpm=args.webapi_rpm,
+        limit_status=args.limit_status, retry_after=args.retry_after,
+        lockout_seconds=args.lockout, error_rate=args.error_rate,
+        error_status=args.error_status, captcha_rate=args.captcha_rate,
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        results_per_search=args.results_per_search, profile_items=args.profile_items,
+        removed_every=args.removed_every, seed=args.seed,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Steam stand-in for throughput and rate-limit testing")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    add_fake_arguments(parser)
+    args = parser.parse_args()
+
+    httpd = serve(fake_from_args(args), args.host, args.port)
+    host, port = httpd.server_address[:2]
+    print(f"Fake Steam running: http://{host}:{port}")
+    print(f"  set PZ_STEAM_COMMUNITY_URL=http://{host}:{port}")
+    print(f"  set PZ_STEAM_API_URL=http://{host}:{port}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        httpd.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,222 @@
+"""
+Generate the workshop page fixtures that can't be recorded from Steam.
+
+Live pages are captured by record_fixtures.py. This covers the rest:
+the layouts only the fallback parsers handle (build-hashed title divs,
+img-alt thumbnails), which Steam doesn't serve while its SSR blob is
+intact, and profile pages far larger than Steam's 30-per-page limit, for
+the legacy hover/blocks parsers' scaling. It also writes synthetic
+stand-ins for the pages record_fixtures.py captures (RECORDABLE), so the
+benchmark has every fixture before anything has been recorded; a
+stand-in is never written over a recording.
+
+fixtures/sources.json says which fixtures are "synthetic" and which are
+"recorded"; both scripts keep it up to date and bench_parsers.py carries
+it into the baseline. Workshop IDs, titles, authors
+and descriptions are generated from a fixed seed, steam IDs are the
+documented "0" placeholder range, and page chrome is filler of roughly
+the real pages' size. The only real ID kept is the Modding Policy link
+(KNOWN_NON_RESULT_WORKSHOP_IDS), since the parsers must keep filtering
+it out.
+
+The page builders are also what fake_steam.py serves.
+
+Usage:
+    python bench/make_fixtures.py
+    python bench/make_fixtures.py --overwrite-recorded
+"""
+
+import argparse
+import json
+import random
+from pathlib import Path
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+SOURCES_FILE = FIXTURES_DIR / "sources.json"
+POLICY_ID = "2872282653"
+SEED = 108600
+
+# Fixture names record_fixtures.py writes.
+RECORDABLE = ("browse_ssr", "browse_zero_results", "profile_legacy_hover", "profile_zero_results")
+
+WORDS = [
+    "Better", "Extended", "Tactical", "Survivor", "Vehicle", "Farming",
+    "Crafting", "Military", "Rustic", "Expanded", "Simple", "Realistic",
+    "Overhaul", "Pack", "Tweaks", "Furniture", "Weapons", "Clothing",
+    "Map", "Radio", "Generator", "Loot", "Zombie", "Trait", "Skill",
+]
+
+
+def load_sources():
+    """{fixture name: "synthetic" | "recorded"} from fixtures/sources.json."""
+    try:
+        return json.loads(SOURCES_FILE.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+
+
+def mark_sources(names, source):
+    sources = load_sources()
+    sources.update(dict.fromkeys(names, source))
+    FIXTURES_DIR.mkdir(parents=True, exist_ok=True)
+    SOURCES_FILE.write_text(json.dumps(dict(sorted(sources.items())), indent=2) + "\n", encoding="utf-8")
+
+
+def fake_items(rng, count):
+    items = []
+    used = set()
+    while len(items) < count:
+        wid = str(rng.randint(2_000_000_000, 3_400_000_000))
+        if wid in used or wid == POLICY_ID:
+            continue
+        used.add(wid)
+        title = " ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 5)))
+        items.append({
+            "publishedfileid": wid,
+            "title": title,
+            "creator": str(76561190000000000 + rng.randint(0, 9_999_999)),
+            "short_description": f"Anonymized description for {title.lower()}. " * rng.randint(1, 3),
+            "subscriptions": rng.randint(0, 250_000),
+            "time_updated": rng.randint(1_600_000_000, 1_760_000_000),
+        })
+    return items
+
+
+def page_chrome(rng, kb):
+    """Filler shaped like real page chrome: inline script/style noise and
+    nav links, including the header's Modding Policy link."""
+    parts = [
+        '<html><head><title>Steam Workshop :: Project Zomboid</title>',
+        '<style>' + "".join(f".c{rng.randint(0, 1 << 30):x}{{margin:{rng.randint(0, 9)}px}}" for _ in range(kb * 12)) + '</style>',
+        '</head><body><div class="responsive_page_frame">',
+        '<div class="workshop_header">'
+        f'<a href="https://steamcommunity.com/sharedfiles/filedetails/?id={POLICY_ID}">Learn More</a></div>',
+    ]
+    parts.append('<script>var g_rgConfig = ' + json.dumps(
+        {f"k{i}": "x" * rng.randint(8, 40) for i in range(kb * 8)}
+    ) + ';</script>')
+    return "".join(parts)
+
+
+def _chrome_or(chrome, rng, kb):
+    # Callers generating many pages (fake_steam.py) pass pre-built chrome.
+    return chrome if chrome is not None else page_chrome(rng, kb)
+
+
+def ssr_page(rng, items, total_pages, kb, chrome=None):
+    # Real pages hydrate a handful of other queries next to the results
+    # (tag lists, app info, localized strings); include comparable ones.
+    query_data = {"queries": [
+        {"queryKey": ["workshop_tags", "108600"], "state": {"data": [
+            {"tag": f"{a} {b}", "count": n}
+            for n, (a, b) in enumerate(zip(WORDS, reversed(WORDS)))
+        ] * 4}},
+        {"queryKey": ["workshop_browse", "108600"], "state": {"data": {
+            "results": items, "total_pages": total_pages,
+        }}},
+        {"queryKey": ["app_details", "108600"], "state": {"data": {
+            "appid": 108600, "name": "Project Zomboid",
+            "strings": {f"#Workshop_String_{i}": f"Localized text {i} " * 4 for i in range(400)},
+        }}},
+        {"queryKey": ["user_prefs"], "state": {"data": {"language": "english"}}},
+    ]}
+    render_context = {"queryData": json.dumps(query_data), "locale": "english"}
+    # Steam embeds it as JSON.parse("<json string body>"), i.e. the JSON
+    # text is itself JSON-string-escaped once.
+    escaped = json.dumps(json.dumps(render_context))[1:-1]
+    return (_chrome_or(chrome, rng, kb)
+            + f'<script>window.SSR.renderContext=JSON.parse("{escaped}");</script>'
+            + '<div id="application_root"></div></body></html>')
+
+
+def hashed_class_page(rng, items, kb, chrome=None):
+    rows = "".join(
+        f'<div class="_2b1Z9c5gA1Q-"><div class="Sw3NXcvOA4Y-"><a href="https://steamcommunity.com/'
+        f'sharedfiles/filedetails/?id={it["publishedfileid"]}&searchtext=" class="_1hZcRrYV3Zk-">'
+        f'{it["title"]}</a></div><div class="_3hSmB-VPMhs-">by Author</div></div>'
+        for it in items
+    )
+    return _chrome_or(chrome, rng, kb) + f'<div class="_1RhG2oQ3mJk-">{rows}</div></body></html>'
+
+
+def img_alt_page(rng, items, kb, chrome=None):
+    rows = "".join(
+        f'<div class="_9xQ2wTzFh0-"><a href="https://steamcommunity.com/sharedfiles/filedetails/?id='
+        f'{it["publishedfileid"]}"><img src="https://images.example.invalid/{i}.jpg" '
+        f'alt="{it["title"]}"></a></div>'
+        for i, it in enumerate(items)
+    )
+    return _chrome_or(chrome, rng, kb) + f'<div class="_0aB4cDeF-">{rows}</div></body></html>'
+
+
+def legacy_profile_page(rng, items, total_entries, kb, hover=True, chrome=None):
+    blocks = []
+    scripts = []
+    for i, it in enumerate(items):
+        wid = it["publishedfileid"]
+        blocks.append(
+            f'<div class="workshopItem"><a href="https://steamcommunity.com/sharedfiles/filedetails/?id={wid}" '
+            f'class="ugc" data-appid="108600" data-publishedfileid="{wid}">'
+            f'<div id="sharedfile_{wid}" class="workshopItemPreviewHolder"><img class="workshopItemPreviewImage" '
+            f'src="https://images.example.invalid/{i}.jpg"></div></a>'
+            f'<a href="https://steamcommunity.com/sharedfiles/filedetails/?id={wid}">'
+            f'<div class="workshopItemTitle ellipsis">{it["title"]}</div></a></div>'
+        )
+        if hover:
+            scripts.append(
+                f'SharedFileBindMouseHover( "sharedfile_{wid}", false, '
+                + json.dumps({"id": wid, "title": it["title"],
+                              "description": it["short_description"], "appid": 108600})
+                + ' );'
+            )
+    shown = len(items)
+    return (_chrome_or(chrome, rng, kb)
+            + f'<div class="workshopBrowsePagingInfo">Showing 1-{shown} of {total_entries:,} entries</div>'
+            + '<div class="workshopBrowseItems">' + "".join(blocks) + '</div>'
+            + ('<script>' + "\n".join(scripts) + '</script>' if scripts else '')
+            + '</body></html>')
+
+
+def legacy_zero_page(rng, kb, chrome=None):
+    return (_chrome_or(chrome, rng, kb)
+            + '<div class="workshopBrowseItems"><div class="no_items">No items found.</div></div>'
+            + '</body></html>')
+
+
+def build(overwrite_recorded=False):
+    # Every page is built, recorded or not, so each one always draws the
+    # same values from the seeded generator.
+    rng = random.Random(SEED)
+    pages = {
+        "browse_ssr": ssr_page(rng, fake_items(rng, 30), 12, 160),
+        "browse_hashed_class": hashed_class_page(rng, fake_items(rng, 30), 160),
+        "browse_img_alt": img_alt_page(rng, fake_items(rng, 30), 160),
+        "profile_legacy_hover_large": legacy_profile_page(rng, fake_items(rng, 500), 1734, 120),
+        "profile_legacy_blocks_large": legacy_profile_page(rng, fake_items(rng, 500), 1734, 120, hover=False),
+        "browse_zero_results": ssr_page(rng, [], 0, 160),
+        "profile_zero_results": legacy_zero_page(rng, 120),
+        "profile_legacy_hover": legacy_profile_page(rng, fake_items(rng, 30), 30, 120),
+    }
+    sources = load_sources()
+    FIXTURES_DIR.mkdir(parents=True, exist_ok=True)
+    written = []
+    for name, html in pages.items():
+        if sources.get(name) == "recorded" and not overwrite_recorded:
+            print(f"{name}.html: recorded, kept")
+            continue
+        (FIXTURES_DIR / f"{name}.html").write_text(html, encoding="utf-8")
+        written.append(name)
+        print(f"{name}.html: {len(html.encode('utf-8')) / 1024:.0f} KB")
+    mark_sources(written, "synthetic")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the synthetic workshop page fixtures")
+    parser.add_argument("--overwrite-recorded", action="store_true",
+                        help="Also replace recorded fixtures with their synthetic stand-ins")
+    args = parser.parse_args()
+    build(args.overwrite_recorded)
+
+
+if __name__ == "__main__":
+    main()
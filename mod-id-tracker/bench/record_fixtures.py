@@ -0,0 +1,163 @@
+"""
+Record real workshop pages into bench/fixtures/, scrubbed of anything
+tied to a Steam account or session.
+
+Fetches the same URLs server.py does - a "Mod ID:" browse search, a
+search that finds nothing, a creator's myworkshopfiles page and
+optionally an empty one - then runs scrub() over each page before
+writing it:
+
+- every SteamID64 is remapped, consistently within a page, into the
+  76561190000000000 placeholder range, and data-miniprofile account IDs
+  to small sequential numbers
+- persona names (SSR JSON, profile header and page title) become
+  "Author N"; a vanity profile name becomes "bench_profile"
+- g_sessionID and the Web API / loyalty tokens are zeroed, avatar URLs
+  point at images.example.invalid
+
+Workshop IDs, titles and descriptions are public listing data and are
+kept - they're what the parsers actually work on. Scrubbing is pattern
+based, so look over a new recording before committing it.
+
+After writing each page the recorder parses it with server.py and prints
+the parser path and item count, so a layout change on Steam's side shows
+up right here. Each recording is marked "recorded" in fixtures/sources.json, and
+make_fixtures.py leaves it alone from then on. Re-run bench_parsers.py
+--update-baseline afterwards.
+
+Usage:
+    python bench/record_fixtures.py --mod-id Hydrocraft --profile 76561198000000000
+    python bench/record_fixtures.py --mod-id Hydrocraft --profile someone --empty-profile 76561198000000001
+
+The layouts Steam no longer serves live (the fallback parsers) and the
+oversized profile pages (profile_legacy_*_large) are still generated by
+make_fixtures.py, as are synthetic stand-ins for anything not recorded
+yet.
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import re
+import sys
+import tempfile
+import time
+import urllib.parse
+import urllib.request
+from pathlib import Path
+
+import make_fixtures
+
+BENCH_DIR = Path(__file__).resolve().parent
+FIXTURES_DIR = make_fixtures.FIXTURES_DIR
+APP_ID = "108600"
+STEAM_COMMUNITY_URL = os.environ.get("PZ_STEAM_COMMUNITY_URL", "https://steamcommunity.com").rstrip("/")
+FAKE_STEAMID_BASE = 76561190000000000
+ZERO_RESULTS_QUERY = "zzqx no such mod 0000"
+
+STEAMID_RE = re.compile(r'(?<!\d)7656119\d{10}(?!\d)')
+MINIPROFILE_RE = re.compile(r'(data-miniprofile=\\?")(\d+)')
+SESSION_RE = re.compile(r'(g_sessionID\s*=\s*")[^"]*(")')
+TOKEN_RE = re.compile(
+    r'((?:\\?"|&quot;)(?:webapi_token|loyalty_webapi_token|access_token|token)(?:\\?"|&quot;)\s*:\s*(?:\\?"|&quot;))'
+    r'[^"\\&]*'
+)
+TOKEN_ATTR_RE = re.compile(r'(data-[\w-]*token=")[^"]*(")')
+PERSONA_JSON_RE = re.compile(r'((?:\\?")(?:persona_name|personaname|strName)(?:\\?")\s*:\s*(?:\\?"))(.*?)(\\?")')
+PERSONA_HTML_RE = re.compile(r'(class="(?:actual_persona_name|persona_name_text_content|workshopItemAuthorName[^"]*)"[^>]*>)([^<]*)(<)')
+TITLE_RE = re.compile(r'(<title>Steam Community :: )(.*?)( :: )')
+AVATAR_RE = re.compile(r'https://avatars\.[a-z.]*steamstatic\.com/[0-9a-f]+(?:_\w+)?\.jpg')
+
+
+def scrub(html, vanity=None):
+    """Return html with account/session-specific data replaced; see module docstring."""
+    steam_ids = {}
+    html = STEAMID_RE.sub(
+        lambda m: steam_ids.setdefault(m.group(0), str(FAKE_STEAMID_BASE + len(steam_ids))), html)
+    accounts = {}
+    html = MINIPROFILE_RE.sub(
+        lambda m: m.group(1) + accounts.setdefault(m.group(2), str(len(accounts) + 1)), html)
+    html = SESSION_RE.sub(lambda m: m.group(1) + "0" * 24 + m.group(2), html)
+    html = TOKEN_RE.sub(lambda m: m.group(1) + "0" * 32, html)
+    html = TOKEN_ATTR_RE.sub(lambda m: m.group(1) + "0" * 32 + m.group(2), html)
+
+    personas = {}
+    def author(name):
+        return personas.setdefault(name, f"Author {len(personas) + 1}")
+    html = PERSONA_JSON_RE.sub(lambda m: m.group(1) + author(m.group(2)) + m.group(3), html)
+    html = PERSONA_HTML_RE.sub(
+        lambda m: m.group(1) + (author(m.group(2).strip()) if m.group(2).strip() else m.group(2)) + m.group(3), html)
+    html = TITLE_RE.sub(lambda m: m.group(1) + author(m.group(2)) + m.group(3), html)
+
+    html = AVATAR_RE.sub("https://images.example.invalid/avatar.jpg", html)
+    if vanity and not vanity.isdigit():
+        html = re.sub(rf'(?<![\w-]){re.escape(vanity)}(?![\w-])', "bench_profile", html)
+    print(f"  scrubbed {len(steam_ids)} steam ID(s), {len(accounts)} account ID(s), {len(personas)} persona name(s)")
+    return html
+
+
+def profile_url(profile, page=1):
+    kind = "profiles" if profile.isdigit() else "id"
+    return (f"{STEAM_COMMUNITY_URL}/{kind}/{urllib.parse.quote(profile)}/myworkshopfiles/"
+            f"?appid={APP_ID}&p={page}&numperpage=30")
+
+
+def browse_url(searchtext):
+    return (f"{STEAM_COMMUNITY_URL}/workshop/browse/?appid={APP_ID}"
+            f"&searchtext={urllib.parse.quote_plus(searchtext)}"
+            f"&browsesort=mostrecent&section=readytouseitems&actualsort=mostrecent&p=1")
+
+
+def fetch(url):
+    req = urllib.request.Request(url, headers={
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                      "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Accept-Language": "en-US,en;q=0.9",
+    })
+    with urllib.request.urlopen(req, timeout=30) as resp:
+        return resp.read().decode("utf-8", errors="replace")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record scrubbed workshop pages as parser benchmark fixtures")
+    parser.add_argument("--mod-id", required=True, help='Mod ID to run a "Mod ID:" search for')
+    parser.add_argument("--profile", required=True, help="SteamID64 or vanity name of a creator with workshop items")
+    parser.add_argument("--empty-profile", help="Profile with no Project Zomboid items (for profile_zero_results)")
+    parser.add_argument("--delay", type=float, default=5.0, help="Seconds between requests (default 5)")
+    args = parser.parse_args()
+
+    recordings = [
+        ("browse_ssr", browse_url(f'"Mod ID: {args.mod_id}"'), None),
+        ("browse_zero_results", browse_url(ZERO_RESULTS_QUERY), None),
+        ("profile_legacy_hover", profile_url(args.profile), args.profile),
+    ]
+    if args.empty_profile:
+        recordings.append(("profile_zero_results", profile_url(args.empty_profile), args.empty_profile))
+
+    sys.path.insert(0, str(BENCH_DIR.parent))
+    data_dir = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+    os.environ["PZ_TRACKER_DATA_DIR"] = data_dir.name
+    with contextlib.redirect_stdout(io.StringIO()):
+        import server
+
+    FIXTURES_DIR.mkdir(parents=True, exist_ok=True)
+    for i, (name, url, vanity) in enumerate(recordings):
+        if i:
+            time.sleep(args.delay)
+        print(f"{name}: {url}")
+        html = scrub(fetch(url), vanity)
+        (FIXTURES_DIR / f"{name}.html").write_text(html, encoding="utf-8")
+        make_fixtures.mark_sources([name], "recorded")
+        page_type = name.split("_", 1)[0]
+        server._preferred_parse_template.clear()
+        with contextlib.redirect_stdout(io.StringIO()):
+            items, total_pages, path = server._parse_workshop_items(html, page_type)
+        print(f"  {len(html.encode('utf-8')) / 1024:.0f} KB, parsed via {path}: "
+              f"{len(items)} item(s), total pages {total_pages}")
+    print("\nRe-record the baseline: python bench/bench_parsers.py --update-baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -61,7 +61,9 @@ python -m PyInstaller ^
   --distpath ".." ^
   --add-data "public;public" ^
   --add-data "verify;verify" ^
+  --paths verify ^
   --hidden-import=winreg ^
+  --hidden-import=verify_dmca ^
   "%ENTRY%"
 
 if errorlevel 1 (
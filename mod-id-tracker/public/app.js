@@ -389,7 +389,7 @@ const TaskQueue = {
     verifyDmcaBtn?.click();
   },
   
-  // Recheck filed items
+  // Recheck filed items - one batched server call instead of one per entry
   async executeRecheckFiled(params) {
     const filedEntries = dmcaEntries.filter(e => e.filedDate && !e.takenDownDate);
     
@@ -399,30 +399,16 @@ const TaskQueue = {
     }
     
     setStatus(`[Queue] Re-checking ${filedEntries.length} filed entries...`);
+    this.updateUI();
+    
+    const results = await checkWorkshopExistsBatch(filedEntries.map(e => e.workshopId));
     let takenDownCount = 0;
     
-    for (let i = 0; i < filedEntries.length; i++) {
-      if (this.isPaused) {
-        setStatus(`[Queue] Paused. ${filedEntries.length - i} re-checks remaining.`);
-        return;
-      }
-      
-      const entry = filedEntries[i];
-      setStatus(`[Queue] Checking ${i + 1}/${filedEntries.length}: ${entry.title}...`);
-      this.updateUI();
-      
-      try {
-        const resp = await SteamRateLimiter.fetchWithRateLimit(
-          `/api/check-workshop-exists?workshopId=${entry.workshopId}`
-        );
-        const data = await resp.json();
-        
-        if (!data.exists) {
-          entry.takenDownDate = new Date().toISOString();
-          takenDownCount++;
-        }
-      } catch (err) {
-        console.error(`Failed to check ${entry.workshopId}:`, err);
+    for (const entry of filedEntries) {
+      const data = results[entry.workshopId];
+      if (data && data.exists === false) {
+        entry.takenDownDate = new Date().toISOString();
+        takenDownCount++;
       }
     }
     
@@ -603,6 +589,41 @@ const TaskQueue = {
   }
 };
 
+// ============================================================================
+// SERVER EVENTS
+// One shared EventSource on /api/events for pushed progress updates
+// ============================================================================
+const ServerEvents = {
+  source: null,
+  
+  // Open the stream on first use. EventSource reconnects on its own and
+  // resends Last-Event-ID, so the server replays anything we missed.
+  connect() {
+    if (!this.source && typeof EventSource !== 'undefined') {
+      this.source = new EventSource('/api/events');
+    }
+    return this.source;
+  },
+  
+  // Subscribe to one event type. Returns an unsubscribe function.
+  on(type, callback) {
+    const source = this.connect();
+    if (!source) return () => {};
+    
+    const handler = (e) => {
+      let data = {};
+      try {
+        data = JSON.parse(e.data);
+      } catch (err) {
+        console.warn(`[ServerEvents] Bad ${type} payload:`, e.data);
+      }
+      callback(data, e);
+    };
+    source.addEventListener(type, handler);
+    return () => source.removeEventListener(type, handler);
+  }
+};
+
 // ============================================================================
 // STEAM RATE LIMITER
 // Enforces delays between requests and handles rate limit retries
@@ -1455,9 +1476,27 @@ function setStatus(msg) {
 }
 
 async function fetchAllForModId(modId, maxPages) {
-  const resp = await SteamRateLimiter.fetchWithRateLimit(
-    `/api/modid-search-all?modId=${encodeURIComponent(modId)}&maxPages=${encodeURIComponent(maxPages)}`
-  );
+  // Live page/wait progress while the (long) search request is open
+  const unsubscribe = [
+    ServerEvents.on('search_page', data => {
+      if (data.modId === modId) {
+        setStatus(`Searching "${modId}": page ${data.page}${data.totalPages ? `/${data.totalPages}` : ''}${data.cached ? ' (cached)' : ''}...`);
+      }
+    }),
+    ServerEvents.on('ratelimit_wait', data => {
+      if (data.owner && data.owner !== `search:${modId}`) return;
+      const queue = data.ahead ? ` (${data.ahead} request${data.ahead === 1 ? '' : 's'} ahead)` : '';
+      setStatus(`Searching "${modId}": waiting ${data.seconds}s for Steam rate limit${queue}...`);
+    })
+  ];
+  let resp;
+  try {
+    resp = await SteamRateLimiter.fetchWithRateLimit(
+      `/api/modid-search-all?modId=${encodeURIComponent(modId)}&maxPages=${encodeURIComponent(maxPages)}`
+    );
+  } finally {
+    unsubscribe.forEach(off => off());
+  }
   const text = await resp.text();
   let data;
   try {
@@ -1469,6 +1508,21 @@ async function fetchAllForModId(modId, maxPages) {
   return data;
 }
 
+// Check many workshop items in one request. Returns { workshopId: result }.
+async function checkWorkshopExistsBatch(workshopIds) {
+  const resp = await SteamRateLimiter.fetchWithRateLimit('/api/check-workshop-exists/batch', {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ workshopIds })
+  });
+  const data = await resp.json().catch(() => ({}));
+  if (!resp.ok) throw new Error(data?.error || `Request failed: ${resp.status}`);
+
+  const byId = {};
+  (data.results || []).forEach(r => { byId[r.workshopId] = r; });
+  return byId;
+}
+
 function getApprovedSet(mod) {
   const approved = new Set();
   const approvedStr = typeof mod.approved === 'string' ? mod.approved : '';
@@ -2197,8 +2251,19 @@ function renderDmcaManager() {
           badgeClass = 'low';
           badgeText = `${pct}% LOW`;
         }
-        const filesInfo = v.totalFiles > 0 ? `${v.matchedFiles}/${v.totalFiles} files matched` : '';
-        verificationBadgeHtml = `<span class="verification-badge ${badgeClass}" title="${filesInfo}">${badgeText}</span>`;
+        let filesInfo = v.totalFiles > 0 ? `${v.matchedFiles}/${v.totalFiles} files matched` : '';
+        // MinHash layout similarity - catches reuploads that touched every file
+        if (typeof v.similarity === 'number') {
+          filesInfo += `${filesInfo ? '\n' : ''}~${v.similarity}% layout similarity`;
+        }
+        if (typeof v.chunkOverlap === 'number') {
+          filesInfo += `${filesInfo ? '\n' : ''}${v.chunkOverlap}% chunk overlap`;
+        }
+        const similarIds = v.similarityCandidates ? Object.keys(v.similarityCandidates) : [];
+        if (similarIds.length > 0) {
+          filesInfo += `\nSimilar to: ${similarIds.map(id => `${id} (~${v.similarityCandidates[id]}%)`).join(', ')}`;
+        }
+        verificationBadgeHtml = `<span class="verification-badge ${badgeClass}" title="${escapeHtml(filesInfo)}">${badgeText}</span>`;
       }
     }
 
@@ -2232,7 +2297,9 @@ function renderDmcaManager() {
 
             badgeHtml = `<span class="verification-badge ${cls}" title="${matched}/${total} files matched for this mod">${pct}%</span>`;
 
-            detailsHtml = `<div class="mod-match-details">${matched}/${total} files</div>`;
+            const similarity = typeof r.similarity === 'number' ? ` · ~${r.similarity}% similar` : '';
+            const chunks = typeof r.chunkOverlap === 'number' ? ` · ${r.chunkOverlap}% chunks` : '';
+            detailsHtml = `<div class="mod-match-details">${matched}/${total} files${chunks}${similarity}</div>`;
           } else {
             badgeHtml = `<span class="verification-badge none" title="No per-mod data returned">N/A</span>`;
           }
@@ -2258,6 +2325,38 @@ function renderDmcaManager() {
       `;
     }
 
+    // Tracked mods this entry wasn't tagged with but shares files with
+    let untaggedHtml = '';
+    const untagged = entry.verification && entry.verification.untaggedMatches;
+    const untaggedIds = untagged ? Object.keys(untagged) : [];
+    if (untaggedIds.length > 0) {
+      const rows = untaggedIds.map(id => {
+        const r = untagged[id];
+        const pct = typeof r.matchPercentage === 'number' ? r.matchPercentage : 0;
+        let cls = 'none';
+        if (pct >= 75) cls = 'high';
+        else if (pct >= 50) cls = 'medium';
+        else if (pct >= 25) cls = 'low';
+        return `<div class="tracked-mod-row">
+          <span class="tracked-mod-id">${escapeHtml(id)}</span>
+          <span class="verification-badge ${cls}" title="${r.matchedFiles}/${r.totalFiles} files matched for this mod">${pct}%</span>
+          <div class="mod-match-details">${r.matchedFiles}/${r.totalFiles} files${typeof r.chunkOverlap === 'number' ? ` · ${r.chunkOverlap}% chunks` : ''}${typeof r.similarity === 'number' ? ` · ~${r.similarity}% similar` : ''}</div>
+        </div>`;
+      }).join('');
+
+      untaggedHtml = `
+        <div class="dmca-tracked-mods collapsed" data-workshopid="${escapeHtml(entry.workshopId)}">
+          <div class="tracked-mods-toggle">
+            <span class="toggle-icon">▶</span>
+            <span class="toggle-label">Also matches ${untaggedIds.length} untagged tracked mod${untaggedIds.length > 1 ? 's' : ''}</span>
+          </div>
+          <div class="tracked-mods-list">
+            ${rows}
+          </div>
+        </div>
+      `;
+    }
+
     let actionsHtml = '';
     if (isTakenDown) {
       actionsHtml = `
@@ -2293,6 +2392,7 @@ function renderDmcaManager() {
             ${actionsHtml}
           </div>
           ${trackedModsHtml}
+          ${untaggedHtml}
           ${statusDateHtml}
         </div>
       </div>
@@ -2488,45 +2588,35 @@ async function recheckFiledItems() {
   }
 
   setStatus(`Re-checking ${filedEntries.length} filed item(s)...`);
-  SteamRateLimiter.reset(); // Reset rate limiter for fresh batch
 
   let checkedCount = 0;
   let takenDownCount = 0;
   let stillActiveCount = 0;
   let errorCount = 0;
 
-  for (let i = 0; i < filedEntries.length; i++) {
-    const entry = filedEntries[i];
-    setStatus(`Checking ${i + 1}/${filedEntries.length}: ${entry.title}...`);
+  try {
+    const results = await checkWorkshopExistsBatch(filedEntries.map(e => e.workshopId));
 
-    try {
-      const resp = await SteamRateLimiter.fetchWithRateLimit(
-        `/api/check-workshop-exists?workshopId=${entry.workshopId}`
-      );
+    for (const entry of filedEntries) {
+      const data = results[entry.workshopId];
 
-      const data = await resp.json();
+      if (!data || data.error) {
+        errorCount++;
+        continue;
+      }
 
       if (data.exists === false) {
         entry.takenDownDate = new Date().toISOString();
         takenDownCount++;
-      } else if (data.exists === true) {
-        stillActiveCount++;
       } else {
-        errorCount++;
+        stillActiveCount++;
       }
 
       checkedCount++;
-
-    } catch (err) {
-      console.error(`Error checking ${entry.workshopId}:`, err);
-      errorCount++;
-      
-      // If it's a rate limit error that exceeded retries, stop the batch
-      if (err.message && err.message.includes('rate limit')) {
-        setStatus(`Stopped due to rate limiting. Checked ${checkedCount} items before stopping.`);
-        break;
-      }
     }
+  } catch (err) {
+    console.error('Error re-checking filed items:', err);
+    errorCount = filedEntries.length;
   }
 
   saveDmcaEntries();
@@ -2784,16 +2874,14 @@ recheckFiledBtn.addEventListener("click", () => {
     return;
   }
   
-  // Add individual recheck tasks for each filed entry
-  const tasks = filedEntries.map(entry => ({
-    type: TaskQueue.TYPES.RECHECK_SINGLE,
-    params: { entry },
-    description: `Re-check: ${entry.title}`
-  }));
-  
-  const addedCount = TaskQueue.addBatch(tasks);
-  if (addedCount > 0) {
-    setStatus(`[Queued] ${addedCount} re-check task(s)`);
+  // One task for the whole batch - the server checks them in chunked calls
+  const added = TaskQueue.add(
+    TaskQueue.TYPES.RECHECK_FILED,
+    {},
+    `Re-check ${filedEntries.length} filed item(s)`
+  );
+  if (added) {
+    setStatus(`[Queued] Re-check of ${filedEntries.length} filed item(s)`);
   }
 });
 
@@ -2952,86 +3040,157 @@ async function apiPost(url, body) {
   return data;
 }
 
+// Apply a finished /api/verify/status response: merge results, show summary
+function applyVerifyResults(status) {
+  setVerifyBtnRunning(false);
+
+  if (status.results && status.results.entries) {
+    const verifiedEntries = status.results.entries;
+
+    console.log("Got verified entries:", verifiedEntries.length);
+
+    // IMPORTANT: Merge verification results back into dmcaEntries
+    verifiedEntries.forEach(verifiedEntry => {
+      const localEntry = dmcaEntries.find(e => e.workshopId === verifiedEntry.workshopId);
+      if (localEntry && verifiedEntry.verification) {
+        localEntry.verification = verifiedEntry.verification;
+      }
+    });
+
+    // Save updated entries
+    saveDmcaEntries();
+    renderDmcaManager();
+    updateDmcaCounts();
+
+    // Show summary
+    const summary = status.results.summary || {};
+    const totalVerified = (summary.high || 0) + (summary.medium || 0) + (summary.low || 0) + (summary.none || 0) + (summary.takenDown || 0);
+    setStatus(`Verification complete - ${totalVerified} item(s) checked`);
+    showAlert(
+      'Verification Complete',
+      `High Match (75%+): ${summary.high || 0}\n` +
+      `Medium (50-74%): ${summary.medium || 0}\n` +
+      `Low (25-49%): ${summary.low || 0}\n` +
+      `No Match (<25%): ${summary.none || 0}\n` +
+      `Taken Down: ${summary.takenDown || 0}`,
+      'success'
+    );
+  } else if (status.error && status.error.message) {
+    setStatus('Verification error');
+    showAlert('Verification Error', status.error.message, 'error');
+  } else {
+    console.error("No results in status:", status);
+    setStatus('Verification error - no results');
+    showAlert('Verification Error', 'Verifier returned no results', 'error');
+  }
+}
+
+// Show a verification progress event ({ type, payload }) in the status bar
+function showVerifyProgress(progress) {
+  if (!progress || !progress.payload) return;
+  const p = progress.payload;
+  const eventType = progress.type;
+
+  if (eventType === "download" && p.current && p.total) {
+    setStatus(`Downloading manifests: ${p.current}/${p.total} - ${p.name || ''}`);
+  } else if (eventType === "read_manifest" && p.current && p.total) {
+    setStatus(`Reading manifests: ${p.current}/${p.total} - ${p.name || ''}`);
+  } else if (eventType === "verify_item" && p.current && p.total) {
+    setStatus(`Comparing files: ${p.current}/${p.total} - ${p.title || ''}`);
+  } else if (p.current && p.total) {
+    setStatus(`Processing: ${p.current}/${p.total}...`);
+  } else if (p.message) {
+    setStatus(p.message);
+  }
+}
+
+function verifyTimedOut() {
+  setVerifyBtnRunning(false);
+  showAlert('Verification Timeout', 'Verification took too long. Please try again.', 'error');
+  setStatus('Verification timed out');
+}
+
+// Wait for the running verification to finish. Progress is pushed over
+// /api/events; /api/verify/status is only fetched once at the end (and on
+// a resync). Falls back to polling where EventSource isn't available.
 async function pollVerifyStatus() {
+  if (typeof EventSource === 'undefined') {
+    return pollVerifyStatusLoop();
+  }
+
+  const maxWaitTime = 10 * 60 * 1000; // 10 minute timeout
+
+  return new Promise(resolve => {
+    let finished = false;
+    const unsubscribe = [];
+
+    const finish = (status) => {
+      if (finished) return;
+      finished = true;
+      unsubscribe.forEach(off => off());
+      clearTimeout(timeoutId);
+      if (status) {
+        applyVerifyResults(status);
+      } else {
+        verifyTimedOut();
+      }
+      resolve();
+    };
+
+    const checkStatus = async () => {
+      try {
+        const status = await apiGet("/api/verify/status");
+        if (!status.running) finish(status);
+        else showVerifyProgress(status.progress);
+      } catch (err) {
+        console.error("Status check error:", err);
+      }
+    };
+
+    const timeoutId = setTimeout(() => finish(null), maxWaitTime);
+
+    unsubscribe.push(ServerEvents.on('verify_progress', data => {
+      showVerifyProgress(data);
+      if (data.done) checkStatus();
+    }));
+    // Apply each entry's result as soon as the verifier finishes it
+    unsubscribe.push(ServerEvents.on('verify_item_done', data => {
+      const localEntry = dmcaEntries.find(e => e.workshopId === data.workshopId);
+      if (localEntry && data.verification) {
+        localEntry.verification = data.verification;
+        saveDmcaEntries();
+        renderDmcaManager();
+        updateDmcaCounts();
+      }
+    }));
+    // Missed events (reconnect gap or server restart) - re-read full state
+    unsubscribe.push(ServerEvents.on('resync', checkStatus));
+
+    // Verification may already be done by the time we subscribed
+    checkStatus();
+  });
+}
+
+async function pollVerifyStatusLoop() {
   const startTime = Date.now();
   const maxWaitTime = 10 * 60 * 1000; // 10 minute timeout
   
   while (true) {
     // Check for timeout
     if (Date.now() - startTime > maxWaitTime) {
-      setVerifyBtnRunning(false);
-      showAlert('Verification Timeout', 'Verification took too long. Please try again.', 'error');
-      setStatus('Verification timed out');
+      verifyTimedOut();
       return;
     }
     
     try {
       const status = await apiGet("/api/verify/status");
 
-      console.log("Poll status:", status);
-
       if (!status.running) {
-        setVerifyBtnRunning(false);
-
-        if (status.results && status.results.entries) {
-          const verifiedEntries = status.results.entries;
-
-          console.log("Got verified entries:", verifiedEntries.length);
-
-          // IMPORTANT: Merge verification results back into dmcaEntries
-          verifiedEntries.forEach(verifiedEntry => {
-            const localEntry = dmcaEntries.find(e => e.workshopId === verifiedEntry.workshopId);
-            if (localEntry && verifiedEntry.verification) {
-              localEntry.verification = verifiedEntry.verification;
-            }
-          });
-
-          // Save updated entries
-          saveDmcaEntries();
-          renderDmcaManager();
-          updateDmcaCounts();
-
-          // Show summary
-          const summary = status.results.summary || {};
-          const totalVerified = (summary.high || 0) + (summary.medium || 0) + (summary.low || 0) + (summary.none || 0) + (summary.takenDown || 0);
-          setStatus(`Verification complete - ${totalVerified} item(s) checked`);
-          showAlert(
-            'Verification Complete',
-            `High Match (75%+): ${summary.high || 0}\n` +
-            `Medium (50-74%): ${summary.medium || 0}\n` +
-            `Low (25-49%): ${summary.low || 0}\n` +
-            `No Match (<25%): ${summary.none || 0}\n` +
-            `Taken Down: ${summary.takenDown || 0}`,
-            'success'
-          );
-        } else if (status.error && status.error.message) {
-          setStatus('Verification error');
-          showAlert('Verification Error', status.error.message, 'error');
-        } else {
-          console.error("No results in status:", status);
-          setStatus('Verification error - no results');
-          showAlert('Verification Error', 'Verifier returned no results', 'error');
-        }
+        applyVerifyResults(status);
         return;
       }
 
-      // Handle different progress event types
-      if (status.progress && status.progress.payload) {
-        const p = status.progress.payload;
-        const eventType = status.progress.type;
-
-        if (eventType === "download" && p.current && p.total) {
-          setStatus(`Downloading manifests: ${p.current}/${p.total} - ${p.name || ''}`);
-        } else if (eventType === "read_manifest" && p.current && p.total) {
-          setStatus(`Reading manifests: ${p.current}/${p.total} - ${p.name || ''}`);
-        } else if (eventType === "verify_item" && p.current && p.total) {
-          setStatus(`Comparing files: ${p.current}/${p.total} - ${p.title || ''}`);
-        } else if (p.current && p.total) {
-          setStatus(`Processing: ${p.current}/${p.total}...`);
-        } else if (p.message) {
-          setStatus(p.message);
-        }
-      }
+      showVerifyProgress(status.progress);
     } catch (err) {
       console.error("Poll error:", err);
       // Don't fail immediately on network errors, keep trying
@@ -3042,7 +3201,10 @@ async function pollVerifyStatus() {
 }
 
 if (verifyDmcaBtn) {
-  verifyDmcaBtn.addEventListener("click", async () => {
+  verifyDmcaBtn.addEventListener("click", async (e) => {
+    // Entries whose manifests haven't changed reuse their last result;
+    // shift-click re-verifies everything
+    const force = !!(e && e.shiftKey);
     const trackedMods = loadTrackedModsForVerify();
     const entries = loadDmcaEntriesForVerify();
 
@@ -3062,11 +3224,12 @@ if (verifyDmcaBtn) {
 
     try {
       setVerifyBtnRunning(true);
-      setStatus("Starting verification...");
+      setStatus(force ? "Starting full re-verification..." : "Starting verification...");
 
       await apiPost("/api/verify/start", {
         trackedMods,
         entries,
+        force,
       });
 
       await pollVerifyStatus();
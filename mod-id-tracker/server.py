@@ -5,106 +5,398 @@ import re
 import json
 import time
 import urllib.parse
-import urllib.request
-import urllib.error
+import http.client
+import ssl
+import gzip
+import zlib
 import platform
-import subprocess
 import shutil
+import sqlite3
+import select
+import socket
+import email.utils
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from socketserver import ThreadingMixIn
-from threading import Thread, Lock
-from collections import deque
+from threading import Thread, Lock, Event, Condition
+from collections import deque, namedtuple, OrderedDict
+
+# ============================================================================
+# SERVER EVENTS
+# In-memory event log pushed to the UI over Server-Sent Events (/api/events)
+# ============================================================================
+class ServerEventBus:
+    """
+    Typed progress events (search pages, rate-limiter waits, verification
+    items, job completion) with increasing integer IDs. The last `history`
+    events are kept so an EventSource that reconnects with Last-Event-ID
+    gets exactly what it missed. If it missed more than that (or the
+    server restarted and IDs went back to 1), it gets a "resync" event
+    telling it to re-fetch full state instead.
+    """
+
+    def __init__(self, history=500):
+        self.cond = Condition()
+        self.events = deque(maxlen=history)
+        self.next_id = 1
+
+    def publish(self, event_type: str, data: dict = None):
+        with self.cond:
+            self.events.append({
+                "id": self.next_id,
+                "type": event_type,
+                "data": dict(data or {}, time=time.time()),
+            })
+            self.next_id += 1
+            self.cond.notify_all()
+
+    def wait_for_events(self, last_id: int, timeout: float):
+        """Block until there are events after last_id (or timeout).
+
+        Returns (events, resync) - resync is True when last_id can't be
+        resumed from and the caller should start over from the newest event.
+        """
+        with self.cond:
+            if last_id >= self.next_id or (self.events and last_id < self.events[0]["id"] - 1):
+                return [], True
+            if self.next_id - 1 <= last_id:
+                self.cond.wait(timeout)
+            return [e for e in self.events if e["id"] > last_id], False
+
+    def latest_id(self):
+        with self.cond:
+            return self.next_id - 1
+
+server_events = ServerEventBus()
 
 # ============================================================================
 # STEAM RATE LIMITER
-# Dynamically throttles requests to stay under Steam's rate limits
+# Adaptive per-endpoint token buckets whose learned state survives restarts
 # ============================================================================
+def _parse_retry_after(value):
+    """Seconds to wait per a Retry-After header (delta-seconds or an HTTP
+    date), or None if it's missing or unparseable."""
+    if not value:
+        return None
+    value = str(value).strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None:
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, when.timestamp() - time.time())
+
+
+class RateLimitStateStore:
+    """
+    Small JSON file holding every limiter's learned rate and penalty window,
+    keyed by limiter name, so a restart doesn't forget that Steam pushed
+    back a minute ago. Writes are atomic; a missing/corrupt file just
+    means starting from the configured defaults.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.lock = Lock()
+        self.state = {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self.state = data
+        except (OSError, ValueError):
+            pass
+
+    def get(self, name: str):
+        with self.lock:
+            return dict(self.state.get(name) or {})
+
+    def put(self, name: str, state: dict):
+        with self.lock:
+            self.state[name] = state
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self.path.with_suffix(".json.tmp")
+                with open(tmp, "w", encoding="utf-8") as f:
+                    json.dump(self.state, f)
+                os.replace(tmp, self.path)
+            except OSError as e:
+                print(f"[RateLimiter] Failed to persist state: {e}")
+
+
+class RateLimitCancelled(Exception):
+    """The reservation was cancelled before its send time came up."""
+
+
+class RateLimitReservation:
+    """One booked request slot. send_at is reassigned whenever the limiter
+    reschedules (a penalty, or a cancellation ahead of it)."""
+
+    def __init__(self, limiter_name: str, owner: str = None):
+        self.id = f"rl_{int(time.time() * 1000)}_{os.urandom(3).hex()}"
+        self.limiter = limiter_name
+        self.owner = owner
+        self.created = time.time()
+        self.send_at = self.created
+        self.state = "waiting"  # -> "sent" / "cancelled"
+
+
 class SteamRateLimiter:
     """
-    Rate limiter that tracks requests per minute and enforces delays.
-    Steam's rate limits are not publicly documented, but appear to be:
-    - ~10-15 requests per minute for workshop searches
-    - Stricter limits during peak hours or if recently rate-limited
+    Adaptive token bucket for one class of Steam endpoint.
+
+    Steam's limits are not publicly documented and differ a lot between
+    HTML scraping of steamcommunity.com and the api.steampowered.com Web
+    API, so each gets its own bucket and learns its own rate:
+    - Requests are spaced at `rate` requests/minute, with up to `burst`
+      allowed back to back after an idle spell.
+    - AIMD: every success adds increase_rpm (up to max_rpm, and not within
+      cooldown_seconds of the last rate limit); every 403/429 halves the
+      rate (down to min_rpm).
+    - A 403/429 also opens a penalty window - Retry-After if Steam sent
+      one, else penalty_seconds - during which nothing is sent.
+    A rate limit (and its penalty window) is saved to the state store
+    straight away; the slow additive increases are saved at most every
+    PERSIST_INTERVAL_SECONDS, with flush() writing out the last one at
+    shutdown.
+
+    Waiting is reservation based: reserve() books the caller's place in
+    line and a send time under the lock; wait() then sleeps on a
+    condition, lock released, until that time comes up. Reservations can
+    be inspected (ETA, how many are ahead) and cancelled - the slots of
+    cancelled ones go to whoever is next instead of being spent.
     """
-    
-    def __init__(self, max_requests_per_minute=10, min_delay_seconds=4.0):
-        self.max_rpm = max_requests_per_minute
-        self.min_delay = min_delay_seconds
-        self.request_times = deque(maxlen=100)  # Track last 100 requests
+
+    # How often a waiter checks its should_cancel callback.
+    CANCEL_POLL_SECONDS = 1.0
+    # Minimum spacing of state-file writes for rate increases.
+    PERSIST_INTERVAL_SECONDS = 30.0
+
+    def __init__(self, name, rpm=10, min_rpm=2, max_rpm=20, burst=1, increase_rpm=0.25,
+                 penalty_seconds=60, cooldown_seconds=300, store: RateLimitStateStore = None):
+        self.name = name
+        self.min_rpm = min_rpm
+        self.max_rpm = max(max_rpm, min_rpm)
+        self.burst = max(1, burst)
+        self.increase_rpm = increase_rpm
+        self.penalty_seconds = penalty_seconds
+        self.cooldown_seconds = cooldown_seconds
+        self.store = store
         self.lock = Lock()
-        self.backoff_multiplier = 1.0
-        self.last_rate_limit_time = 0
-        
-    def wait_if_needed(self):
-        """Wait if necessary to stay under rate limits"""
+        self.cond = Condition(self.lock)
+        self.pending = []  # RateLimitReservation, in booking order
+        self.last_persist = 0.0
+        self.persist_due = False
+
+        self.rate = min(max(rpm, self.min_rpm), self.max_rpm)
+        self.penalty_until = 0.0
+        self.last_rate_limit_time = 0.0
+        saved = store.get(name) if store else {}
+        if saved:
+            try:
+                self.rate = min(max(float(saved.get("rate", self.rate)), self.min_rpm), self.max_rpm)
+                self.penalty_until = float(saved.get("penaltyUntil", 0))
+                self.last_rate_limit_time = float(saved.get("lastRateLimitTime", 0))
+            except (TypeError, ValueError):
+                pass
+            if self.penalty_until > time.time():
+                print(f"[RateLimiter] {name}: resuming penalty window, "
+                      f"{self.penalty_until - time.time():.0f}s left (rate {self.rate:.1f}/min)")
+        # "Theoretical arrival time" of the next request given the ones
+        # already sent (GCRA, the scheduling form of a token bucket): a
+        # request may go at tat - (burst - 1) * interval. 0 = bucket full.
+        self.tat = 0.0
+        if self.penalty_until > time.time():
+            self.tat = self.penalty_until + self._tolerance()
+
+    def _interval(self):
+        return 60.0 / self.rate
+
+    def _tolerance(self):
+        return (self.burst - 1) * self._interval()
+
+    def _reschedule(self, now):
+        """Give every pending reservation a send time, in booking order,
+        following on from the requests already sent. Call with the lock held."""
+        interval = self._interval()
+        tolerance = self._tolerance()
+        tat = self.tat
+        for reservation in self.pending:
+            send_at = max(now, tat - tolerance, self.penalty_until)
+            reservation.send_at = send_at
+            tat = max(tat, send_at) + interval
+
+    def _persist(self, force=False):
+        """Save the learned state. Call with self.lock held. Unless forced,
+        a write within PERSIST_INTERVAL_SECONDS of the last one is only
+        marked due and left for a later call or flush()."""
+        if not self.store:
+            return
+        now = time.time()
+        if not force and now - self.last_persist < self.PERSIST_INTERVAL_SECONDS:
+            self.persist_due = True
+            return
+        self.store.put(self.name, {
+            "rate": round(self.rate, 3),
+            "penaltyUntil": self.penalty_until,
+            "lastRateLimitTime": self.last_rate_limit_time,
+        })
+        self.last_persist = now
+        self.persist_due = False
+
+    def flush(self):
+        """Write out a throttled state change that hasn't been saved yet."""
         with self.lock:
-            now = time.time()
-            
-            # Remove requests older than 60 seconds
-            cutoff = now - 60
-            while self.request_times and self.request_times[0] < cutoff:
-                self.request_times.popleft()
-            
-            # Check if we've hit rate limits recently (within last 5 minutes)
-            if now - self.last_rate_limit_time < 300:  # 5 minutes
-                # Apply backoff: reduce to 70% of normal rate
-                effective_max = int(self.max_rpm * 0.7)
-            else:
-                effective_max = self.max_rpm
-            
-            # If we're at the limit, calculate how long to wait
-            if len(self.request_times) >= effective_max:
-                oldest = self.request_times[0]
-                wait_until = oldest + 60
-                wait_time = max(0, wait_until - now)
-                
-                if wait_time > 0:
-                    print(f"[RateLimiter] Reached {len(self.request_times)} requests/min limit. Waiting {wait_time:.1f}s...")
-                    time.sleep(wait_time)
-                    now = time.time()
-            
-            # Apply minimum delay between requests
-            if self.request_times:
-                time_since_last = now - self.request_times[-1]
-                adjusted_delay = self.min_delay * self.backoff_multiplier
-                
-                if time_since_last < adjusted_delay:
-                    wait_time = adjusted_delay - time_since_last
-                    print(f"[RateLimiter] Minimum delay: waiting {wait_time:.1f}s...")
-                    time.sleep(wait_time)
-                    now = time.time()
-            
-            # Record this request
-            self.request_times.append(now)
-            
-            # Show current rate for monitoring
-            rpm = len(self.request_times)
-            print(f"[RateLimiter] Request sent. Current rate: {rpm} requests/min (limit: {effective_max})")
-    
-    def mark_rate_limited(self):
-        """Call this when a 403/429 error occurs to increase backoff"""
+            if self.persist_due:
+                self._persist(force=True)
+
+    def reserve(self, owner: str = None):
+        """Book the next free slot. Returns the RateLimitReservation; pass
+        it to wait() (or cancel() it)."""
         with self.lock:
-            self.last_rate_limit_time = time.time()
-            self.backoff_multiplier = min(2.0, self.backoff_multiplier * 1.5)
-            print(f"[RateLimiter] Rate limited! Increasing backoff to {self.backoff_multiplier:.2f}x")
-    
-    def reset_backoff(self):
-        """Reset backoff after successful requests"""
+            reservation = RateLimitReservation(self.name, owner)
+            self.pending.append(reservation)
+            self._reschedule(time.time())
+            return reservation
+
+    def wait(self, reservation: RateLimitReservation, should_cancel=None):
+        """Sleep until the reservation's send time, then mark it sent.
+
+        Raises RateLimitCancelled if it gets cancelled - via cancel(), or
+        because should_cancel() returned True - before then.
+        """
+        announced = None
+        with self.cond:
+            while True:
+                if reservation.state == "cancelled":
+                    raise RateLimitCancelled(reservation.id)
+                now = time.time()
+                if reservation.send_at <= now:
+                    break
+                if should_cancel and should_cancel():
+                    self._cancel(reservation)
+                    raise RateLimitCancelled(reservation.id)
+
+                # Announce the wait, and again whenever a reschedule moved it.
+                if announced is None or abs(reservation.send_at - announced) >= 1:
+                    announced = reservation.send_at
+                    reason = "penalty" if now < self.penalty_until else "per_minute_limit"
+                    seconds = reservation.send_at - now
+                    ahead = self.pending.index(reservation)
+                    print(f"[RateLimiter] {self.name}: {reason}, waiting {seconds:.1f}s ({ahead} ahead)...")
+                    server_events.publish("ratelimit_wait", {
+                        "limiter": self.name, "reason": reason, "seconds": round(seconds, 1),
+                        "reservation": reservation.id, "owner": reservation.owner, "ahead": ahead,
+                    })
+                self.cond.wait(min(reservation.send_at - now, self.CANCEL_POLL_SECONDS))
+
+            self.pending.remove(reservation)
+            reservation.state = "sent"
+            self.tat = max(self.tat, now) + self._interval()
+            self._reschedule(now)
+            print(f"[RateLimiter] {self.name}: request sent (rate {self.rate:.1f}/min, max {self.max_rpm})")
+        if announced is not None:
+            server_events.publish("ratelimit_wait_done", {
+                "limiter": self.name, "reservation": reservation.id, "owner": reservation.owner,
+            })
+
+    def wait_if_needed(self, owner: str = None, should_cancel=None):
+        """Block until this bucket allows another request (reserve + wait)."""
+        self.wait(self.reserve(owner), should_cancel)
+
+    def _cancel(self, reservation):
+        self.pending.remove(reservation)
+        reservation.state = "cancelled"
+        self._reschedule(time.time())
+        self.cond.notify_all()
+
+    def cancel(self, reservation_id: str = None, owner: str = None):
+        """Cancel a pending reservation by id, or every one held by owner.
+        Returns how many were cancelled."""
+        with self.cond:
+            doomed = [r for r in self.pending
+                      if (reservation_id and r.id == reservation_id) or (owner and r.owner == owner)]
+            for reservation in doomed:
+                self._cancel(reservation)
+            if doomed:
+                print(f"[RateLimiter] {self.name}: cancelled {len(doomed)} reservation(s)")
+            return len(doomed)
+
+    def _describe(self, reservation, now):
+        return {
+            "id": reservation.id,
+            "limiter": self.name,
+            "owner": reservation.owner,
+            "state": reservation.state,
+            "etaSeconds": round(max(0.0, reservation.send_at - now), 1),
+            "ahead": self.pending.index(reservation) if reservation in self.pending else 0,
+        }
+
+    def status(self, reservation_id: str):
+        """ETA and queue position of a pending reservation, or None."""
         with self.lock:
-            if self.backoff_multiplier > 1.0:
-                self.backoff_multiplier = max(1.0, self.backoff_multiplier * 0.9)
+            now = time.time()
+            for reservation in self.pending:
+                if reservation.id == reservation_id:
+                    return self._describe(reservation, now)
+        return None
 
-# Global rate limiter instance
-steam_rate_limiter = SteamRateLimiter(
-    max_requests_per_minute=10,  # Conservative limit
-    min_delay_seconds=4.0         # 4 seconds between requests
-)
+    def mark_rate_limited(self, retry_after=None):
+        """Call on a 403/429: halve the rate and hold off for Retry-After
+        (header value, as received) or penalty_seconds. Everyone already
+        in line is pushed back behind the penalty."""
+        with self.cond:
+            now = time.time()
+            self.rate = max(self.min_rpm, self.rate / 2)
+            wait = _parse_retry_after(retry_after)
+            if wait is None:
+                wait = self.penalty_seconds
+            self.penalty_until = max(self.penalty_until, now + wait)
+            self.last_rate_limit_time = now
+            # No burst once the penalty is over - restart at the base rate.
+            self.tat = max(self.tat, self.penalty_until + self._tolerance())
+            self._reschedule(now)
+            self.cond.notify_all()
+            print(f"[RateLimiter] {self.name}: rate limited! Rate down to {self.rate:.1f}/min, "
+                  f"pausing {wait:.0f}s")
+            self._persist(force=True)
+
+    def mark_success(self):
+        """Call after a successful request: probe a slightly higher rate."""
+        with self.lock:
+            if time.time() - self.last_rate_limit_time < self.cooldown_seconds:
+                return
+            if self.rate < self.max_rpm:
+                self.rate = min(self.max_rpm, self.rate + self.increase_rpm)
+                self._persist()
+
+    def snapshot(self):
+        with self.lock:
+            now = time.time()
+            return {
+                "rate": round(self.rate, 2),
+                "minRate": self.min_rpm,
+                "maxRate": self.max_rpm,
+                "burst": self.burst,
+                "penaltySeconds": round(max(0.0, self.penalty_until - now), 1),
+                "reservations": [self._describe(r, now) for r in self.pending],
+            }
 
 # Paths / constants
 PZ_APP_ID = "108600"
 
+# Where Steam requests go. Overridable from the environment so the tracker
+# can be pointed at a local stand-in (bench/fake_steam.py) for throughput
+# and rate-limit testing; item links shown in the UI always stay on Steam.
+STEAM_COMMUNITY_URL = os.environ.get("PZ_STEAM_COMMUNITY_URL", "https://steamcommunity.com").rstrip("/")
+STEAM_API_URL = os.environ.get("PZ_STEAM_API_URL", "https://api.steampowered.com").rstrip("/")
+
 # Workshop item IDs that are actually static Steam page-chrome links, not
 # real search results. These show up in the raw HTML/JSON of every browse
 # and profile page regardless of search terms (e.g. the "Learn More" link
@@ -116,15 +408,26 @@ KNOWN_NON_RESULT_WORKSHOP_IDS = {
 
 if getattr(sys, "frozen", False):
     ROOT_DIR = Path(sys._MEIPASS)
+    # _MEIPASS is unpacked fresh on every launch and deleted on exit, so
+    # state that has to survive a restart lives next to the executable.
+    DATA_DIR = Path(sys.executable).resolve().parent
 else:
     ROOT_DIR = Path(__file__).resolve().parent
+    DATA_DIR = ROOT_DIR
+# Benchmarks and test runs point this at a scratch directory so they never
+# touch the real search jobs, details cache or learned rate limits.
+if os.environ.get("PZ_TRACKER_DATA_DIR"):
+    DATA_DIR = Path(os.environ["PZ_TRACKER_DATA_DIR"])
 
 PUBLIC_DIR = ROOT_DIR / "public"
 VERIFY_DIR = ROOT_DIR / "verify"
 TMP_VERIFY_DIR = ROOT_DIR / "_tmp_verify"
+SEARCH_JOBS_DIR = DATA_DIR / "_search_jobs"
 
 VERIFY_CONFIG_FILE = VERIFY_DIR / "verify_config.ini"
 MANIFEST_DIR = VERIFY_DIR / "manifests"
+WORKSHOP_CACHE_FILE = DATA_DIR / "verify" / "workshop_cache.sqlite3"
+RATE_LIMIT_STATE_FILE = DATA_DIR / "verify" / "rate_limits.json"
 
 DEPOT_DEFAULT_PATHS = [
     Path("C:/DepotDownloader/DepotDownloader.exe"),
@@ -256,15 +559,218 @@ def set_workshop_app_id(app_id_str: str):
     save_verify_config(config)
 
 
+# Defaults per endpoint class. "community" is HTML scraping of
+# steamcommunity.com (browse/profile pages) - conservative, like the old
+# single limiter. "webapi" is api.steampowered.com, which tolerates far
+# more and shouldn't queue behind the scraping budget.
+STEAM_RATE_LIMIT_DEFAULTS = {
+    "community": {"rpm": 10, "min_rpm": 2, "max_rpm": 20, "burst": 2,
+                  "increase_rpm": 0.25, "penalty_seconds": 60, "cooldown_seconds": 300},
+    "webapi": {"rpm": 30, "min_rpm": 5, "max_rpm": 120, "burst": 5,
+               "increase_rpm": 1.0, "penalty_seconds": 15, "cooldown_seconds": 120},
+}
+
+def _create_steam_rate_limiters(store: RateLimitStateStore = None):
+    """Build one limiter per endpoint class; any default can be overridden
+    in the optional [RateLimit] section as <class>_<option>, e.g.
+    community_max_rpm = 15."""
+    config = load_verify_config()
+    limiters = {}
+    for name, defaults in STEAM_RATE_LIMIT_DEFAULTS.items():
+        options = {}
+        for option, default in defaults.items():
+            try:
+                value = config.getfloat('RateLimit', f"{name}_{option}", fallback=default)
+            except ValueError:
+                value = default
+            options[option] = int(value) if option == "burst" else value
+        limiters[name] = SteamRateLimiter(name, store=store, **options)
+    return limiters
+
+rate_limit_store = RateLimitStateStore(RATE_LIMIT_STATE_FILE)
+steam_rate_limiters = _create_steam_rate_limiters(rate_limit_store)
+# Older name for the scraping limiter.
+steam_rate_limiter = steam_rate_limiters["community"]
+
+def get_rate_limit_reservation(reservation_id: str):
+    for limiter in steam_rate_limiters.values():
+        status = limiter.status(reservation_id)
+        if status:
+            return status
+    return None
+
+def cancel_rate_limit_reservations(reservation_id: str = None, owner: str = None):
+    return sum(limiter.cancel(reservation_id, owner) for limiter in steam_rate_limiters.values())
+
+def flush_rate_limit_state():
+    for limiter in steam_rate_limiters.values():
+        limiter.flush()
+
+
+# ============================================================================
+# STEAM CONNECTION POOL
+# Reuses keep-alive HTTPS connections to Steam hosts between requests
+# ============================================================================
+PooledResponse = namedtuple("PooledResponse", ["status", "reason", "headers", "body"])
+
+class SteamConnectionPool:
+    """
+    Small thread-safe pool of persistent HTTP(S) connections, keyed by
+    (scheme, host, port). urlopen() opens a brand new TCP+TLS connection
+    for every call even though we send "Connection: keep-alive"; this
+    hands back an idle connection to the same host instead, so a long
+    "Run All Searches" batch only pays the handshake once per host.
+
+    - Idle connections older than idle_timeout are closed, not reused
+      (Steam drops idle keep-alives on its side after a while anyway).
+    - A reused connection that turns out to have been reset by the server
+      is retried once on a fresh connection.
+    - Bodies are returned already decoded from gzip/deflate.
+    """
+
+    RESET_ERRORS = (
+        http.client.RemoteDisconnected,
+        http.client.BadStatusLine,
+        ConnectionResetError,
+        ConnectionAbortedError,
+        BrokenPipeError,
+        ssl.SSLEOFError,
+    )
+
+    def __init__(self, max_idle_per_host=4, idle_timeout=60.0):
+        self.max_idle_per_host = max_idle_per_host
+        self.idle_timeout = idle_timeout
+        self.lock = Lock()
+        self.idle = {}  # (scheme, host, port) -> [(conn, last_used), ...]
+        self.ssl_context = ssl.create_default_context()
+
+    def _acquire(self, key, timeout):
+        now = time.time()
+        with self.lock:
+            conns = self.idle.get(key, [])
+            while conns:
+                conn, last_used = conns.pop()
+                if now - last_used < self.idle_timeout:
+                    conn.timeout = timeout
+                    if conn.sock is not None:
+                        conn.sock.settimeout(timeout)
+                    return conn, True
+                conn.close()
+
+        scheme, host, port = key
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(host, port, timeout=timeout, context=self.ssl_context)
+        else:
+            conn = http.client.HTTPConnection(host, port, timeout=timeout)
+        return conn, False
+
+    def _release(self, key, conn):
+        with self.lock:
+            conns = self.idle.setdefault(key, [])
+            if len(conns) < self.max_idle_per_host:
+                conns.append((conn, time.time()))
+                return
+        conn.close()
+
+    def close_all(self):
+        with self.lock:
+            for conns in self.idle.values():
+                for conn, _ in conns:
+                    conn.close()
+            self.idle.clear()
+
+    @staticmethod
+    def _decode_body(body: bytes, encoding: str):
+        encoding = (encoding or "").strip().lower()
+        if encoding == "gzip":
+            return gzip.decompress(body)
+        if encoding == "deflate":
+            # "deflate" is supposed to be zlib-wrapped, but plenty of
+            # servers send a raw deflate stream instead - accept both.
+            try:
+                return zlib.decompress(body)
+            except zlib.error:
+                return zlib.decompress(body, -zlib.MAX_WBITS)
+        return body
+
+    def request(self, method: str, url: str, body: bytes = None, headers: dict = None,
+                timeout: float = 20, max_redirects: int = 5):
+        """Send a request and return a PooledResponse (any status code).
+
+        Network failures raise (OSError / http.client.HTTPException) the
+        same way urlopen's URLError would, so callers keep their retry logic.
+        """
+        headers = dict(headers or {})
+        for _ in range(max_redirects + 1):
+            parsed = urllib.parse.urlsplit(url)
+            scheme = parsed.scheme.lower()
+            port = parsed.port or (443 if scheme == "https" else 80)
+            key = (scheme, parsed.hostname, port)
+            target = parsed.path or "/"
+            if parsed.query:
+                target += "?" + parsed.query
+
+            for attempt in range(2):
+                conn, reused = self._acquire(key, timeout)
+                try:
+                    conn.request(method, target, body=body, headers=headers)
+                    resp = conn.getresponse()
+                    raw = resp.read()
+                except self.RESET_ERRORS:
+                    conn.close()
+                    if reused and attempt == 0:
+                        # Stale keep-alive the server already dropped -
+                        # not a real failure, just reconnect once.
+                        continue
+                    raise
+                except Exception:
+                    conn.close()
+                    raise
+
+                if resp.will_close:
+                    conn.close()
+                else:
+                    self._release(key, conn)
+                break
+
+            if resp.status in (301, 302, 303, 307, 308) and resp.getheader("Location"):
+                url = urllib.parse.urljoin(url, resp.getheader("Location"))
+                if resp.status == 303 or (resp.status in (301, 302) and method == "POST"):
+                    method, body = "GET", None
+                    headers.pop("Content-Type", None)
+                continue
+
+            content = self._decode_body(raw, resp.getheader("Content-Encoding", ""))
+            return PooledResponse(resp.status, resp.reason, resp.msg, content)
+
+        raise http.client.HTTPException(f"Too many redirects for {url}")
+
+steam_http_pool = SteamConnectionPool()
+
+
 # Existing search endpoints
-def fetch_url(url: str, timeout: int = 15, max_retries: int = 2):
-    """Fetch URL with retry logic and rate limiting"""
+# Status fetch_url reports when the wait for a rate-limit slot was cancelled
+# (nginx's "client closed request").
+STATUS_CANCELLED = 499
+
+def fetch_url(url: str, timeout: int = 15, max_retries: int = 2, limiter: str = "community",
+              owner: str = None, should_cancel=None):
+    """Fetch URL with retry logic and rate limiting (via steam_rate_limiters[limiter]).
+
+    owner labels the rate-limit reservation (see /api/ratelimit/status);
+    should_cancel() returning True while waiting for it gives up with
+    STATUS_CANCELLED instead of spending the slot.
+    """
+    rate_limiter = steam_rate_limiters[limiter]
     # Apply rate limiting before the request
-    steam_rate_limiter.wait_if_needed()
+    try:
+        rate_limiter.wait_if_needed(owner, should_cancel)
+    except RateLimitCancelled:
+        return None, STATUS_CANCELLED, "Cancelled while waiting for the rate limiter"
     
     for attempt in range(max_retries):
         try:
-            req = urllib.request.Request(url, headers={
+            response = steam_http_pool.request("GET", url, timeout=timeout, headers={
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
                 "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
                 "Accept-Language": "en-US,en;q=0.9",
@@ -272,32 +778,24 @@ def fetch_url(url: str, timeout: int = 15, max_retries: int = 2):
                 "Connection": "keep-alive",
                 "Cache-Control": "max-age=0",
             })
-            with urllib.request.urlopen(req, timeout=timeout) as response:
-                content = response.read()
-                # Handle gzip encoding
-                if response.headers.get('Content-Encoding') == 'gzip':
-                    import gzip
-                    content = gzip.decompress(content)
-                
-                # Reset backoff on successful request
-                steam_rate_limiter.reset_backoff()
-                return content.decode("utf-8", errors="ignore"), 200, None
-        except urllib.error.HTTPError as e:
-            if e.code in (403, 429):
-                steam_rate_limiter.mark_rate_limited()
-                print(f"[Fetch] HTTP {e.code} (rate limit or blocked)")
-                return None, e.code, str(e.reason)
+            if 200 <= response.status < 300:
+                rate_limiter.mark_success()
+                return response.body.decode("utf-8", errors="ignore"), 200, None
+            if response.status in (403, 429):
+                rate_limiter.mark_rate_limited(response.headers.get("Retry-After"))
+                print(f"[Fetch] HTTP {response.status} (rate limit or blocked)")
+                return None, response.status, response.reason
             if attempt < max_retries - 1:
-                print(f"[Fetch] HTTP {e.code}, retrying... ({attempt + 1}/{max_retries})")
+                print(f"[Fetch] HTTP {response.status}, retrying... ({attempt + 1}/{max_retries})")
                 time.sleep(1.0 * (attempt + 1))
                 continue
-            return None, e.code, str(e.reason)
-        except urllib.error.URLError as e:
+            return None, response.status, response.reason
+        except (OSError, http.client.HTTPException) as e:
             if attempt < max_retries - 1:
-                print(f"[Fetch] URLError, retrying... ({attempt + 1}/{max_retries})")
+                print(f"[Fetch] Connection error: {e}, retrying... ({attempt + 1}/{max_retries})")
                 time.sleep(1.0 * (attempt + 1))
                 continue
-            return None, 0, str(e.reason)
+            return None, 0, str(e)
         except Exception as e:
             if attempt < max_retries - 1:
                 print(f"[Fetch] Error: {e}, retrying... ({attempt + 1}/{max_retries})")
@@ -307,7 +805,6 @@ def fetch_url(url: str, timeout: int = 15, max_retries: int = 2):
 
     return None, 0, "Max retries exceeded"
 
-
 def _extract_ssr_render_context(html_content: str):
     """Pull Steam's embedded TanStack-Query hydration state out of the page.
 
@@ -342,144 +839,314 @@ def _extract_ssr_render_context(html_content: str):
         return None
 
 
-def _parse_workshop_items_from_html(html_content: str):
-    """Extract workshop items (and total page count, if known) from a page.
+SSR_RENDER_CONTEXT_MARKER = "window.SSR.renderContext"
+_json_decoder = json.JSONDecoder()
 
-    Returns (items, total_pages). total_pages is None if it couldn't be
-    determined (older/plain HTML fallback paths).
+
+def _find_ssr_blob(html_content: str):
+    """Locate the escaped renderContext string with plain string scans.
+
+    Same target as the regex in _extract_ssr_render_context, without
+    running a DOTALL pattern over the whole page: find the marker, step
+    over `=JSON.parse("`, and end at the first `");` whose quote isn't
+    escaped. Returns the raw (still escaped) string body, or None.
     """
-    items = []
-    seen = set()
-    total_pages = None
+    start = html_content.find(SSR_RENDER_CONTEXT_MARKER)
+    if start < 0:
+        return None
+    pos = start + len(SSR_RENDER_CONTEXT_MARKER)
+    rest = html_content[pos:pos + 64].lstrip()
+    if not rest.startswith("="):
+        return None
+    rest = rest[1:].lstrip()
+    if not rest.startswith('JSON.parse("'):
+        return None
+    body_start = html_content.find('JSON.parse("', pos) + len('JSON.parse("')
+
+    end = body_start
+    while True:
+        end = html_content.find('");', end)
+        if end < 0:
+            return None
+        backslashes = 0
+        while html_content[end - 1 - backslashes] == "\\":
+            backslashes += 1
+        if backslashes % 2 == 0:
+            return html_content[body_start:end]
+        end += 1
+
+
+def _json_value_start(text: str, key_pos: int, key: str):
+    """Index of the value following the `"key"` found at key_pos (skipping
+    whitespace and the colon), or -1 if no value follows."""
+    pos = key_pos + len(key) + 2
+    while pos < len(text) and text[pos] in " \t\r\n":
+        pos += 1
+    if pos >= len(text) or text[pos] != ":":
+        return -1
+    pos += 1
+    while pos < len(text) and text[pos] in " \t\r\n":
+        pos += 1
+    return pos if pos < len(text) else -1
+
+
+def _extract_ssr_results(html_content: str):
+    """Fast path for the SSR blob: return just the query data dicts that
+    carry a `results` array ([] if the page has no blob at all), or None
+    if the blob's layout is unexpected and the full decode should be used.
+
+    The blob is unescaped once; from the renderContext text only the
+    `queryData` value is decoded, and from that only the `data` object
+    around each `"results":[` - the page's other queries (user prefs,
+    tags, etc.) are never turned into Python objects.
+    """
+    raw = _find_ssr_blob(html_content)
+    if raw is None:
+        return []
+    try:
+        context_text = json.loads('"' + raw + '"')
+        key = context_text.find('"queryData"')
+        value_start = _json_value_start(context_text, key, "queryData") if key >= 0 else -1
+        if value_start < 0:
+            return None
+        query_data, _ = _json_decoder.raw_decode(context_text, value_start)
+        if not isinstance(query_data, str):
+            return None
+
+        found = []
+        scanned_to = 0
+        pos = query_data.find('"results"')
+        while pos >= 0:
+            value = _json_value_start(query_data, pos, "results")
+            if pos >= scanned_to and value >= 0 and query_data[value] == "[":
+                data_key = query_data.rfind('"data"', scanned_to, pos)
+                data_start = _json_value_start(query_data, data_key, "data") if data_key >= 0 else -1
+                if data_start < 0:
+                    return None
+                data, data_end = _json_decoder.raw_decode(query_data, data_start)
+                # The nearest "data" key must be the object holding this
+                # results array; anything else (a nested "data" field in
+                # between, say) means the layout isn't what we expect.
+                if data_end <= pos or not isinstance(data, dict) \
+                        or not isinstance(data.get("results"), list):
+                    return None
+                found.append(data)
+                scanned_to = data_end
+            pos = query_data.find('"results"', pos + 1)
+        return found
+    except (ValueError, IndexError):
+        return None
+
 
+def _workshop_item(wid: str, title: str, **extra):
+    item = {
+        "workshopId": wid,
+        "title": title or f"Workshop Item {wid}",
+        "url": f"https://steamcommunity.com/sharedfiles/filedetails/?id={wid}",
+    }
+    item.update(extra)
+    return item
+
+
+def _ssr_results_full(html_content: str):
+    """Results query data via the full renderContext/queryData decode."""
     ctx = _extract_ssr_render_context(html_content)
-    if ctx:
-        try:
-            qd_raw = ctx.get("queryData")
-            qd = json.loads(qd_raw) if isinstance(qd_raw, str) else (qd_raw or {})
-            for q in qd.get("queries", []):
-                data = (q.get("state") or {}).get("data")
-                if isinstance(data, dict) and isinstance(data.get("results"), list):
-                    if data.get("total_pages") is not None:
-                        total_pages = data.get("total_pages")
-                    for r in data["results"]:
-                        wid = str(r.get("publishedfileid") or "").strip()
-                        if wid and wid not in seen:
-                            seen.add(wid)
-                            items.append({
-                                "workshopId": wid,
-                                "title": (r.get("title") or "").strip() or f"Workshop Item {wid}",
-                                "url": f"https://steamcommunity.com/sharedfiles/filedetails/?id={wid}",
-                                "author": str(r.get("creator") or "") or None,
-                                "shortDescription": (r.get("short_description") or "").strip() or None,
-                                "subscriptions": r.get("subscriptions"),
-                                "timeUpdated": r.get("time_updated"),
-                            })
-        except Exception as e:
-            print(f"[Parse] JSON extraction failed, will try HTML fallback: {e}")
+    if not ctx:
+        return []
+    qd_raw = ctx.get("queryData")
+    qd = json.loads(qd_raw) if isinstance(qd_raw, str) else (qd_raw or {})
+    return [
+        data for data in ((q.get("state") or {}).get("data") for q in qd.get("queries", []))
+        if isinstance(data, dict) and isinstance(data.get("results"), list)
+    ]
 
-    if items:
-        return items, total_pages
 
-    # Fallback 1: current title-div class as of this writing. Steam hashes
-    # these per-build so this WILL drift again - it's a safety net, not
-    # the primary path.
+def _parse_items_ssr_json(html_content: str, seen: set):
+    """Primary path: the SSR renderContext JSON (see _extract_ssr_render_context).
+
+    _extract_ssr_results handles the usual layout; the full decode is only
+    used when it can't make sense of the blob.
+    """
+    items = []
+    total_pages = None
+    try:
+        results_data = _extract_ssr_results(html_content)
+        if results_data is None:
+            results_data = _ssr_results_full(html_content)
+        for data in results_data:
+            if data.get("total_pages") is not None:
+                total_pages = data.get("total_pages")
+            for r in data["results"]:
+                wid = str(r.get("publishedfileid") or "").strip()
+                if wid and wid not in seen:
+                    seen.add(wid)
+                    items.append(_workshop_item(
+                        wid, (r.get("title") or "").strip(),
+                        author=str(r.get("creator") or "") or None,
+                        shortDescription=(r.get("short_description") or "").strip() or None,
+                        subscriptions=r.get("subscriptions"),
+                        timeUpdated=r.get("time_updated"),
+                    ))
+    except Exception as e:
+        print(f"[Parse] JSON extraction failed, will try HTML fallback: {e}")
+    return items, total_pages
+
+
+def _parse_items_hashed_class(html_content: str, seen: set):
+    """Fallback 1: current title-div class as of this writing. Steam hashes
+    these per-build so this WILL drift again - it's a safety net, not
+    the primary path."""
+    items = []
     for wid, title in re.findall(
         r'class="Sw3NXcvOA4Y-"><a[^>]+\?id=(\d+)[^>]*>([^<]+)<',
         html_content,
     ):
         if wid not in seen:
             seen.add(wid)
-            items.append({
-                "workshopId": wid,
-                "title": title.strip() or f"Workshop Item {wid}",
-                "url": f"https://steamcommunity.com/sharedfiles/filedetails/?id={wid}",
-            })
+            items.append(_workshop_item(wid, title.strip()))
+    return items, None
 
-    # Fallback 2: img alt text next to filedetails link.
-    if not items:
-        for wid, title in re.findall(
-            r'filedetails/\?id=(\d+)"[^>]*><img[^>]+alt="([^"]+)"',
-            html_content,
-        ):
-            if wid not in seen:
-                seen.add(wid)
-                items.append({
-                    "workshopId": wid,
-                    "title": title.strip() or f"Workshop Item {wid}",
-                    "url": f"https://steamcommunity.com/sharedfiles/filedetails/?id={wid}",
-                })
 
-    # Fallback 3: classic (pre-SSR-redesign) profile workshop-files page.
-    # /profiles/<id>/myworkshopfiles/ (and /id/<vanity>/myworkshopfiles/)
-    # still serve Steam's long-standing legacy template - no window.SSR
-    # JSON blob at all, and none of the new /workshop/browse/ page's
-    # build-hashed classes exist here.
-    if not items:
-        # 3a (preferred): each item's hover script calls
-        # SharedFileBindMouseHover("sharedfile_<id>", <bool>, {json}) with
-        # a clean JSON object - id, title, description, appid. This is
-        # more reliable than scraping the surrounding HTML/classes at all,
-        # same reasoning as preferring the browse page's SSR JSON blob.
-        pattern = r'SharedFileBindMouseHover\(\s*"sharedfile_\d+"\s*,\s*\w+\s*,\s*(\{.*?\})\s*\)\s*;'
-        for m in re.finditer(pattern, html_content, re.DOTALL):
-            try:
-                obj = json.loads(m.group(1))
-            except Exception:
-                continue
-            wid = str(obj.get("id") or "").strip()
-            if not wid or wid in seen:
-                continue
+def _parse_items_img_alt(html_content: str, seen: set):
+    """Fallback 2: img alt text next to filedetails link."""
+    items = []
+    for wid, title in re.findall(
+        r'filedetails/\?id=(\d+)"[^>]*><img[^>]+alt="([^"]+)"',
+        html_content,
+    ):
+        if wid not in seen:
             seen.add(wid)
-            items.append({
-                "workshopId": wid,
-                "title": (obj.get("title") or "").strip() or f"Workshop Item {wid}",
-                "url": f"https://steamcommunity.com/sharedfiles/filedetails/?id={wid}",
-                "shortDescription": (obj.get("description") or "").strip() or None,
-            })
-        if items:
-            print(f"[Parse] Found {len(items)} item(s) via legacy page's SharedFileBindMouseHover data.")
-
-        # 3b (fallback): if the hover-script data isn't present for some
-        # reason, scope to each "workshopItem" block and pull the id
-        # (from the filedetails link on the preview thumbnail) and title
-        # (from the sibling "workshopItemTitle" div - note this class
-        # often has extra modifiers appended, e.g. "workshopItemTitle
-        # ellipsis", so the match can't require an exact class value).
-        # These are SIBLING elements, not nested in one another. (This
-        # page has no "Learn More" policy-link chrome like the browse
-        # page, so scoping to workshopItem blocks doesn't reintroduce the
-        # earlier false-positive risk from an unscoped link grab.)
-        if not items:
-            for block in re.split(r'(?=class="workshopItem")', html_content):
-                if 'class="workshopItem"' not in block:
-                    continue
-                id_match = re.search(r'filedetails/\?id=(\d+)', block)
-                if not id_match:
-                    continue
-                wid = id_match.group(1)
-                if wid in seen:
-                    continue
-                title_match = re.search(r'class="workshopItemTitle[^"]*"[^>]*>([^<]+)<', block)
-                title = title_match.group(1).strip() if title_match else ""
-                seen.add(wid)
-                items.append({
-                    "workshopId": wid,
-                    "title": title or f"Workshop Item {wid}",
-                    "url": f"https://steamcommunity.com/sharedfiles/filedetails/?id={wid}",
-                })
-            if items:
-                print(f"[Parse] Found {len(items)} item(s) via legacy workshopItem block scan.")
+            items.append(_workshop_item(wid, title.strip()))
+    return items, None
 
+
+def _legacy_total_pages(html_content: str, items_on_page: int):
+    """Legacy pagination: "Showing 1-9 of 28 entries" tells us the real
+    total so callers can stop at the right page instead of guessing from
+    empty-page streaks."""
+    m = re.search(r'of\s+([\d,]+)\s+entries', html_content)
+    if not m:
+        return None
+    total_entries = int(m.group(1).replace(",", ""))
+    per_page = max(items_on_page, 1)
+    return -(-total_entries // per_page)  # ceil div
+
+
+def _parse_items_legacy_hover(html_content: str, seen: set):
+    """Fallback 3a: classic (pre-SSR-redesign) profile workshop-files page.
+
+    /profiles/<id>/myworkshopfiles/ (and /id/<vanity>/myworkshopfiles/)
+    still serve Steam's long-standing legacy template - no window.SSR
+    JSON blob at all, and none of the new /workshop/browse/ page's
+    build-hashed classes exist here. Each item's hover script calls
+    SharedFileBindMouseHover("sharedfile_<id>", <bool>, {json}) with a
+    clean JSON object - id, title, description, appid. This is more
+    reliable than scraping the surrounding HTML/classes at all, same
+    reasoning as preferring the browse page's SSR JSON blob.
+    """
+    items = []
+    pattern = r'SharedFileBindMouseHover\(\s*"sharedfile_\d+"\s*,\s*\w+\s*,\s*(\{.*?\})\s*\)\s*;'
+    for m in re.finditer(pattern, html_content, re.DOTALL):
+        try:
+            obj = json.loads(m.group(1))
+        except Exception:
+            continue
+        wid = str(obj.get("id") or "").strip()
+        if not wid or wid in seen:
+            continue
+        seen.add(wid)
+        items.append(_workshop_item(
+            wid, (obj.get("title") or "").strip(),
+            shortDescription=(obj.get("description") or "").strip() or None,
+        ))
+    if items:
+        print(f"[Parse] Found {len(items)} item(s) via legacy page's SharedFileBindMouseHover data.")
+        return items, _legacy_total_pages(html_content, len(items))
+    return items, None
+
+
+def _parse_items_legacy_blocks(html_content: str, seen: set):
+    """Fallback 3b: legacy page without the hover-script data.
+
+    Scope to each "workshopItem" block and pull the id (from the
+    filedetails link on the preview thumbnail) and title (from the sibling
+    "workshopItemTitle" div - note this class often has extra modifiers
+    appended, e.g. "workshopItemTitle ellipsis", so the match can't
+    require an exact class value). These are SIBLING elements, not nested
+    in one another. (This page has no "Learn More" policy-link chrome like
+    the browse page, so scoping to workshopItem blocks doesn't reintroduce
+    the earlier false-positive risk from an unscoped link grab.)
+    """
+    items = []
+    for block in re.split(r'(?=class="workshopItem")', html_content):
+        if 'class="workshopItem"' not in block:
+            continue
+        id_match = re.search(r'filedetails/\?id=(\d+)', block)
+        if not id_match:
+            continue
+        wid = id_match.group(1)
+        if wid in seen:
+            continue
+        title_match = re.search(r'class="workshopItemTitle[^"]*"[^>]*>([^<]+)<', block)
+        title = title_match.group(1).strip() if title_match else ""
+        seen.add(wid)
+        items.append(_workshop_item(wid, title))
+    if items:
+        print(f"[Parse] Found {len(items)} item(s) via legacy workshopItem block scan.")
+        return items, _legacy_total_pages(html_content, len(items))
+    return items, None
+
+
+# Tried in order (after the page type's preferred path, if any); the first
+# path that yields any items wins. The names are what _parse_workshop_items
+# reports (and bench/ measures).
+WORKSHOP_PARSE_PATHS = [
+    ("ssr_json", _parse_items_ssr_json),
+    ("hashed_class", _parse_items_hashed_class),
+    ("img_alt", _parse_items_img_alt),
+    ("legacy_hover", _parse_items_legacy_hover),
+    ("legacy_blocks", _parse_items_legacy_blocks),
+]
+
+# Which page template each path reads: the current SSR frontend (browse
+# page) or the legacy one (myworkshopfiles).
+WORKSHOP_PARSE_TEMPLATES = {
+    "ssr_json": "ssr",
+    "hashed_class": "ssr",
+    "img_alt": "ssr",
+    "legacy_hover": "legacy",
+    "legacy_blocks": "legacy",
+}
+
+
+# page type ("browse", "profile") -> template whose path last produced
+# items for it. Profile pages never carry the SSR blob, so once one has
+# parsed via a legacy path, the legacy paths go first for that page type.
+# Paths keep their usual order within a template - legacy_blocks finds
+# the same items as legacy_hover but without descriptions.
+_preferred_parse_template = {}
+
+
+def _parse_workshop_items(html_content: str, page_type: str = None):
+    """Like _parse_workshop_items_from_html, plus the name of the path that
+    produced the items (None for a zero-result page)."""
+    seen = set()
+    items, total_pages, path = [], None, None
+    paths = WORKSHOP_PARSE_PATHS
+    preferred = _preferred_parse_template.get(page_type)
+    if preferred:
+        paths = sorted(paths, key=lambda entry: WORKSHOP_PARSE_TEMPLATES[entry[0]] != preferred)
+    for name, parse in paths:
+        items, pages = parse(html_content, seen)
+        if pages is not None:
+            total_pages = pages
         if items:
-            # Legacy pagination: "Showing 1-9 of 28 entries" tells us the
-            # real total so callers can stop at the right page instead of
-            # guessing from empty-page streaks.
-            m = re.search(r'of\s+([\d,]+)\s+entries', html_content)
-            if m:
-                total_entries = int(m.group(1).replace(",", ""))
-                per_page = max(len(items), 1)
-                total_pages = -(-total_entries // per_page)  # ceil div
+            path = name
+            break
+
+    if page_type and path and WORKSHOP_PARSE_TEMPLATES[path] != preferred:
+        _preferred_parse_template[page_type] = WORKSHOP_PARSE_TEMPLATES[path]
+        print(f"[Parse] {page_type} pages: trying {WORKSHOP_PARSE_TEMPLATES[path]} template paths first from now on")
 
     # NOTE: there used to be a Fallback here that grabbed *any*
     # sharedfiles/filedetails/?id=... link on the page as a last resort.
@@ -499,55 +1166,201 @@ def _parse_workshop_items_from_html(html_content: str):
     if items:
         items = [it for it in items if it["workshopId"] not in KNOWN_NON_RESULT_WORKSHOP_IDS]
 
+    return items, total_pages, path
+
+
+def _parse_workshop_items_from_html(html_content: str, page_type: str = None):
+    """Extract workshop items (and total page count, if known) from a page.
+
+    Returns (items, total_pages). total_pages is None if it couldn't be
+    determined (older/plain HTML fallback paths). page_type ("browse" or
+    "profile") lets the parser start with the path that worked last time
+    for that kind of page.
+    """
+    items, total_pages, _ = _parse_workshop_items(html_content, page_type)
     return items, total_pages
 
 
-def search_workshop(mod_id: str, max_pages: int = 5):
+# ============================================================================
+# SEARCH PAGE CACHE
+# Short-lived memory cache of parsed browse pages, keyed by (mod, page, sort)
+# ============================================================================
+class SearchPageCache:
+    """
+    Keeps the parsed (items, total_pages) result of recently fetched browse
+    pages so re-running a search - from another tab, or restarting an
+    interrupted "Run All" - doesn't spend rate budget on pages we already
+    have. Only successfully parsed pages are stored; errors, blocks and
+    CAPTCHA pages never are. Bounded to max_entries, oldest evicted first.
+    """
+
+    def __init__(self, ttl_seconds=900, max_entries=500):
+        self.ttl = ttl_seconds
+        self.max_entries = max_entries
+        self.lock = Lock()
+        self.entries = OrderedDict()  # (mod_id, page, sort) -> (stored_at, items, total_pages)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, mod_id: str, page: int, sort: str):
+        key = (mod_id.lower(), page, sort)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry and time.time() - entry[0] < self.ttl:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return [dict(it) for it in entry[1]], entry[2]
+            if entry:
+                del self.entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, mod_id: str, page: int, sort: str, items: list, total_pages):
+        key = (mod_id.lower(), page, sort)
+        with self.lock:
+            self.entries[key] = (time.time(), [dict(it) for it in items], total_pages)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def stats(self):
+        with self.lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self.entries),
+                "maxEntries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hitRate": round(self.hits / total, 3) if total else None,
+                "ttlSeconds": self.ttl,
+            }
+
+search_page_cache = SearchPageCache()
+
+
+def parse_search_watermark(value: str):
+    """Parse a "<timeUpdated>:<workshopId>" watermark (either half may be
+    empty) into a dict, or None if there's nothing usable in it."""
+    if not value:
+        return None
+    time_part, _, id_part = str(value).partition(":")
+    watermark = {"timeUpdated": None, "workshopId": id_part.strip() or None}
+    try:
+        watermark["timeUpdated"] = int(time_part) if time_part.strip() else None
+    except ValueError:
+        pass
+    if watermark["timeUpdated"] is None and watermark["workshopId"] is None:
+        return None
+    return watermark
+
+def make_search_watermark(items: list, previous: dict = None):
+    """Watermark for the next incremental run: the newest timeUpdated seen
+    plus the top (most recent) workshop ID. Falls back to the previous
+    watermark when nothing new turned up."""
+    if not items:
+        return previous
+    times = [it["timeUpdated"] for it in items if isinstance(it.get("timeUpdated"), int)]
+    newest = max(times) if times else None
+    if newest is None and previous:
+        newest = previous.get("timeUpdated")
+    return {"timeUpdated": newest, "workshopId": items[0]["workshopId"]}
+
+def format_search_watermark(watermark: dict):
+    if not watermark:
+        return None
+    t = watermark.get("timeUpdated")
+    return f"{t if t is not None else ''}:{watermark.get('workshopId') or ''}"
+
+def _crosses_watermark(item: dict, since: dict):
+    if since.get("workshopId") and item["workshopId"] == since["workshopId"]:
+        return True
+    t = item.get("timeUpdated")
+    return since.get("timeUpdated") is not None and isinstance(t, int) and t <= since["timeUpdated"]
+
+
+def search_workshop(mod_id: str, max_pages: int = 5, sort: str = "mostrecent",
+                    force_refresh: bool = False, since: dict = None, should_cancel=None):
     """Search the Workshop browse page for items matching 'Mod ID: <mod_id>'.
 
     Parses Steam's new SSR JSON-embedded HTML format instead of old CSS classes.
+    Parsed pages are reused from search_page_cache unless force_refresh is set.
+
+    With a `since` watermark (see parse_search_watermark), results are sorted
+    newest-first, so the first item at or below the watermark means every
+    later item and page was already seen last run: paging stops right there
+    and only the items above it are returned.
+
+    should_cancel (e.g. "has the client gone away?") is checked while
+    waiting on the rate limiter; if it fires the search stops with a
+    STATUS_CANCELLED error.
     """
     results = []
     seen = set()
     consecutive_empty = 0
     max_consecutive_empty = 2
+    crossed_watermark = False
 
     for page in range(1, max_pages + 1):
-        url = (
-            f"https://steamcommunity.com/workshop/browse/"
-            f"?appid={PZ_APP_ID}"
-            f"&searchtext=%22Mod+ID%3A+{urllib.parse.quote(mod_id)}%22"
-            f"&browsesort=mostrecent&section=readytouseitems"
-            f"&actualsort=mostrecent&p={page}"
-        )
-        print(f"[Search] Fetching page {page}/{max_pages} for '{mod_id}'...")
-
-        html_content, status_code, error = fetch_url(url, timeout=20)
-
-        if status_code in (403, 429):
-            return None, {"error": "Steam blocked/rate-limited the request.", "statusCode": status_code}
+        cached = None if force_refresh else search_page_cache.get(mod_id, page, sort)
+        if cached is not None:
+            items, total_pages = cached
+            print(f"[Search] Page {page}/{max_pages} for '{mod_id}' served from cache")
+        else:
+            url = (
+                f"{STEAM_COMMUNITY_URL}/workshop/browse/"
+                f"?appid={PZ_APP_ID}"
+                f"&searchtext=%22Mod+ID%3A+{urllib.parse.quote(mod_id)}%22"
+                f"&browsesort={sort}&section=readytouseitems"
+                f"&actualsort={sort}&p={page}"
+            )
+            print(f"[Search] Fetching page {page}/{max_pages} for '{mod_id}'...")
+
+            html_content, status_code, error = fetch_url(
+                url, timeout=20, owner=f"search:{mod_id}", should_cancel=should_cancel
+            )
+
+            if status_code == STATUS_CANCELLED:
+                return None, {"error": "Search cancelled.", "statusCode": status_code}
+
+            if status_code in (403, 429):
+                return None, {"error": "Steam blocked/rate-limited the request.", "statusCode": status_code}
+
+            if not html_content:
+                consecutive_empty += 1
+                if consecutive_empty >= max_consecutive_empty:
+                    break
+                time.sleep(1.0)
+                continue
 
-        if not html_content:
-            consecutive_empty += 1
-            if consecutive_empty >= max_consecutive_empty:
-                break
-            time.sleep(1.0)
-            continue
+            if "g-recaptcha" in html_content or "captcha" in html_content.lower():
+                return None, {"error": "Steam is showing a CAPTCHA challenge. Wait then retry.", "statusCode": 503}
 
-        if "g-recaptcha" in html_content or "captcha" in html_content.lower():
-            return None, {"error": "Steam is showing a CAPTCHA challenge. Wait then retry.", "statusCode": 503}
+            items, total_pages = _parse_workshop_items_from_html(html_content, "browse")
+            search_page_cache.put(mod_id, page, sort, items, total_pages)
 
-        items, total_pages = _parse_workshop_items_from_html(html_content)
+        server_events.publish("search_page", {
+            "modId": mod_id, "page": page, "maxPages": max_pages,
+            "totalPages": total_pages, "cached": cached is not None,
+        })
         page_found = 0
         for item in items:
+            if since and _crosses_watermark(item, since):
+                crossed_watermark = True
+                break
             if item["workshopId"] not in seen:
                 seen.add(item["workshopId"])
                 results.append(item)
                 page_found += 1
 
+        if crossed_watermark:
+            print(f"[Search] Reached previous run's watermark on page {page} - "
+                  f"{len(results)} new item(s) for '{mod_id}'")
+            break
+
         if page_found > 0:
             consecutive_empty = 0
             print(f"[Search] Found {page_found} items on page {page} (total: {len(results)})")
+            server_events.publish("search_items", {"modId": mod_id, "page": page, "found": page_found, "total": len(results)})
         else:
             consecutive_empty += 1
             print(f"[Search] No items on page {page} (empty count: {consecutive_empty})")
@@ -561,56 +1374,397 @@ def search_workshop(mod_id: str, max_pages: int = 5):
             break
 
     print(f"[Search] Complete - found {len(results)} total items for '{mod_id}'")
+    server_events.publish("search_done", {"modId": mod_id, "count": len(results)})
     return results, None
 
 def check_workshop_exists(workshop_id: str):
     """Check if workshop item exists using GetPublishedFileDetails API."""
-    data, error = _get_published_file_details([workshop_id])
-    if error or not data:
+    f, error = get_published_file_detail(workshop_id, field_class="existence")
+    if error or not f:
         return True, None  # Assume exists on error
-    files = data.get("response", {}).get("publishedfiledetails", [])
-    if not files:
-        return False, None
-    f = files[0]
     # result=9 means item doesn't exist / removed
     if f.get("result", 1) != 1:
         return False, None
     title = f.get("title", "").strip() or None
     return True, title
 
+def check_workshop_exists_batch(workshop_ids: list):
+    """Check many workshop items at once, STEAM_DETAILS_MAX_BATCH per call.
+
+    Returns one {workshopId, exists, title, result} dict per requested ID,
+    in request order. On an API error the affected chunk is reported as
+    existing (same "assume exists" rule as check_workshop_exists) with an
+    "error" field, so a failed check never marks something taken down.
+    """
+    ordered = []
+    seen = set()
+    for wid in workshop_ids:
+        wid = str(wid).strip()
+        if wid and wid not in seen:
+            seen.add(wid)
+            ordered.append(wid)
+
+    files = workshop_details_cache.get_many(ordered, "existence")
+    to_fetch = [wid for wid in ordered if wid not in files]
+    if files:
+        print(f"[Details] Batch existence check: {len(files)}/{len(ordered)} served from cache")
+
+    results = {}
+    for start in range(0, len(to_fetch), STEAM_DETAILS_MAX_BATCH):
+        chunk = to_fetch[start:start + STEAM_DETAILS_MAX_BATCH]
+        print(f"[Details] Batch existence check: {start + len(chunk)}/{len(to_fetch)}")
+        data, error = _get_published_file_details(chunk)
+        if error or not data:
+            for wid in chunk:
+                results[wid] = {"workshopId": wid, "exists": True, "title": None,
+                                "result": None, "error": error or "API request failed"}
+            continue
+        fetched = {str(f.get("publishedfileid", "")): f
+                   for f in data.get("response", {}).get("publishedfiledetails", [])}
+        workshop_details_cache.put_many({wid: f for wid, f in fetched.items() if wid in chunk})
+        files.update(fetched)
+
+    for wid in ordered:
+        if wid not in results:
+            f = files.get(wid, {})
+            result_code = f.get("result", 9)
+            # result=9 means item doesn't exist / removed
+            exists = result_code == 1
+            title = (f.get("title", "") or "").strip() or None if exists else None
+            results[wid] = {"workshopId": wid, "exists": exists, "title": title, "result": result_code}
+
+    return [results[wid] for wid in ordered]
+
+def lookup_published_file_details(workshop_ids: list):
+    """publishedfiledetails records for the in-process verifier.
+
+    Verification runs go through the same details cache and Web API rate
+    limiter as the UI's own lookups, so the two together can't overrun
+    Steam's quota. Raises on an API error; the verifier then treats that
+    chunk as unknown.
+    """
+    records = workshop_details_cache.get_many(workshop_ids, "existence")
+    to_fetch = [wid for wid in workshop_ids if wid not in records]
+    if to_fetch:
+        data, error = _get_published_file_details(to_fetch)
+        if error or not data:
+            raise Exception(error or "API request failed")
+        fetched = {str(f.get("publishedfileid", "")): f
+                   for f in data.get("response", {}).get("publishedfiledetails", [])}
+        workshop_details_cache.put_many(fetched)
+        records.update(fetched)
+    return list(records.values())
+
 def _get_published_file_details(workshop_ids: list):
     """Batch-fetch file details from ISteamRemoteStorage/GetPublishedFileDetails."""
-    steam_rate_limiter.wait_if_needed()
+    rate_limiter = steam_rate_limiters["webapi"]
+    try:
+        rate_limiter.wait_if_needed()
+    except RateLimitCancelled:
+        return None, "Cancelled while waiting for the rate limiter"
     params = {"itemcount": len(workshop_ids)}
     for i, wid in enumerate(workshop_ids):
         params[f"publishedfileids[{i}]"] = wid
     data = urllib.parse.urlencode(params).encode()
-    url = "https://api.steampowered.com/ISteamRemoteStorage/GetPublishedFileDetails/v1/"
-    req = urllib.request.Request(url, data=data, method="POST", headers={
-        "Content-Type": "application/x-www-form-urlencoded",
-        "User-Agent": "Mozilla/5.0",
-    })
+    url = f"{STEAM_API_URL}/ISteamRemoteStorage/GetPublishedFileDetails/v1/"
     try:
-        with urllib.request.urlopen(req, timeout=20) as resp:
-            steam_rate_limiter.reset_backoff()
-            return json.loads(resp.read().decode("utf-8", errors="ignore")), None
-    except urllib.error.HTTPError as e:
-        if e.code in (403, 429):
-            steam_rate_limiter.mark_rate_limited()
-        return None, f"HTTP {e.code}"
+        resp = steam_http_pool.request("POST", url, body=data, timeout=20, headers={
+            "Content-Type": "application/x-www-form-urlencoded",
+            "User-Agent": "Mozilla/5.0",
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
+        })
+        if resp.status != 200:
+            if resp.status in (403, 429):
+                rate_limiter.mark_rate_limited(resp.headers.get("Retry-After"))
+            return None, f"HTTP {resp.status}"
+        rate_limiter.mark_success()
+        return json.loads(resp.body.decode("utf-8", errors="ignore")), None
     except Exception as e:
         return None, str(e)
 
 
+# ============================================================================
+# PUBLISHED FILE DETAILS BATCHER
+# Coalesces concurrent single-item detail lookups into one multi-item call
+# ============================================================================
+# GetPublishedFileDetails takes up to this many publishedfileids[] per call.
+STEAM_DETAILS_MAX_BATCH = 100
+
+class PublishedFileDetailsBatcher:
+    """
+    Collects single-ID GetPublishedFileDetails lookups from concurrent
+    request threads for a short window and sends them as one itemcount=N
+    call, so N parallel lookups cost one rate-limited request instead of N.
+
+    Every caller still gets back just its own publishedfiledetails record.
+    IDs that arrive while a batch is waiting on the rate limiter simply
+    pile up into the next batch. A single flusher thread sends batches one
+    after another until nothing is pending; a full batch just wakes it
+    early rather than starting another thread.
+    """
+
+    def __init__(self, window_seconds=0.25, max_batch=STEAM_DETAILS_MAX_BATCH):
+        self.window = window_seconds
+        self.max_batch = max_batch
+        self.lock = Lock()
+        self.cond = Condition(self.lock)
+        self.pending = {}           # workshop_id -> [waiter, ...]
+        self.flushing = False
+
+    def get(self, workshop_id: str, timeout: float = 300):
+        """Return (file_details, error) for a single workshop item."""
+        waiter = {"event": Event(), "file": None, "error": None}
+        with self.cond:
+            self.pending.setdefault(workshop_id, []).append(waiter)
+            if len(self.pending) >= self.max_batch:
+                # Full batch already - no point waiting out the window.
+                self.cond.notify()
+            if not self.flushing:
+                self.flushing = True
+                Thread(target=self._flush_loop, daemon=True).start()
+
+        if not waiter["event"].wait(timeout):
+            return None, "Timed out waiting for batched details request"
+        return waiter["file"], waiter["error"]
+
+    def _flush_loop(self):
+        wait_window = True
+        try:
+            while True:
+                with self.cond:
+                    # Leftovers from an oversized batch have already waited
+                    # their window, so they go out straight away.
+                    if wait_window:
+                        deadline = time.time() + self.window
+                        while len(self.pending) < self.max_batch:
+                            remaining = deadline - time.time()
+                            if remaining <= 0:
+                                break
+                            self.cond.wait(remaining)
+                    if not self.pending:
+                        self.flushing = False
+                        return
+                    ids = list(self.pending.keys())[:self.max_batch]
+                    waiters = {wid: self.pending.pop(wid) for wid in ids}
+                    wait_window = not self.pending
+                try:
+                    self._flush(ids, waiters)
+                except Exception as e:
+                    # Those waiters are already off the queue - answer them
+                    # now rather than leaving them to time out.
+                    print(f"[Details] Batched lookup of {len(ids)} item(s) failed: {e}")
+                    for wlist in waiters.values():
+                        for waiter in wlist:
+                            if not waiter["event"].is_set():
+                                waiter["error"] = str(e) or type(e).__name__
+                                waiter["event"].set()
+        except BaseException:
+            with self.cond:
+                self.flushing = False
+            raise
+
+    def _flush(self, ids, waiters):
+        if len(ids) > 1:
+            print(f"[Details] Coalesced {len(ids)} lookups into one request")
+
+        data, error = _get_published_file_details(ids)
+        files = {}
+        if data and not error:
+            for f in data.get("response", {}).get("publishedfiledetails", []):
+                files[str(f.get("publishedfileid", ""))] = f
+
+        for wid, wlist in waiters.items():
+            for waiter in wlist:
+                if error or not data:
+                    waiter["error"] = error or "API request failed"
+                else:
+                    # Steam omits nothing in practice, but treat a missing
+                    # record the same as result=9 (not found / removed).
+                    waiter["file"] = files.get(wid, {"publishedfileid": wid, "result": 9})
+                waiter["event"].set()
+
+details_batcher = PublishedFileDetailsBatcher()
+
+
+# ============================================================================
+# WORKSHOP DETAILS CACHE
+# Persists publishedfiledetails records in SQLite so repeat lookups skip Steam
+# ============================================================================
+class WorkshopDetailsCache:
+    """
+    On-disk cache of parsed publishedfiledetails records, keyed by workshop
+    ID, stored under DATA_DIR so it survives restarts.
+
+    Freshness depends on what the caller needs:
+    - "existence" lookups (is it still up?) only trust records younger than
+      existence_ttl - takedowns are exactly what we're watching for.
+    - "details" lookups (title, description, creator) trust records up to
+      details_ttl, since those rarely change. A record saying the item is
+      gone is still only trusted for existence_ttl.
+
+    Once the table grows past max_entries, the least recently used rows
+    are evicted. Hit/miss counters are kept for /api/cache/stats.
+
+    get_many() serves a whole batch with one SELECT and records the
+    access times of all its hits in a single UPDATE + commit, so a large
+    batch lookup costs one write rather than one per ID.
+    """
+
+    # Stay well under SQLite's bound-parameter limit for the IN (...) lists.
+    QUERY_CHUNK = 500
+
+    def __init__(self, db_path: Path, existence_ttl=600, details_ttl=7 * 86400, max_entries=5000):
+        self.db_path = db_path
+        self.existence_ttl = existence_ttl
+        self.details_ttl = details_ttl
+        self.max_entries = max_entries
+        self.lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        try:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            self.db = sqlite3.connect(str(db_path), check_same_thread=False)
+        except (OSError, sqlite3.Error) as e:
+            print(f"[Cache] Could not open {db_path} ({e}) - using an in-memory cache instead")
+            self.db = sqlite3.connect(":memory:", check_same_thread=False)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS workshop_details ("
+            " workshop_id TEXT PRIMARY KEY,"
+            " record TEXT NOT NULL,"
+            " fetched_at REAL NOT NULL,"
+            " last_access REAL NOT NULL)"
+        )
+        self.db.execute("CREATE INDEX IF NOT EXISTS idx_details_last_access ON workshop_details(last_access)")
+        self.db.commit()
+
+    def get(self, workshop_id: str, field_class: str = "details"):
+        """Return the cached record if it's fresh enough for field_class, else None."""
+        return self.get_many([workshop_id], field_class).get(workshop_id)
+
+    def get_many(self, workshop_ids: list, field_class: str = "details"):
+        """{workshop ID: record} for every ID whose cached record is fresh
+        enough for field_class; IDs without one are simply left out."""
+        ids = list(dict.fromkeys(workshop_ids))
+        found = {}
+        now = time.time()
+        with self.lock:
+            try:
+                for start in range(0, len(ids), self.QUERY_CHUNK):
+                    chunk = ids[start:start + self.QUERY_CHUNK]
+                    rows = self.db.execute(
+                        "SELECT workshop_id, record, fetched_at FROM workshop_details"
+                        f" WHERE workshop_id IN ({','.join('?' * len(chunk))})",
+                        chunk,
+                    ).fetchall()
+                    for wid, raw, fetched_at in rows:
+                        try:
+                            record = json.loads(raw)
+                        except ValueError as e:
+                            print(f"[Cache] Unreadable record for {wid}: {e}")
+                            continue
+                        ttl = self.details_ttl
+                        if field_class == "existence" or record.get("result", 1) != 1:
+                            ttl = self.existence_ttl
+                        if now - fetched_at < ttl:
+                            found[wid] = record
+                if found:
+                    self.db.executemany(
+                        "UPDATE workshop_details SET last_access = ? WHERE workshop_id = ?",
+                        [(now, wid) for wid in found],
+                    )
+                    self.db.commit()
+            except sqlite3.Error as e:
+                print(f"[Cache] Read failed for {len(ids)} item(s): {e}")
+                found = {}
+            self.hits += len(found)
+            self.misses += len(ids) - len(found)
+        return found
+
+    def put(self, workshop_id: str, record: dict):
+        self.put_many({workshop_id: record})
+
+    def put_many(self, records: dict):
+        if not records:
+            return
+        now = time.time()
+        with self.lock:
+            try:
+                self.db.executemany(
+                    "INSERT OR REPLACE INTO workshop_details (workshop_id, record, fetched_at, last_access)"
+                    " VALUES (?, ?, ?, ?)",
+                    [(wid, json.dumps(rec), now, now) for wid, rec in records.items()],
+                )
+                count = self.db.execute("SELECT COUNT(*) FROM workshop_details").fetchone()[0]
+                if count > self.max_entries:
+                    excess = count - self.max_entries
+                    self.db.execute(
+                        "DELETE FROM workshop_details WHERE workshop_id IN ("
+                        " SELECT workshop_id FROM workshop_details ORDER BY last_access ASC LIMIT ?)",
+                        (excess,),
+                    )
+                    self.evictions += excess
+                self.db.commit()
+            except sqlite3.Error as e:
+                print(f"[Cache] Write failed: {e}")
+
+    def stats(self):
+        with self.lock:
+            try:
+                size = self.db.execute("SELECT COUNT(*) FROM workshop_details").fetchone()[0]
+            except sqlite3.Error:
+                size = None
+            total = self.hits + self.misses
+            return {
+                "entries": size,
+                "maxEntries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hitRate": round(self.hits / total, 3) if total else None,
+                "existenceTtlSeconds": self.existence_ttl,
+                "detailsTtlSeconds": self.details_ttl,
+            }
+
+def _create_workshop_details_cache():
+    """Build the cache from the optional [Cache] section of verify_config.ini."""
+    config = load_verify_config()
+    def _num(option, default):
+        try:
+            return config.getfloat('Cache', option, fallback=default)
+        except ValueError:
+            return default
+    return WorkshopDetailsCache(
+        WORKSHOP_CACHE_FILE,
+        existence_ttl=_num('existence_ttl_seconds', 600),
+        details_ttl=_num('details_ttl_seconds', 7 * 86400),
+        max_entries=int(_num('max_entries', 5000)),
+    )
+
+workshop_details_cache = _create_workshop_details_cache()
+
+def get_published_file_detail(workshop_id: str, field_class: str = "details"):
+    """Single-item GetPublishedFileDetails, served from the cache when fresh
+    enough for field_class ("existence" or "details"), else via the batcher."""
+    workshop_id = str(workshop_id)
+    cached = workshop_details_cache.get(workshop_id, field_class)
+    if cached is not None:
+        return cached, None
+    f, error = details_batcher.get(workshop_id)
+    if f and not error:
+        workshop_details_cache.put(workshop_id, f)
+    return f, error
+
+
 def extract_mod_id(workshop_id: str):
     """Extract Mod ID from a workshop item's description via API."""
-    data, error = _get_published_file_details([workshop_id])
-    if error or not data:
+    f, error = get_published_file_detail(workshop_id)
+    if error or not f:
         return None, error or "API request failed"
-    files = data.get("response", {}).get("publishedfiledetails", [])
-    if not files or files[0].get("result", 1) != 1:
+    if f.get("result", 1) != 1:
         return None, "Workshop item not found or removed"
-    description = files[0].get("description", "") or ""
+    description = f.get("description", "") or ""
     patterns = [
         r'Mod\s*ID:\s*([A-Za-z0-9_\-]+)',
         r'ModID:\s*([A-Za-z0-9_\-]+)',
@@ -624,23 +1778,21 @@ def extract_mod_id(workshop_id: str):
 
 def get_workshop_full_details(workshop_id: str):
     """Fetch full workshop item details via Steam API."""
-    data, error = _get_published_file_details([workshop_id])
-    if error or not data:
+    f, error = get_published_file_detail(workshop_id)
+    if error or not f:
         return {
             "exists": True,
             "workshopId": workshop_id,
             "title": None, "author": None, "modIds": [],
             "error": error or "API request failed"
         }
-    files = data.get("response", {}).get("publishedfiledetails", [])
-    if not files or files[0].get("result", 1) != 1:
+    if f.get("result", 1) != 1:
         return {
             "exists": False,
             "workshopId": workshop_id,
             "error": "Workshop item not found or removed"
         }
 
-    f = files[0]
     title = f.get("title", "").strip() or None
     # creator_appid steam_id -> we can surface the creator's steamid
     creator = str(f.get("creator", "") or "")
@@ -670,11 +1822,12 @@ def get_workshop_full_details(workshop_id: str):
         "modIds": mod_ids
     }
 
-def search_profile_workshop(profile_input: str, max_pages: int = 10):
+def search_profile_workshop(profile_input: str, max_pages: int = 10, should_cancel=None):
     """Fetch workshop items from a Steam profile page.
 
     Parses Steam's new SSR JSON-embedded HTML. Accepts a Steam64 ID,
-    vanity URL name, or full steamcommunity.com URL.
+    vanity URL name, or full steamcommunity.com URL. should_cancel works
+    as for search_workshop.
     """
     profile_id = profile_input.strip()
 
@@ -697,13 +1850,18 @@ def search_profile_workshop(profile_input: str, max_pages: int = 10):
         # accepts (9 is the default) - cuts the number of pages needed
         # for profiles with a lot of submissions roughly 3x.
         if profile_id.isdigit():
-            url = f"https://steamcommunity.com/profiles/{profile_id}/myworkshopfiles/?appid={PZ_APP_ID}&p={page}&numperpage=30"
+            url = f"{STEAM_COMMUNITY_URL}/profiles/{profile_id}/myworkshopfiles/?appid={PZ_APP_ID}&p={page}&numperpage=30"
         else:
-            url = f"https://steamcommunity.com/id/{profile_id}/myworkshopfiles/?appid={PZ_APP_ID}&p={page}&numperpage=30"
+            url = f"{STEAM_COMMUNITY_URL}/id/{profile_id}/myworkshopfiles/?appid={PZ_APP_ID}&p={page}&numperpage=30"
 
         print(f"[Profile] Fetching page {page}/{max_pages} from {profile_id}...")
 
-        html_content, status_code, error = fetch_url(url, timeout=20)
+        html_content, status_code, error = fetch_url(
+            url, timeout=20, owner=f"profile:{profile_id}", should_cancel=should_cancel
+        )
+
+        if status_code == STATUS_CANCELLED:
+            return None, {"error": "Profile fetch cancelled.", "statusCode": status_code}
 
         if status_code in (403, 429):
             rate_limit_count += 1
@@ -723,7 +1881,7 @@ def search_profile_workshop(profile_input: str, max_pages: int = 10):
         if "g-recaptcha" in html_content or "captcha" in html_content.lower():
             return None, {"error": "Steam is showing a CAPTCHA challenge. Wait then retry.", "statusCode": 503}
 
-        items, total_pages = _parse_workshop_items_from_html(html_content)
+        items, total_pages = _parse_workshop_items_from_html(html_content, "profile")
         page_found = 0
         for item in items:
             if item["workshopId"] not in seen:
@@ -745,6 +1903,308 @@ def search_profile_workshop(profile_input: str, max_pages: int = 10):
     print(f"[Profile] Complete - found {len(results)} total items from profile")
     return results, None
 
+# ============================================================================
+# SEARCH JOB SCHEDULER
+# Runs whole "Run All Searches" batches server-side and persists them to disk
+# ============================================================================
+class SearchJobScheduler:
+    """
+    Accepts a whole batch of mod searches as one job, runs it in a
+    background thread against the shared rate limiter, and writes the job
+    (queue position and per-mod results) to disk after every mod. Closing
+    the browser tab no longer loses the batch, and a server restart picks
+    up any queued or half-finished job where it left off.
+
+    Jobs run one at a time, in submission order. Each job is one JSON file
+    in jobs_dir so a write only ever touches that job's state.
+
+    Finished jobs only keep their summary in memory; per-mod items are read
+    back from the job file when results are asked for. Only the newest
+    MAX_FINISHED_JOBS finished jobs are kept, and none older than
+    FINISHED_JOB_TTL_SECONDS - older ones are deleted from disk.
+    """
+
+    MAX_RATE_LIMIT_RETRIES = 3
+    RATE_LIMIT_PAUSE_SECONDS = 60
+    MAX_FINISHED_JOBS = 50
+    FINISHED_JOB_TTL_SECONDS = 7 * 86400
+    FINISHED_STATUSES = ("complete", "cancelled", "error")
+
+    def __init__(self, jobs_dir: Path):
+        self.jobs_dir = jobs_dir
+        self.lock = Lock()
+        self.wakeup = Event()
+        self.jobs = OrderedDict()  # job_id -> job dict
+        self.items_on_disk = set()  # finished jobs whose items weren't kept in memory
+        self.worker = None
+
+    def start(self):
+        """Load persisted jobs and start the background worker (idempotent)."""
+        with self.lock:
+            if self.worker is not None:
+                return
+            self._load()
+            self.worker = Thread(target=self._run, daemon=True)
+            self.worker.start()
+        self.wakeup.set()
+
+    def _load(self):
+        if not self.jobs_dir.exists():
+            return
+        for tmp in self.jobs_dir.glob("job_*.json.tmp"):
+            # Left behind by a write that was interrupted before os.replace
+            tmp.unlink(missing_ok=True)
+        loaded = []
+        for job_file in self.jobs_dir.glob("job_*.json"):
+            try:
+                with open(job_file, "r", encoding="utf-8") as f:
+                    loaded.append(json.load(f))
+            except Exception as e:
+                print(f"[Jobs] Skipping unreadable job file {job_file.name}: {e}")
+        for job in sorted(loaded, key=lambda j: j.get("createdAt", "")):
+            if job.get("status") == "running":
+                # Interrupted by a restart - finished mods are kept, the
+                # rest run again.
+                job["status"] = "queued"
+            self.jobs[job["id"]] = job
+            if job["status"] in self.FINISHED_STATUSES:
+                self._drop_items(job)
+        self._prune()
+        resumable = sum(1 for j in self.jobs.values() if j["status"] == "queued")
+        if self.jobs:
+            print(f"[Jobs] Loaded {len(self.jobs)} job(s) from disk, {resumable} to resume")
+
+    def _read(self, job_id: str):
+        try:
+            with open(self.jobs_dir / f"{job_id}.json", "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[Jobs] Could not read {job_id} from disk: {e}")
+            return None
+
+    def _drop_items(self, job: dict):
+        """Forget a finished job's items; results() reads them back from disk. Call with self.lock held."""
+        for mod in job["mods"]:
+            mod.pop("items", None)
+        self.items_on_disk.add(job["id"])
+
+    def _finish(self, job: dict, status: str):
+        """Mark a job finished, persist it and prune old jobs. Call with self.lock held."""
+        job["status"] = status
+        job["finishedAt"] = datetime.utcnow().isoformat() + "Z"
+        self._save(job)
+        self._drop_items(job)
+        self._prune()
+
+    def _prune(self):
+        """Delete finished jobs past the age or count limit. Call with self.lock held."""
+        finished = sorted(
+            (j for j in self.jobs.values() if j["status"] in self.FINISHED_STATUSES),
+            key=lambda j: j.get("finishedAt") or j.get("createdAt", ""),
+            reverse=True,
+        )
+        cutoff = (datetime.utcnow() - timedelta(seconds=self.FINISHED_JOB_TTL_SECONDS)).isoformat() + "Z"
+        expired = [
+            j for i, j in enumerate(finished)
+            if i >= self.MAX_FINISHED_JOBS or (j.get("finishedAt") or j.get("createdAt", "")) < cutoff
+        ]
+        for job in expired:
+            self.jobs.pop(job["id"], None)
+            self.items_on_disk.discard(job["id"])
+            try:
+                (self.jobs_dir / f"{job['id']}.json").unlink(missing_ok=True)
+            except OSError as e:
+                print(f"[Jobs] Failed to delete {job['id']}: {e}")
+        if expired:
+            print(f"[Jobs] Pruned {len(expired)} old finished job(s)")
+
+    def _save(self, job: dict):
+        """Atomically write one job's state to disk. Call with self.lock held."""
+        try:
+            self.jobs_dir.mkdir(parents=True, exist_ok=True)
+            path = self.jobs_dir / f"{job['id']}.json"
+            tmp = path.with_suffix(".json.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(job, f, ensure_ascii=False)
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"[Jobs] Failed to persist {job['id']}: {e}")
+
+    def submit(self, mods: list, max_pages: int = 5, force_refresh: bool = False):
+        job_id = f"job_{int(time.time() * 1000)}_{os.urandom(3).hex()}"
+        job = {
+            "id": job_id,
+            "status": "queued",
+            "createdAt": datetime.utcnow().isoformat() + "Z",
+            "finishedAt": None,
+            "maxPages": max_pages,
+            "forceRefresh": force_refresh,
+            "error": None,
+            "mods": [
+                {"modId": m["modId"], "since": m.get("since"), "status": "pending",
+                 "count": 0, "items": [], "watermark": None, "error": None}
+                for m in mods
+            ],
+        }
+        with self.lock:
+            self.jobs[job_id] = job
+            self._save(job)
+        print(f"[Jobs] Queued {job_id} with {len(mods)} mod search(es)")
+        self.wakeup.set()
+        return self.summary(job_id)
+
+    def cancel(self, job_id: str):
+        with self.lock:
+            job = self.jobs.get(job_id)
+            if not job:
+                return None
+            if job["status"] in ("queued", "running"):
+                # The search in flight is abandoned, so that mod never ran
+                for mod in job["mods"]:
+                    if mod["status"] == "running":
+                        mod["status"] = "pending"
+                self._finish(job, "cancelled")
+                server_events.publish("job_finished", {"jobId": job_id, "status": "cancelled"})
+        self.wakeup.set()
+        return self.summary(job_id)
+
+    def summary(self, job_id: str):
+        with self.lock:
+            job = self.jobs.get(job_id)
+            if not job:
+                return None
+            done = sum(1 for m in job["mods"] if m["status"] in ("done", "error"))
+            current = next((m["modId"] for m in job["mods"] if m["status"] == "running"), None)
+            return {
+                "id": job["id"],
+                "status": job["status"],
+                "createdAt": job["createdAt"],
+                "finishedAt": job["finishedAt"],
+                "error": job["error"],
+                "total": len(job["mods"]),
+                "completed": done,
+                "failed": sum(1 for m in job["mods"] if m["status"] == "error"),
+                "current": current,
+            }
+
+    def list(self):
+        with self.lock:
+            job_ids = list(self.jobs.keys())
+        return [self.summary(job_id) for job_id in job_ids]
+
+    def results(self, job_id: str):
+        with self.lock:
+            job = self.jobs.get(job_id)
+            if not job:
+                return None
+            if job_id not in self.items_on_disk:
+                return self._results(job)
+        # Finished and immutable - safe to read without holding the lock
+        job = self._read(job_id)
+        return self._results(job) if job else None
+
+    @staticmethod
+    def _results(job: dict):
+        return {
+            "id": job["id"],
+            "status": job["status"],
+            "results": {
+                m["modId"]: {k: m.get(k, [] if k == "items" else None)
+                             for k in ("status", "count", "items", "watermark", "error")}
+                for m in job["mods"]
+            },
+        }
+
+    def _next_work(self):
+        """Return (job, mod) for the next pending search, or (None, None)."""
+        with self.lock:
+            # Finishing a job can prune others, so walk a snapshot
+            for job in list(self.jobs.values()):
+                if job["status"] not in ("queued", "running"):
+                    continue
+                for mod in job["mods"]:
+                    if mod["status"] in ("pending", "running"):
+                        job["status"] = "running"
+                        mod["status"] = "running"
+                        self._save(job)
+                        return job, mod
+                self._finish(job, "complete")
+                print(f"[Jobs] {job['id']} complete")
+                server_events.publish("job_finished", {"jobId": job["id"], "status": "complete"})
+        return None, None
+
+    def _publish_progress(self, job: dict, mod: dict):
+        server_events.publish("job_progress", {
+            "jobId": job["id"], "modId": mod["modId"], "modStatus": mod["status"],
+            "completed": sum(1 for m in job["mods"] if m["status"] in ("done", "error")),
+            "total": len(job["mods"]),
+        })
+
+    def _run(self):
+        rate_limited_streak = 0
+        while True:
+            job, mod = self._next_work()
+            if job is None:
+                self.wakeup.wait()
+                self.wakeup.clear()
+                continue
+
+            try:
+                since = parse_search_watermark(mod.get("since"))
+                items, error = search_workshop(
+                    mod["modId"], job["maxPages"], force_refresh=job["forceRefresh"], since=since,
+                    should_cancel=lambda: job["status"] == "cancelled",
+                )
+
+                with self.lock:
+                    if job["status"] == "cancelled":
+                        # cancel() already reset this mod and wrote the job out
+                        continue
+
+                    if error and error.get("statusCode") in (403, 429, 503):
+                        rate_limited_streak += 1
+                        if rate_limited_streak >= self.MAX_RATE_LIMIT_RETRIES:
+                            # Steam keeps refusing - stop here instead of burning
+                            # the whole queue; resubmitting picks up the rest.
+                            mod["status"] = "pending"
+                            job["error"] = error.get("error")
+                            self._finish(job, "error")
+                            server_events.publish("job_finished", {"jobId": job["id"], "status": "error", "error": job["error"]})
+                            rate_limited_streak = 0
+                            continue
+                        mod["status"] = "pending"
+                        self._save(job)
+                    elif error:
+                        mod["status"] = "error"
+                        mod["error"] = error.get("error")
+                        self._save(job)
+                    else:
+                        rate_limited_streak = 0
+                        mod["status"] = "done"
+                        mod["items"] = items
+                        mod["count"] = len(items)
+                        mod["watermark"] = format_search_watermark(make_search_watermark(items, since))
+                        mod["error"] = None
+                        self._save(job)
+                    self._publish_progress(job, mod)
+            except Exception as e:
+                # One bad search must not take the only worker thread down
+                # with it - fail this mod and move on to the next.
+                print(f"[Jobs] Search for '{mod['modId']}' in {job['id']} failed: {e}")
+                with self.lock:
+                    if job["status"] != "cancelled":
+                        mod["status"] = "error"
+                        mod["error"] = str(e) or type(e).__name__
+                        self._save(job)
+                        self._publish_progress(job, mod)
+                continue
+
+            if rate_limited_streak:
+                print(f"[Jobs] Steam refused '{mod['modId']}', pausing {self.RATE_LIMIT_PAUSE_SECONDS}s before retrying")
+                time.sleep(self.RATE_LIMIT_PAUSE_SECONDS)
+
+search_job_scheduler = SearchJobScheduler(SEARCH_JOBS_DIR)
+
 # VERIFY state
 verification_lock = Lock()
 verification_state = {
@@ -755,8 +2215,55 @@ verification_state = {
     "error": None
 }
 
+class VerificationWorker:
+    """Long-lived thread that runs verify_dmca in-process.
+
+    verify_dmca is imported once, the first time a job arrives, and the
+    same thread picks up every later run from a queue. Entries go in as
+    plain dicts and come back with their 'verification' blocks filled in -
+    no temp export file, no interpreter cold start (which in the frozen
+    build also meant re-unpacking the whole bundle) per "Verify" click.
+    """
+
+    TIMEOUT_SECONDS = 600  # 10 minute cap per run, as before
+
+    def __init__(self):
+        self.jobs = deque()
+        self.cond = Condition()
+        self.thread = None
+        self.module = None
+
+    def submit(self, payload: dict):
+        with self.cond:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = Thread(target=self._run, daemon=True, name="verify-worker")
+                self.thread.start()
+            self.jobs.append(payload)
+            self.cond.notify()
+
+    def load_module(self):
+        """Import verify_dmca once and point it at the server's config file."""
+        if self.module is None:
+            if str(VERIFY_DIR) not in sys.path:
+                sys.path.insert(0, str(VERIFY_DIR))
+            import verify_dmca
+            verify_dmca.CONFIG_FILE = VERIFY_CONFIG_FILE
+            self.module = verify_dmca
+            print(f"[VERIFY] Loaded verifier module from {verify_dmca.__file__}")
+        return self.module
+
+    def _run(self):
+        while True:
+            with self.cond:
+                while not self.jobs:
+                    self.cond.wait()
+                payload = self.jobs.popleft()
+            start_verification_job(payload)
+
+verification_worker = VerificationWorker()
+
 def start_verification_job(payload: dict):
-    """Background job to run verification and track progress"""
+    """Run one verification on the worker thread and track progress"""
     with verification_lock:
         verification_state["running"] = True
         verification_state["should_stop"] = False
@@ -764,6 +2271,7 @@ def start_verification_job(payload: dict):
         verification_state["results"] = None
         verification_state["error"] = None
 
+    verifier = None
     try:
         tracked_mods = payload.get("trackedMods", []) or []
         entries = payload.get("entries", []) or []
@@ -772,141 +2280,59 @@ def start_verification_job(payload: dict):
 
         if not entries:
             _set_progress("error", {"message": "No DMCA entries provided"}, done=True)
-            with verification_lock:
-                verification_state["running"] = False
             return
 
-        # Build export format
-        export = {
-            "exportedAt": datetime.utcnow().isoformat() + "Z",
-            "exportVersion": 1,
-            "trackedMods": tracked_mods,
-            "entries": entries
-        }
-
-        # Write temp JSON
-        os.makedirs(TMP_VERIFY_DIR, exist_ok=True)
-        tmp_in = TMP_VERIFY_DIR / f"dmca_export_{int(time.time())}.json"
-        with open(tmp_in, "w", encoding="utf-8") as f:
-            json.dump(export, f, indent=2, ensure_ascii=False)
+        depot_path = find_depotdownloader()
+        if not depot_path:
+            raise Exception("DepotDownloader not found")
 
-        print(f"[VERIFY] Wrote input file: {tmp_in} ({tmp_in.stat().st_size} bytes)")
+        verifier = verification_worker.load_module()
 
-        # Find verifier - use DepotDownloader version
-        verifier_path = VERIFY_DIR / "verify_dmca.py"
-        if not verifier_path.exists():
-            verifier_path = ROOT_DIR / "verify_dmca.py"
-        if not verifier_path.exists():
-            verifier_path = Path(__file__).parent / "verify" / "verify_dmca.py"
-        if not verifier_path.exists():
-            verifier_path = Path(__file__).parent / "verify_dmca.py"
-
-        if not verifier_path.exists():
-            raise FileNotFoundError(f"Could not find verify_dmca.py. Checked: {VERIFY_DIR}, {ROOT_DIR}, {Path(__file__).parent}")
-
-        print(f"[VERIFY] Using verifier: {verifier_path}")
-        print(f"[VERIFY] Python executable: {sys.executable}")
-
-        # Use the same Python interpreter
-        cmd = [sys.executable, str(verifier_path), "--dmca-export", str(tmp_in)]
+        os.makedirs(TMP_VERIFY_DIR, exist_ok=True)
+        log_path = TMP_VERIFY_DIR / f"verify_{int(time.time())}.log"
+        verifier.open_log(log_path)
+        print(f"[VERIFY] Logging to {log_path}")
 
-        print(f"[VERIFY] Running command: {' '.join(cmd)}")
-        _set_progress("running", {"message": "Starting verification process..."}, done=False)
+        _set_progress("running", {"message": "Starting verification..."}, done=False)
 
-        # Set environment to force UTF-8 encoding
-        env = os.environ.copy()
-        env['PYTHONIOENCODING'] = 'utf-8'
+        # The verifier works on this dict in place - entries are copied so
+        # the caller's payload isn't mutated half-way through a run.
+        dmca_data = {
+            "trackedMods": tracked_mods,
+            "entries": [dict(e) for e in entries],
+        }
 
-        # Spawn process
         start_time = time.time()
-        proc = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            encoding='utf-8',
-            errors='replace',  # Replace encoding errors with ?
-            bufsize=1,
-            universal_newlines=True,
-            env=env
+        deadline = start_time + VerificationWorker.TIMEOUT_SECONDS
+        timed_out = Event()
+        def should_stop():
+            if time.time() > deadline:
+                timed_out.set()
+                return True
+            return _should_stop()
+
+        partial_results = {}
+        verifier.run_verification(
+            dmca_data, depot_path,
+            on_event=lambda event, **data: _apply_verifier_event(dict(data, event=event), entries, partial_results),
+            should_stop=should_stop,
+            force=bool(payload.get("force")),
+            details_lookup=lookup_published_file_details,
         )
 
-        # Read output line by line
-        stdout_lines = []
-        stderr_lines = []
-
-        try:
-            stdout, stderr = proc.communicate(timeout=600)  # 10 minute timeout
-            stdout_lines = stdout.splitlines() if stdout else []
-            stderr_lines = stderr.splitlines() if stderr else []
-        except subprocess.TimeoutExpired:
-            proc.kill()
-            stdout, stderr = proc.communicate()
-            stdout_lines = stdout.splitlines() if stdout else []
-            stderr_lines = stderr.splitlines() if stderr else []
+        if timed_out.is_set():
             raise Exception("Verification timed out after 10 minutes")
-        except Exception as e:
-            # Handle any other communication errors
-            print(f"[VERIFY] Communication error: {e}")
-            raise
 
         elapsed = time.time() - start_time
-        print(f"[VERIFY] Process completed in {elapsed:.1f}s with return code: {proc.returncode}")
-
-        # Log all output
-        if stdout_lines:
-            print(f"[VERIFY] STDOUT ({len(stdout_lines)} lines):")
-            for line in stdout_lines:
-                print(f"  {line}")
-
-        if stderr_lines:
-            print(f"[VERIFY] STDERR ({len(stderr_lines)} lines):")
-            for line in stderr_lines:
-                print(f"  {line}")
-
-        if proc.returncode != 0:
-            error_msg = "\n".join(stderr_lines) if stderr_lines else "Process failed with no error output"
-            raise Exception(f"Verification process failed (exit code {proc.returncode}): {error_msg}")
-
-        # Read back the modified file
-        if not tmp_in.exists():
-            raise FileNotFoundError(f"Output file not found: {tmp_in}")
-
-        print(f"[VERIFY] Reading output file: {tmp_in} ({tmp_in.stat().st_size} bytes)")
-
-        with open(tmp_in, "r", encoding="utf-8") as f:
-            output_data = json.load(f)
-
-        verified_entries = output_data.get("entries", [])
-        print(f"[VERIFY] Loaded {len(verified_entries)} verified entries from output file")
-
-        if not verified_entries:
-            raise Exception("No entries found in verification output - verification may have failed")
-
-        # Check if any entries actually have verification data
+        verified_entries = dmca_data["entries"]
         verified_count = sum(1 for e in verified_entries if e.get("verification"))
-        print(f"[VERIFY] {verified_count}/{len(verified_entries)} entries have verification data")
-
-        # Build summary from entries
-        summary = {"high": 0, "medium": 0, "low": 0, "none": 0, "takenDown": 0}
-        for entry in verified_entries:
-            v = entry.get("verification", {})
-            if v.get("takenDown"):
-                summary["takenDown"] += 1
-            elif v.get("verified"):
-                pct = v.get("matchPercentage", 0)
-                if pct >= 75:
-                    summary["high"] += 1
-                elif pct >= 50:
-                    summary["medium"] += 1
-                elif pct >= 25:
-                    summary["low"] += 1
-                else:
-                    summary["none"] += 1
+        print(f"[VERIFY] Completed in {elapsed:.1f}s, {verified_count}/{len(verified_entries)} entries have verification data")
+
+        summary = _summarize_verification(verified_entries)
 
         print(f"[VERIFY] Summary: {summary}")
 
-        # CRITICAL FIX: Set results BEFORE setting progress to complete
+        # Set results BEFORE setting progress to complete
         with verification_lock:
             verification_state["results"] = {
                 "entries": verified_entries,
@@ -914,7 +2340,6 @@ def start_verification_job(payload: dict):
             }
 
         _set_progress("complete", {"summary": summary}, done=True)
-        print(f"[VERIFY] Results set in state, entries count: {len(verified_entries)}")
 
     except Exception as e:
         import traceback
@@ -926,10 +2351,75 @@ def start_verification_job(payload: dict):
             verification_state["error"] = str(e)
 
     finally:
+        if verifier is not None:
+            verifier.close_log()
         with verification_lock:
             verification_state["running"] = False
 
 
+def _summarize_verification(entries: list):
+    """Count entries per match band, the same way the UI's summary does."""
+    summary = {"high": 0, "medium": 0, "low": 0, "none": 0, "takenDown": 0}
+    for entry in entries:
+        v = entry.get("verification", {})
+        if v.get("takenDown"):
+            summary["takenDown"] += 1
+        elif v.get("verified"):
+            pct = v.get("matchPercentage", 0)
+            if pct >= 75:
+                summary["high"] += 1
+            elif pct >= 50:
+                summary["medium"] += 1
+            elif pct >= 25:
+                summary["low"] += 1
+            else:
+                summary["none"] += 1
+    return summary
+
+def _apply_verifier_event(event: dict, entries: list, partial_results: dict):
+    """Turn one verify_dmca JSON-lines event into progress/partial results.
+
+    entry_result events are merged into verification_state["results"]
+    right away (flagged "partial"), so results for finished entries are
+    usable before the whole run is done.
+    """
+    kind = event.get("event")
+    if kind == "item_started":
+        _set_progress("download", {
+            "current": event.get("current"), "total": event.get("total"),
+            "name": event.get("name"), "workshopId": event.get("workshopId"),
+        })
+    elif kind in ("manifest_cached", "manifest_downloaded", "manifest_error", "item_removed"):
+        server_events.publish("verify_manifest", {
+            "workshopId": event.get("workshopId"), "status": kind,
+            "manifest": event.get("manifest"), "error": event.get("error"),
+        })
+    elif kind == "manifest_read":
+        _set_progress("read_manifest", {
+            "current": event.get("current"), "total": event.get("total"),
+            "name": event.get("workshopId"),
+        })
+    elif kind == "entry_result":
+        ws_id = str(event.get("workshopId"))
+        partial_results[ws_id] = event.get("verification") or {}
+        partial_entries = [
+            dict(e, verification=partial_results[str(e.get("workshopId"))])
+            for e in entries if str(e.get("workshopId")) in partial_results
+        ]
+        with verification_lock:
+            verification_state["results"] = {
+                "entries": partial_entries,
+                "summary": _summarize_verification(partial_entries),
+                "partial": True,
+            }
+        server_events.publish("verify_item_done", {
+            "workshopId": ws_id, "verification": partial_results[ws_id],
+        })
+        _set_progress("verify_item", {
+            "current": event.get("current"), "total": event.get("total"),
+            "title": event.get("title"),
+        })
+
 def _set_progress(type_: str, payload: dict, done: bool = False):
     with verification_lock:
         verification_state["progress"] = {
@@ -940,6 +2430,7 @@ def _set_progress(type_: str, payload: dict, done: bool = False):
         }
         if type_ == "error":
             verification_state["error"] = payload
+    server_events.publish("verify_progress", {"type": type_, "payload": payload, "done": done})
 
 def _should_stop():
     with verification_lock:
@@ -953,6 +2444,17 @@ class RequestHandler(BaseHTTPRequestHandler):
     def log_message(self, format, *args):
         print(f"[HTTP] {args[0]}")
 
+    def client_disconnected(self):
+        """True once the client has closed its end of the connection (tab
+        closed, fetch aborted) - a readable socket with nothing to read."""
+        try:
+            readable, _, _ = select.select([self.connection], [], [], 0)
+            if not readable:
+                return False
+            return self.connection.recv(1, socket.MSG_PEEK) == b""
+        except (OSError, ValueError):
+            return True
+
     def send_json(self, data: dict, status: int = 200):
         response = json.dumps(data).encode("utf-8")
         self.send_response(status)
@@ -962,6 +2464,43 @@ class RequestHandler(BaseHTTPRequestHandler):
         self.end_headers()
         self.wfile.write(response)
 
+    def stream_events(self, query: dict):
+        """Serve /api/events as a Server-Sent Events stream until the client goes away."""
+        last_id_raw = self.headers.get("Last-Event-ID") or query.get("lastEventId", [""])[0]
+        try:
+            last_id = int(last_id_raw)
+        except (TypeError, ValueError):
+            # Fresh connection: only events from now on.
+            last_id = server_events.latest_id()
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "keep-alive")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+
+        try:
+            self.wfile.write(b"retry: 3000\n\n")
+            self.wfile.flush()
+            while True:
+                events, resync = server_events.wait_for_events(last_id, timeout=15)
+                if resync:
+                    last_id = server_events.latest_id()
+                    self.wfile.write(f"id: {last_id}\nevent: resync\ndata: {{}}\n\n".encode("utf-8"))
+                elif not events:
+                    # Comment line as a heartbeat - also how we notice a
+                    # closed tab, since the write then fails.
+                    self.wfile.write(b": keepalive\n\n")
+                for event in events:
+                    last_id = event["id"]
+                    self.wfile.write(
+                        f"id: {event['id']}\nevent: {event['type']}\ndata: {json.dumps(event['data'])}\n\n".encode("utf-8")
+                    )
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError, ConnectionAbortedError, OSError):
+            return
+
     def send_file(self, filepath: Path):
         if not filepath.exists():
             self.send_error(404, "File not found")
@@ -1026,8 +2565,14 @@ class RequestHandler(BaseHTTPRequestHandler):
                 }, 400)
                 return
 
-            t = Thread(target=start_verification_job, args=(payload,), daemon=True)
-            t.start()
+            # Flag as running right away so a status check (or SSE listener)
+            # straight after this response never sees the pre-start idle state.
+            with verification_lock:
+                verification_state["running"] = True
+                verification_state["results"] = None
+                verification_state["error"] = None
+
+            verification_worker.submit(payload)
 
             self.send_json({"ok": True, "message": "Verification started"})
             return
@@ -1038,6 +2583,53 @@ class RequestHandler(BaseHTTPRequestHandler):
             self.send_json({"ok": True, "message": "Stopping..."})
             return
 
+        if path == "/api/check-workshop-exists/batch":
+            workshop_ids = payload.get("workshopIds") or []
+            if not isinstance(workshop_ids, list) or not workshop_ids:
+                self.send_json({"error": "Missing workshopIds list"}, 400)
+                return
+
+            results = check_workshop_exists_batch(workshop_ids)
+            self.send_json({"count": len(results), "results": results})
+            return
+
+        if path == "/api/search/jobs":
+            mods = []
+            for m in payload.get("mods") or []:
+                if isinstance(m, str):
+                    m = {"modId": m}
+                if isinstance(m, dict) and str(m.get("modId") or "").strip():
+                    mods.append({"modId": str(m["modId"]).strip(), "since": m.get("since")})
+            if not mods:
+                self.send_json({"error": "No mods provided"}, 400)
+                return
+
+            try:
+                max_pages = int(payload.get("maxPages", 5))
+            except (TypeError, ValueError):
+                max_pages = 5
+            job = search_job_scheduler.submit(mods, max_pages, bool(payload.get("refresh")))
+            self.send_json({"ok": True, "job": job})
+            return
+
+        if path == "/api/ratelimit/cancel":
+            reservation_id = str(payload.get("id") or "").strip() or None
+            owner = str(payload.get("owner") or "").strip() or None
+            if not reservation_id and not owner:
+                self.send_json({"error": "Provide id or owner"}, 400)
+                return
+            self.send_json({"ok": True, "cancelled": cancel_rate_limit_reservations(reservation_id, owner)})
+            return
+
+        m = re.fullmatch(r"/api/search/jobs/([\w-]+)/cancel", path)
+        if m:
+            job = search_job_scheduler.cancel(m.group(1))
+            if not job:
+                self.send_json({"error": "Unknown job"}, 404)
+                return
+            self.send_json({"ok": True, "job": job})
+            return
+
         if path == "/api/config/depot-path":
             depot_path_str = payload.get("path", "").strip()
             if not depot_path_str:
@@ -1100,6 +2692,10 @@ class RequestHandler(BaseHTTPRequestHandler):
         path = parsed.path
         query = urllib.parse.parse_qs(parsed.query)
 
+        if path == "/api/events":
+            self.stream_events(query)
+            return
+
         if path == "/api/verify/status":
             with verification_lock:
                 self.send_json({
@@ -1110,6 +2706,27 @@ class RequestHandler(BaseHTTPRequestHandler):
                 })
             return
 
+        if path == "/api/ratelimit/status":
+            reservation_id = query.get("id", [""])[0]
+            if reservation_id:
+                status = get_rate_limit_reservation(reservation_id)
+                if not status:
+                    self.send_json({"error": "Unknown or already sent reservation"}, 404)
+                    return
+                self.send_json(status)
+                return
+            self.send_json({
+                "limiters": {name: limiter.snapshot() for name, limiter in steam_rate_limiters.items()},
+            })
+            return
+
+        if path == "/api/cache/stats":
+            self.send_json({
+                "workshopDetails": workshop_details_cache.stats(),
+                "searchPages": search_page_cache.stats(),
+            })
+            return
+
         if path == "/api/config/depot-path":
             depot_path = find_depotdownloader()
             self.send_json({
@@ -1133,18 +2750,45 @@ class RequestHandler(BaseHTTPRequestHandler):
             })
             return
 
+        if path == "/api/search/jobs":
+            self.send_json({"jobs": search_job_scheduler.list()})
+            return
+
+        m = re.fullmatch(r"/api/search/jobs/([\w-]+)(/results)?", path)
+        if m:
+            if m.group(2):
+                data = search_job_scheduler.results(m.group(1))
+            else:
+                data = search_job_scheduler.summary(m.group(1))
+            if not data:
+                self.send_json({"error": "Unknown job"}, 404)
+                return
+            self.send_json(data)
+            return
+
         if path == "/api/modid-search-all":
             mod_id = query.get("modId", [""])[0]
             max_pages = int(query.get("maxPages", ["5"])[0])
+            force_refresh = query.get("refresh", ["0"])[0].lower() in ("1", "true", "yes")
+            since = parse_search_watermark(query.get("since", [""])[0])
             if not mod_id:
                 self.send_json({"error": "Missing modId parameter"}, 400)
                 return
 
-            items, error = search_workshop(mod_id, max_pages)
+            items, error = search_workshop(mod_id, max_pages, force_refresh=force_refresh, since=since,
+                                           should_cancel=self.client_disconnected)
+            if error and error.get("statusCode") == STATUS_CANCELLED and self.client_disconnected():
+                return  # the tab went away - nobody to answer
             if error:
                 self.send_json(error, error.get("statusCode", 500))
             else:
-                self.send_json({"modId": mod_id, "count": len(items), "items": items})
+                self.send_json({
+                    "modId": mod_id,
+                    "count": len(items),
+                    "items": items,
+                    "incremental": since is not None,
+                    "watermark": format_search_watermark(make_search_watermark(items, since)),
+                })
             return
 
         if path == "/api/check-workshop-exists":
@@ -1168,7 +2812,10 @@ class RequestHandler(BaseHTTPRequestHandler):
                 self.send_json({"error": "Missing profileId parameter"}, 400)
                 return
 
-            items, error = search_profile_workshop(profile_id, max_pages)
+            items, error = search_profile_workshop(profile_id, max_pages,
+                                                   should_cancel=self.client_disconnected)
+            if error and error.get("statusCode") == STATUS_CANCELLED and self.client_disconnected():
+                return
             if error:
                 self.send_json(error, error.get("statusCode", 500))
             else:
@@ -1214,9 +2861,16 @@ def run_server(host="127.0.0.1", port=8000):
         print("Expected: mod-id-tracker/public/index.html")
         return
 
+    search_job_scheduler.start()
+
     server = ThreadedHTTPServer((host, port), RequestHandler)
     print(f"Server running: http://{host}:{port}")
-    server.serve_forever()
+    if STEAM_COMMUNITY_URL != "https://steamcommunity.com" or STEAM_API_URL != "https://api.steampowered.com":
+        print(f"[INFO] Steam requests redirected: community={STEAM_COMMUNITY_URL} api={STEAM_API_URL}")
+    try:
+        server.serve_forever()
+    finally:
+        flush_rate_limit_state()
 
 if __name__ == "__main__":
     import webbrowser
@@ -0,0 +1,54 @@
+"""ManifestHashes sidecars: the mapping is released however iteration ended."""
+
+import hashlib
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "verify"))
+
+import verify_dmca  # noqa: E402
+
+
+class ManifestHashesCloseTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        tmp = Path(self.tmp.name)
+        source = tmp / "manifest_108600_1.txt"
+        source.write_text("x")
+        self.hashes = {hashlib.sha1(str(i).encode()).hexdigest(): f"file{i}.lua" for i in range(100)}
+        self.sidecar = tmp / "manifest_108600_1.txt.hashes.bin"
+        verify_dmca.ManifestHashes.write(self.sidecar, self.hashes, source.stat())
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_close_with_half_consumed_generator(self):
+        sidecar = verify_dmca.ManifestHashes(self.sidecar)
+        digests = sidecar.digests()
+        for _ in range(len(sidecar) // 2):
+            next(digests)
+        sidecar.close()
+        self.assertIsNone(sidecar.mm)
+        self.assertEqual(list(digests), [])
+
+    def test_close_while_a_digest_is_still_held(self):
+        sidecar = verify_dmca.ManifestHashes(self.sidecar)
+        held = next(sidecar.digests())
+        sidecar.close()
+        self.assertIsNone(sidecar.mm)
+        del held
+
+    def test_digests_match_bytes_keys(self):
+        sidecar = verify_dmca.ManifestHashes(self.sidecar)
+        try:
+            keys = {bytes.fromhex(h) for h in self.hashes}
+            self.assertEqual(sum(1 for d in sidecar.digests() if d in keys), len(self.hashes))
+        finally:
+            sidecar.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
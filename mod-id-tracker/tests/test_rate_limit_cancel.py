@@ -0,0 +1,94 @@
+"""Cancelling a queued Web API reservation answers the batched lookups waiting on it."""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from threading import Thread
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Keep server.py's details cache and rate-limit state out of the real data dir.
+_data_dir = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+os.environ["PZ_TRACKER_DATA_DIR"] = _data_dir.name
+with contextlib.redirect_stdout(io.StringIO()):
+    import server  # noqa: E402
+
+
+class WebApiReservationCancelTest(unittest.TestCase):
+
+    def setUp(self):
+        self.saved_limiter = server.steam_rate_limiters["webapi"]
+        # One request every 30s, with the only token already spent, so the
+        # next webapi request queues.
+        self.limiter = server.SteamRateLimiter("webapi", rpm=2, min_rpm=2, max_rpm=2, burst=1)
+        server.steam_rate_limiters["webapi"] = self.limiter
+        self.quiet = contextlib.redirect_stdout(io.StringIO())
+        self.quiet.__enter__()
+        self.limiter.wait_if_needed()
+
+    def tearDown(self):
+        self.quiet.__exit__(None, None, None)
+        server.steam_rate_limiters["webapi"] = self.saved_limiter
+
+    def _queued_reservation(self, timeout=5):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            with self.limiter.lock:
+                if self.limiter.pending:
+                    return self.limiter.pending[0]
+            time.sleep(0.01)
+        self.fail("no webapi reservation was queued")
+
+    def test_cancel_answers_batched_waiters(self):
+        batcher = server.PublishedFileDetailsBatcher(window_seconds=0.05)
+        results = {}
+
+        def lookup(wid):
+            results[wid] = batcher.get(wid, timeout=20)
+
+        threads = [Thread(target=lookup, args=(wid,)) for wid in ("1001", "1002", "1003")]
+        for t in threads:
+            t.start()
+        reservation = self._queued_reservation()
+
+        cancelled_at = time.time()
+        self.assertEqual(server.cancel_rate_limit_reservations(reservation_id=reservation.id), 1)
+        for t in threads:
+            t.join(5)
+        self.assertLess(time.time() - cancelled_at, 3)
+
+        self.assertEqual(set(results), {"1001", "1002", "1003"})
+        for details, error in results.values():
+            self.assertIsNone(details)
+            self.assertEqual(error, "Cancelled while waiting for the rate limiter")
+
+        # The flusher finished normally rather than dying with the exception.
+        deadline = time.time() + 2
+        while batcher.flushing and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertFalse(batcher.flushing)
+
+    def test_cancel_surfaces_as_an_error_from_the_batch_check(self):
+        result = {}
+
+        def check():
+            result["value"] = server.check_workshop_exists_batch(["2001", "2002"])
+
+        t = Thread(target=check)
+        t.start()
+        reservation = self._queued_reservation()
+        server.cancel_rate_limit_reservations(reservation_id=reservation.id)
+        t.join(5)
+        self.assertFalse(t.is_alive())
+        self.assertEqual([r["error"] for r in result["value"]],
+                         ["Cancelled while waiting for the rate limiter"] * 2)
+        self.assertTrue(all(r["exists"] for r in result["value"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,17 +6,30 @@ Project Zomboid DMCA Verification Tool (DepotDownloader Version)
 
 import os
 import sys
+import io
 import json
 import argparse
 import subprocess
 import shutil
+import signal
+import urllib.parse
 import urllib.request
 import urllib.error
+import email.utils
 import re
 import time
 import configparser
+import hashlib
+import mmap
+import zipfile
+import zlib
+import struct
+import tempfile
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, List, Tuple, Optional
 
 PZ_APP_ID = "108600"
@@ -31,18 +44,39 @@ DEPOT_DEFAULT_PATHS = [
     Path.home() / "DepotDownloader" / "DepotDownloader",
     ]
 
+DEFAULT_MAX_CONCURRENT_DOWNLOADS = 4
+
 # Global log file handle
 LOG_FILE = None
+LOG_LOCK = threading.Lock()
+# Download workers emit concurrently; one event must never interleave with another
+EMIT_LOCK = threading.Lock()
 
 def log(msg):
     """Write to log file instead of stdout to avoid encoding issues"""
     if LOG_FILE:
         try:
-            LOG_FILE.write(msg + '\n')
-            LOG_FILE.flush()
+            with LOG_LOCK:
+                LOG_FILE.write(msg + '\n')
+                LOG_FILE.flush()
         except:
             pass
 
+def emit(event, **data):
+    """Write one machine-readable progress event to stdout as a JSON line.
+
+    The server reads these as they arrive to report progress and apply
+    per-entry results before the whole run finishes. ensure_ascii keeps
+    workshop titles from tripping console encoding issues (see log()).
+    """
+    try:
+        line = json.dumps(dict(data, event=event), ensure_ascii=True) + '\n'
+        with EMIT_LOCK:
+            sys.stdout.write(line)
+            sys.stdout.flush()
+    except Exception:
+        pass
+
 def load_config():
     config = configparser.ConfigParser()
     if CONFIG_FILE.exists():
@@ -54,6 +88,37 @@ def save_config(config):
     with open(CONFIG_FILE, 'w') as f:
         config.write(f)
 
+def get_max_concurrent_downloads():
+    """How many DepotDownloader jobs may run at once.
+
+    [Verify] max_concurrent_downloads in verify_config.ini, default 4.
+    Each job is its own DepotDownloader process logging in to Steam, so
+    keep this modest - Steam starts refusing connections well before
+    bandwidth becomes the bottleneck for manifest-only downloads.
+    """
+    config = load_config()
+    try:
+        value = config.getint('Verify', 'max_concurrent_downloads', fallback=DEFAULT_MAX_CONCURRENT_DOWNLOADS)
+    except ValueError:
+        value = DEFAULT_MAX_CONCURRENT_DOWNLOADS
+    return max(1, value)
+
+def similarity_enabled():
+    """[Verify] similarity in verify_config.ini (default on)."""
+    config = load_config()
+    try:
+        return config.getboolean('Verify', 'similarity', fallback=True)
+    except ValueError:
+        return True
+
+def chunk_matching_enabled():
+    """[Verify] chunk_matching in verify_config.ini (default on)."""
+    config = load_config()
+    try:
+        return config.getboolean('Verify', 'chunk_matching', fallback=True)
+    except ValueError:
+        return True
+
 def find_depotdownloader(interactive=False):
     config = load_config()
     if config.has_option('Paths', 'depotdownloader'):
@@ -105,111 +170,422 @@ def load_manifest_mapping(depot_dir):
             return {}
     return {}
 
-def save_manifest_mapping(depot_dir, mapping):
-    mapping_file = get_manifest_mapping_file(depot_dir)
-    depot_dir.mkdir(parents=True, exist_ok=True)
-    with open(mapping_file, 'w', encoding='utf-8') as f:
-        json.dump(mapping, f, indent=2)
-
-def check_workshop_exists(workshop_id):
-    """Check if a workshop item exists using the Steam Web API.
-    Uses ISteamRemoteStorage/GetPublishedFileDetails - stable, no HTML scraping.
-    result == 1 means the item exists; result == 9 means not found / removed.
+class ManifestIndex:
+    """Persistent index of the cached manifests under depot_dir.
+
+    Kept in depot_dir/manifest_index.json:
+
+      files:      relative path -> {mtime, size, manifestId, ids}, where
+                  ids are the digit runs (6+ long) found in the manifest's
+                  header and file names - the candidates a workshop ID
+                  lookup is matched against
+      workshops:  workshop ID -> {manifestId, path}, for items we know
+                  the manifest of for certain (downloaded, or matched once)
+
+    refresh() only stats the manifest files and re-reads the ones whose
+    mtime/size changed, so a run costs one directory walk rather than
+    reading the head of every manifest per lookup. Lookups and updates
+    happen in memory (thread-safe); flush() writes the index back
+    atomically, once, at the end of a run. An existing
+    manifest_mapping.json is folded in the first time.
     """
+
+    VERSION = 1
+    ID_RE = re.compile(r'\d{6,}')
+    MANIFEST_ID_RE = re.compile(r'manifest_\d+_(\d+)\.txt$')
+
+    def __init__(self, depot_dir):
+        self.depot_dir = Path(depot_dir)
+        self.path = self.depot_dir / "manifest_index.json"
+        self.lock = threading.Lock()
+        self.files = {}
+        self.workshops = {}
+        self.dirty = False
+        self._by_id = None
+        self._by_manifest = None
+        self._load()
+
+    def _load(self):
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == self.VERSION:
+                    self.files = data.get('files', {})
+                    self.workshops = data.get('workshops', {})
+                    return
+            except Exception as e:
+                log(f"[Warning] Failed to load manifest index, rebuilding: {e}")
+        # First run (or unreadable index) - carry over the old mapping file
+        for ws_id, rel in load_manifest_mapping(self.depot_dir).items():
+            rel = rel.replace('\\', '/')
+            self.workshops[ws_id] = {'manifestId': self._manifest_id(rel), 'path': rel}
+        self.dirty = True
+
+    def _manifest_id(self, rel):
+        m = self.MANIFEST_ID_RE.search(rel)
+        return m.group(1) if m else None
+
+    def _read_ids(self, manifest_file):
+        """Digit runs in the manifest header and file name column."""
+        ids = set()
+        with open(manifest_file, 'r', encoding='utf-8', errors='ignore') as f:
+            in_table = False
+            for n, line in enumerate(f):
+                if n >= 500:
+                    break
+                if not in_table:
+                    ids.update(self.ID_RE.findall(line))
+                    in_table = 'Size' in line and 'Chunks' in line and 'File SHA' in line
+                else:
+                    parts = line.split(None, 4)
+                    if len(parts) == 5:
+                        ids.update(self.ID_RE.findall(parts[4]))
+        return sorted(ids)
+
+    def refresh(self):
+        """Bring the index in line with what's on disk."""
+        seen = set()
+        changed = 0
+        if self.depot_dir.exists():
+            for build_dir in self.depot_dir.iterdir():
+                if not build_dir.is_dir():
+                    continue
+                for manifest_file in build_dir.glob("manifest_*.txt"):
+                    rel = manifest_file.relative_to(self.depot_dir).as_posix()
+                    seen.add(rel)
+                    try:
+                        st = manifest_file.stat()
+                        known = self.files.get(rel)
+                        if known and known['mtime'] == st.st_mtime and known['size'] == st.st_size:
+                            continue
+                        self.files[rel] = {
+                            'mtime': st.st_mtime,
+                            'size': st.st_size,
+                            'manifestId': self._manifest_id(rel),
+                            'ids': self._read_ids(manifest_file),
+                        }
+                        changed += 1
+                    except OSError:
+                        continue
+        removed = [rel for rel in self.files if rel not in seen]
+        for rel in removed:
+            del self.files[rel]
+        for ws_id in [w for w, info in self.workshops.items() if info['path'] not in self.files]:
+            del self.workshops[ws_id]
+        if changed or removed:
+            self.dirty = True
+            self._by_id = None
+            self._by_manifest = None
+        log(f"[Index] {len(self.files)} manifests ({changed} new/changed, {len(removed)} removed), "
+            f"{len(self.workshops)} mapped items")
+
+    def find(self, workshop_id):
+        """Path of the cached manifest for workshop_id, or None."""
+        with self.lock:
+            info = self.workshops.get(workshop_id)
+            if info and info['path'] in self.files:
+                return self.depot_dir / info['path']
+            if self._by_id is None:
+                self._by_id = {}
+                for rel, meta in self.files.items():
+                    for i in meta['ids']:
+                        self._by_id.setdefault(i, []).append(rel)
+            matches = self._by_id.get(workshop_id)
+            if not matches:
+                return None
+            rel = max(matches, key=lambda r: self.files[r]['mtime'])
+            self.workshops[workshop_id] = {'manifestId': self.files[rel]['manifestId'], 'path': rel}
+            self.dirty = True
+            return self.depot_dir / rel
+
+    def find_manifest(self, workshop_id, manifest_id):
+        """Path of the cached manifest with this exact Steam manifest ID
+        (the item's current hcontent_file), or None if it isn't cached -
+        an older manifest of the same item doesn't count.
+
+        Both steps are dict lookups: the workshops map for items already
+        matched, then a manifest ID -> path index over every cached file
+        (manifest IDs are unique across depots), built on first use.
+        """
+        manifest_id = str(manifest_id)
+        with self.lock:
+            info = self.workshops.get(workshop_id)
+            if info and info['manifestId'] == manifest_id and info['path'] in self.files:
+                return self.depot_dir / info['path']
+            if self._by_manifest is None:
+                self._by_manifest = {meta['manifestId']: rel for rel, meta in self.files.items()
+                                     if meta['manifestId']}
+            rel = self._by_manifest.get(manifest_id)
+            if rel:
+                self.workshops[workshop_id] = {'manifestId': manifest_id, 'path': rel}
+                self.dirty = True
+                return self.depot_dir / rel
+        return None
+
+    def record(self, workshop_id, manifest_path):
+        """Register a freshly downloaded manifest for workshop_id."""
+        manifest_path = Path(manifest_path)
+        rel = manifest_path.relative_to(self.depot_dir).as_posix()
+        st = manifest_path.stat()
+        with self.lock:
+            self.files[rel] = {
+                'mtime': st.st_mtime,
+                'size': st.st_size,
+                'manifestId': self._manifest_id(rel),
+                'ids': self._read_ids(manifest_path),
+            }
+            self.workshops[workshop_id] = {'manifestId': self.files[rel]['manifestId'], 'path': rel}
+            self._by_id = None
+            self._by_manifest = None
+            self.dirty = True
+
+    def identity(self, manifest_path):
+        """Stable identifier of a cached manifest's content: its Steam
+        manifest ID, or path/size/mtime for manifests without one."""
+        rel = Path(manifest_path).relative_to(self.depot_dir).as_posix()
+        info = self.files.get(rel)
+        if not info:
+            return None
+        return info['manifestId'] or f"{rel}@{info['size']}:{info['mtime']}"
+
+    def flush(self):
+        """Write the index back (tmp file + rename) if anything changed."""
+        with self.lock:
+            if not self.dirty:
+                return
+            self.depot_dir.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix('.json.tmp')
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({'version': self.VERSION, 'files': self.files, 'workshops': self.workshops}, f)
+            os.replace(tmp, self.path)
+            self.dirty = False
+        mapping_file = get_manifest_mapping_file(self.depot_dir)
+        if mapping_file.exists():
+            mapping_file.unlink()
+
+# Same PZ_STEAM_API_URL override server.py honours (see bench/fake_steam.py).
+STEAM_API_URL = os.environ.get("PZ_STEAM_API_URL", "https://api.steampowered.com").rstrip("/")
+STEAM_DETAILS_URL = f"{STEAM_API_URL}/ISteamRemoteStorage/GetPublishedFileDetails/v1/"
+STEAM_DETAILS_MAX_BATCH = 100
+STEAM_DETAILS_MAX_RETRIES = 3
+STEAM_DETAILS_BACKOFF_SECONDS = 5
+STEAM_DETAILS_MAX_WAIT_SECONDS = 300
+
+def retry_after_seconds(value):
+    """Seconds to wait per a Retry-After header (delta-seconds or an HTTP
+    date), or None if it's missing or unparseable."""
+    if not value:
+        return None
+    value = str(value).strip()
+    if value.isdigit():
+        return float(value)
     try:
-        params = urllib.parse.urlencode({
-            "itemcount": 1,
-            "publishedfileids[0]": workshop_id,
-        }).encode()
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None:
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, when.timestamp() - time.time())
+
+def fetch_published_file_details(workshop_ids):
+    """One GetPublishedFileDetails call; returns its publishedfiledetails records.
+
+    Used when the verifier runs on its own (the server passes its
+    rate-limited lookup instead, see run_verification). A 429/503 is
+    retried up to STEAM_DETAILS_MAX_RETRIES times, waiting as long as
+    Retry-After says or backing off exponentially when it's absent. Any
+    other failure raises.
+    """
+    params = {"itemcount": len(workshop_ids)}
+    for i, ws_id in enumerate(workshop_ids):
+        params[f"publishedfileids[{i}]"] = ws_id
+    backoff = STEAM_DETAILS_BACKOFF_SECONDS
+    for attempt in range(STEAM_DETAILS_MAX_RETRIES + 1):
         req = urllib.request.Request(
-            "https://api.steampowered.com/ISteamRemoteStorage/GetPublishedFileDetails/v1/",
-            data=params,
+            STEAM_DETAILS_URL,
+            data=urllib.parse.urlencode(params).encode(),
             method="POST",
             headers={
                 "Content-Type": "application/x-www-form-urlencoded",
                 "User-Agent": "Mozilla/5.0",
             }
         )
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            data = json.loads(resp.read().decode("utf-8", errors="ignore"))
-        files = data.get("response", {}).get("publishedfiledetails", [])
-        if not files or files[0].get("result", 1) != 1:
-            return False, None
-        title = files[0].get("title", "").strip() or None
-        return True, title
-    except urllib.error.HTTPError as e:
-        if e.code == 404:
-            return False, None
-        return True, None  # Assume exists on other HTTP errors
-    except Exception as e:
-        log(f"[Warning] Error checking workshop {workshop_id}: {e}")
-        return True, None
-
-def find_manifest_for_workshop(depot_dir, workshop_id):
-    mapping = load_manifest_mapping(depot_dir)
-    if workshop_id in mapping:
-        manifest_path = depot_dir / mapping[workshop_id]
-        if manifest_path.exists():
-            return manifest_path
-        del mapping[workshop_id]
-        save_manifest_mapping(depot_dir, mapping)
-
-    if not depot_dir.exists():
-        return None
-
-    for build_dir in depot_dir.iterdir():
-        if not build_dir.is_dir():
+        try:
+            with urllib.request.urlopen(req, timeout=30) as resp:
+                data = json.loads(resp.read().decode("utf-8", errors="ignore"))
+            return data.get("response", {}).get("publishedfiledetails", [])
+        except urllib.error.HTTPError as e:
+            if e.code not in (429, 503) or attempt == STEAM_DETAILS_MAX_RETRIES:
+                raise
+            wait = retry_after_seconds(e.headers.get("Retry-After"))
+            wait = min(backoff if wait is None else wait, STEAM_DETAILS_MAX_WAIT_SECONDS)
+            backoff *= 2
+            log(f"[Details] HTTP {e.code} from Steam, retrying in {wait:.0f}s "
+                f"({attempt + 1}/{STEAM_DETAILS_MAX_RETRIES})")
+            time.sleep(wait)
+
+def get_published_file_details(workshop_ids, lookup=None):
+    """Look up many workshop items with GetPublishedFileDetails, 100 per call.
+
+    Returns {workshop ID: {'exists', 'title', 'timeUpdated', 'manifestId'}},
+    manifestId being hcontent_file - the ID of the item's current content
+    manifest (None if Steam didn't say). result == 1
+    means the item exists; anything else (9 = not found) means it's gone.
+    Items in a chunk whose call failed are left out - callers treat
+    "unknown" as "still there", same as the old per-item check did.
+
+    lookup(ids) -> [publishedfiledetails record, ...] does the actual
+    calls; it defaults to fetch_published_file_details, paced one chunk
+    per second.
+    """
+    paced = lookup is None
+    lookup = lookup or fetch_published_file_details
+    details = {}
+    ids = list(dict.fromkeys(str(w) for w in workshop_ids))
+    for start in range(0, len(ids), STEAM_DETAILS_MAX_BATCH):
+        chunk = ids[start:start + STEAM_DETAILS_MAX_BATCH]
+        try:
+            records = lookup(chunk)
+        except Exception as e:
+            log(f"[Warning] Details lookup failed for {len(chunk)} items: {e}")
             continue
-        for manifest_file in build_dir.glob("manifest_*.txt"):
-            try:
-                with open(manifest_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = ''.join([next(f, '') for _ in range(500)])
-                if workshop_id in content:
-                    mapping[workshop_id] = str(manifest_file.relative_to(depot_dir))
-                    save_manifest_mapping(depot_dir, mapping)
-                    return manifest_file
-            except:
+        for item in records:
+            ws_id = str(item.get("publishedfileid", ""))
+            if ws_id not in chunk:
                 continue
-    return None
+            details[ws_id] = {
+                'exists': item.get("result", 1) == 1,
+                'title': (item.get("title") or "").strip() or None,
+                'timeUpdated': item.get("time_updated"),
+                'manifestId': str(item["hcontent_file"]) if item.get("hcontent_file") else None,
+            }
+        if paced and start + STEAM_DETAILS_MAX_BATCH < len(ids):
+            time.sleep(1)
+    return details
 
-def parse_manifest_fast(manifest_content):
-    hashes = {}
-    lines = manifest_content.split('\n')
-    data_start = 0
-    for i, line in enumerate(lines):
-        if 'Size' in line and 'Chunks' in line and 'File SHA' in line:
-            data_start = i + 1
-            break
-    if not data_start:
-        return hashes
-    for line in lines[data_start:]:
-        parts = line.strip().split()
-        if len(parts) < 5:
-            continue
-        try:
-            size, hash_val, flags = int(parts[0]), parts[2], int(parts[3])
-            filename = ' '.join(parts[4:])
-            if flags in (40, 64, 0x40) or hash_val == '0'*40 or size == 0:
-                continue
-            if len(hash_val) == 40 and all(c in '0123456789abcdefABCDEF' for c in hash_val):
-                hashes[hash_val.lower()] = filename
-        except:
-            continue
-    return hashes
+# Data row of a DepotDownloader text manifest:
+#   <size> <chunks> <40 hex file SHA> <flags> <name, may contain spaces>
+MANIFEST_ROW_RE = re.compile(rb'^[ \t]*(\d+)[ \t]+\d+[ \t]+([0-9a-fA-F]{40})[ \t]+(\d+)[ \t]+([^\r\n]*)', re.M)
 
-def download_workshop_manifest(depot_path, workshop_id, depot_dir, timeout=300):
-    existing = set()
-    if depot_dir.exists():
-        for bd in depot_dir.iterdir():
-            if bd.is_dir():
-                existing.update(bd.glob("manifest_*.txt"))
+# Streaming parse target (~300k-row manifest on a typical desktop).
+# `verify_dmca.py --benchmark-parser <manifest>` measures against it.
+PARSER_TARGET_MB_S = 40
 
-    start_time = time.time()
-    cmd = [str(depot_path), '-app', PZ_APP_ID, '-pubfile', workshop_id, '-manifest-only']
+def iter_manifest_rows(manifest_path):
+    """Yield (sha, size, flags, filename) for each row of a text manifest.
+
+    The file is mmapped and scanned by one compiled pattern starting after
+    the header line - no full-file string, no list of lines, no per-line
+    split. Only the fields of matching rows are decoded. Directory rows
+    etc. are yielded too; filtering is up to the caller.
+    """
+    with open(manifest_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            header = mm.find(b'File SHA')
+            if header < 0:
+                return
+            start = mm.find(b'\n', header) + 1
+            if start == 0:
+                return
+            for m in MANIFEST_ROW_RE.finditer(mm, start):
+                size, sha, flags, name = m.groups()
+                yield sha.lower().decode('ascii'), int(size), int(flags), name.rstrip().decode('utf-8', errors='replace')
+
+def is_content_row(sha, size, flags):
+    """False for directories, empty files and other rows with no content hash."""
+    return flags not in (40, 64) and size != 0 and sha != '0' * 40
+
+def parse_manifest_fast(manifest_path):
+    """{file sha: filename} for every content file in a text manifest."""
+    return {sha: name for sha, size, flags, name in iter_manifest_rows(manifest_path)
+            if is_content_row(sha, size, flags)}
+
+def benchmark_parser(manifest_path, rounds=3):
+    """Best-of-rounds parse throughput in MB/s for one manifest."""
+    size_mb = Path(manifest_path).stat().st_size / (1024 * 1024)
+    best = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        rows = sum(1 for _ in iter_manifest_rows(manifest_path))
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return rows, size_mb, (size_mb / best if best else float('inf'))
+
+def get_workshop_manifest_dir(depot_dir):
+    """Where manifests fetched by download_workshop_manifest end up.
+
+    A subdirectory of depot_dir, so ManifestIndex.refresh() picks them
+    up like any other build directory.
+    """
+    return depot_dir / "workshop"
+
+# How often a running DepotDownloader job checks for a stop request.
+DOWNLOAD_STOP_POLL_SECONDS = 1.0
+
+def _terminate(proc):
+    """Stop a DepotDownloader process (and, on POSIX, anything it started),
+    killing it if it won't exit. Its output is abandoned, not waited on -
+    a leftover child could otherwise hold the pipes open."""
+    def send(sig):
+        try:
+            if os.name == 'posix':
+                os.killpg(proc.pid, sig)
+            elif sig == signal.SIGTERM:
+                proc.terminate()
+            else:
+                proc.kill()
+        except (ProcessLookupError, PermissionError):
+            pass
+    send(signal.SIGTERM)
+    try:
+        proc.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        send(getattr(signal, 'SIGKILL', signal.SIGTERM))
+        proc.wait()
+    for pipe in (proc.stdout, proc.stderr):
+        pipe.close()
+
+def download_workshop_manifest(depot_path, workshop_id, index, manifest_id=None, timeout=300,
+                               should_stop=None):
+    """Fetch one workshop item's manifest with DepotDownloader -manifest-only.
+
+    Every call gets its own scratch -dir, so several of these can run at
+    once without racing on which manifest_*.txt in the shared depot
+    directory is "the new one". The manifest is then moved into
+    get_workshop_manifest_dir() and recorded in the ManifestIndex.
+
+    With the item's manifest_id (hcontent_file) known, the result is picked
+    by exact name (manifest_<depot>_<manifest_id>.txt) rather than "newest".
+
+    should_stop, if given, is polled while DepotDownloader runs; once it
+    returns True the process is terminated and ("Stopped") returned, so a
+    stop or run deadline doesn't wait out the whole timeout.
+    """
+    work_dir = Path(tempfile.mkdtemp(prefix=f"ws_{workshop_id}_", dir=depot_path.parent))
+    cmd = [str(depot_path), '-app', PZ_APP_ID, '-pubfile', workshop_id, '-manifest-only', '-dir', str(work_dir)]
 
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout, cwd=depot_path.parent)
-        output = result.stdout + result.stderr
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+                                cwd=depot_path.parent, start_new_session=(os.name == 'posix'))
+        deadline = time.time() + timeout
+        while True:
+            try:
+                # Retrying communicate() after a timeout loses no output
+                stdout, stderr = proc.communicate(timeout=DOWNLOAD_STOP_POLL_SECONDS)
+                break
+            except subprocess.TimeoutExpired:
+                if should_stop and should_stop():
+                    _terminate(proc)
+                    return False, "Stopped", None
+                if time.time() > deadline:
+                    _terminate(proc)
+                    return False, "Timeout", None
+        output = stdout + stderr
 
         if 'No subscription' in output or 'not subscribed' in output.lower():
             return False, "Not subscribed", None
@@ -217,192 +593,825 @@ def download_workshop_manifest(depot_path, workshop_id, depot_dir, timeout=300):
             return False, "Login failed", None
 
         if 'manifest' in output.lower():
-            new_or_updated = []
-            if depot_dir.exists():
-                for bd in depot_dir.iterdir():
-                    if bd.is_dir():
-                        for mf in bd.glob("manifest_*.txt"):
-                            if mf not in existing or mf.stat().st_mtime >= start_time - 5:
-                                new_or_updated.append(mf)
-
-            if new_or_updated:
-                new_or_updated.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-                manifest_path = new_or_updated[0]
-                mapping = load_manifest_mapping(depot_dir)
-                mapping[workshop_id] = str(manifest_path.relative_to(depot_dir))
-                save_manifest_mapping(depot_dir, mapping)
+            pattern = f"manifest_*_{manifest_id}.txt" if manifest_id else "manifest_*.txt"
+            found = sorted(work_dir.rglob(pattern), key=lambda p: p.stat().st_mtime, reverse=True)
+            if found:
+                target_dir = get_workshop_manifest_dir(index.depot_dir)
+                target_dir.mkdir(parents=True, exist_ok=True)
+                manifest_path = target_dir / found[0].name
+                shutil.move(str(found[0]), str(manifest_path))
+                # Keep the binary manifest DepotDownloader cached in
+                # <dir>/.DepotDownloader - it has the per-chunk SHAs
+                for binary in get_binary_manifest_names(manifest_path):
+                    cached = next(work_dir.rglob(binary), None)
+                    if cached:
+                        shutil.move(str(cached), str(target_dir / binary))
+                        break
+                index.record(workshop_id, manifest_path)
                 return True, None, manifest_path
         return False, "Unknown error", None
-    except subprocess.TimeoutExpired:
-        return False, "Timeout", None
     except Exception as e:
         return False, str(e), None
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
 
-def compare_hashes(original, suspect):
-    matched = set(original.keys()) & set(suspect.keys())
-    return len(matched), len(original), [original[h] for h in matched]
-
-def main():
-    global LOG_FILE
-
-    parser = argparse.ArgumentParser()
-    parser.add_argument('--dmca-export', required=True)
-    parser.add_argument('--depot-path')
-    parser.add_argument('--pending-only', action='store_true')
-    parser.add_argument('--show-config', action='store_true')
-    parser.add_argument('--clear-cache', action='store_true')
-    args = parser.parse_args()
+class ManifestHashes:
+    """A manifest's parsed hash set, read from a binary sidecar via mmap.
 
-    # Create log file next to the export file
-    dmca_path = Path(args.dmca_export)
-    log_path = dmca_path.parent / f"{dmca_path.stem}_verify.log"
-    LOG_FILE = open(log_path, 'w', encoding='utf-8')
+    Sidecar layout (<manifest>.hashes.bin, little-endian):
 
-    try:
-        log(f"[VERIFY] Starting verification process")
-        log(f"[VERIFY] Python version: {sys.version}")
-        log(f"[VERIFY] Working directory: {os.getcwd()}")
+      header   magic 'PZMH', version u16, pad u16, source size u64,
+               source mtime_ns i64, count u32
+      digests  count x 20-byte SHA-1, sorted
+      offsets  (count + 1) x u32 into the name table
+      names    UTF-8 file names, in digest order
 
-        depot_path = Path(args.depot_path) if args.depot_path else find_depotdownloader(interactive=False)
-        if not depot_path:
-            log("ERROR: DepotDownloader not found")
-            raise Exception("DepotDownloader not found")
+    The header records the size/mtime of the manifest it was built from;
+    a mismatch means the manifest changed and the sidecar is rebuilt.
+    Nothing is decoded up front - digests are compared as raw bytes
+    straight out of the mapping (no hex strings at all) and names are only
+    decoded for matches.
+    """
 
-        log(f"[VERIFY] DepotDownloader path: {depot_path}")
+    MAGIC = b'PZMH'
+    VERSION = 1
+    HEADER = struct.Struct('<4sHHQqI')
+
+    def __init__(self, sidecar_path):
+        self.path = Path(sidecar_path)
+        self.view = None
+        self.iterators = weakref.WeakSet()
+        with open(self.path, 'rb') as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view = memoryview(self.mm)
+        magic, version, _, self.source_size, self.source_mtime_ns, self.count = \
+            self.HEADER.unpack_from(self.mm, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            self.close()
+            raise ValueError(f"Not a hash sidecar: {self.path}")
+        self.digests_at = self.HEADER.size
+        self.offsets_at = self.digests_at + 20 * self.count
+        self.names_at = self.offsets_at + 4 * (self.count + 1)
+
+    def __len__(self):
+        return self.count
+
+    def digests(self):
+        """Iterate the raw 20-byte digests in sorted order.
+
+        Each digest is a read-only memoryview into the mapping - hashable
+        and equal to the same bytes, but only valid until close(), so copy
+        it with bytes() before keeping it around.
+        """
+        iterator = self._iter_digests()
+        self.iterators.add(iterator)
+        return iterator
+
+    def _iter_digests(self):
+        block = self.view[self.digests_at:self.offsets_at]
+        try:
+            for k in range(0, len(block), 20):
+                yield block[k:k + 20]
+        finally:
+            block.release()
+
+    def name(self, i):
+        start, end = struct.unpack_from('<II', self.mm, self.offsets_at + 4 * i)
+        return self.mm[self.names_at + start:self.names_at + end].decode('utf-8', errors='replace')
+
+    def close(self):
+        """Unmap the sidecar. Unfinished digests() iterators are closed
+        first; if a caller still holds one of the digest views, the mapping
+        can't be unmapped yet and is left for the garbage collector to
+        release once the last view is gone."""
+        if self.mm is None:
+            return
+        for iterator in list(self.iterators):
+            iterator.close()
+        self.view.release()
+        try:
+            self.mm.close()
+        except BufferError:
+            log(f"[Warning] {self.path.name} still referenced - unmapping once released")
+        self.mm = None
+
+    @classmethod
+    def write(cls, sidecar_path, hashes, source_stat):
+        """Write a sidecar for hashes ({hex sha: filename}), atomically."""
+        items = sorted((bytes.fromhex(h), name.encode('utf-8')) for h, name in hashes.items())
+        offsets, pos = [0], 0
+        for _, name in items:
+            pos += len(name)
+            offsets.append(pos)
+        sidecar_path = Path(sidecar_path)
+        tmp = sidecar_path.with_name(sidecar_path.name + '.tmp')
+        with open(tmp, 'wb') as f:
+            f.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION, 0, source_stat.st_size,
+                                    source_stat.st_mtime_ns, len(items)))
+            f.write(b''.join(d for d, _ in items))
+            f.write(struct.pack(f'<{len(offsets)}I', *offsets))
+            f.write(b''.join(n for _, n in items))
+        os.replace(tmp, sidecar_path)
+
+def get_hash_sidecar(manifest_path):
+    return manifest_path.with_name(manifest_path.name + '.hashes.bin')
+
+def load_manifest_hashes(manifest_path):
+    """ManifestHashes for a manifest, (re)building its sidecar if stale."""
+    manifest_path = Path(manifest_path)
+    st = manifest_path.stat()
+    sidecar = get_hash_sidecar(manifest_path)
+    if sidecar.exists():
+        try:
+            hashes = ManifestHashes(sidecar)
+            if hashes.source_size == st.st_size and hashes.source_mtime_ns == st.st_mtime_ns:
+                return hashes
+            hashes.close()
+        except (OSError, ValueError, struct.error) as e:
+            log(f"[Warning] Rebuilding hash sidecar {sidecar.name}: {e}")
+    ManifestHashes.write(sidecar, parse_manifest_fast(manifest_path), st)
+    return ManifestHashes(sidecar)
+
+class OriginalsIndex:
+    """Inverted index over every tracked original: file SHA -> [(mod ID, file name)].
+
+    A suspect is resolved against all originals in one pass over its own
+    digests, so files lifted from a tracked mod the entry wasn't tagged
+    with still show up. Kept in depot_dir/originals_index.json; each
+    original records the manifest (path, size, mtime_ns) its postings came
+    from, and update() only re-indexes originals whose manifest changed.
+    """
 
-        depot_dir = get_depot_dir(depot_path)
-        log(f"[VERIFY] Depot directory: {depot_dir}")
+    VERSION = 1
 
-        if args.clear_cache:
-            if depot_dir.exists():
-                mapping_file = get_manifest_mapping_file(depot_dir)
-                if mapping_file.exists():
-                    mapping_file.unlink()
-                shutil.rmtree(depot_dir)
-                log("Cache cleared")
+    def __init__(self, depot_dir):
+        self.depot_dir = Path(depot_dir)
+        self.path = self.depot_dir / "originals_index.json"
+        self.originals = {}
+        self.postings = {}
+        self.dirty = False
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == self.VERSION:
+                    self.originals = data.get('originals', {})
+                    self.postings = {bytes.fromhex(h): [tuple(p) for p in hits]
+                                     for h, hits in data.get('hashes', {}).items()}
+            except Exception as e:
+                log(f"[Warning] Failed to load originals index, rebuilding: {e}")
+                self.originals, self.postings = {}, {}
+
+    def update(self, tracked_mods, manifests, hashes):
+        """Sync with the current tracked mods.
+
+        tracked_mods is {mod ID: workshop ID}; manifests/hashes map workshop
+        IDs to this run's manifest paths and ManifestHashes. Originals no
+        longer tracked are dropped. One whose manifest isn't available this
+        run keeps its previous postings.
+        """
+        changed = {}
+        for mod_id, ws_id in tracked_mods.items():
+            if ws_id not in manifests or ws_id not in hashes:
+                continue
+            st = manifests[ws_id].stat()
+            source = {
+                'workshopId': ws_id,
+                'manifest': manifests[ws_id].relative_to(self.depot_dir).as_posix(),
+                'size': st.st_size,
+                'mtimeNs': st.st_mtime_ns,
+            }
+            known = self.originals.get(mod_id)
+            if not known or any(known.get(k) != v for k, v in source.items()):
+                changed[mod_id] = source
+        dropped = {m for m in self.originals if m not in tracked_mods} | set(changed)
+        if not dropped:
             return
-
-        if args.show_config:
-            log(f"DepotDownloader: {depot_path}")
-            log(f"Depot dir: {depot_dir}")
-            if depot_dir.exists():
-                mapping = load_manifest_mapping(depot_dir)
-                log(f"Mapped items: {len(mapping)}")
+        if any(m in self.originals for m in dropped):
+            for digest in list(self.postings):
+                hits = [p for p in self.postings[digest] if p[0] not in dropped]
+                if hits:
+                    self.postings[digest] = hits
+                else:
+                    del self.postings[digest]
+        for mod_id in dropped:
+            self.originals.pop(mod_id, None)
+        for mod_id, source in changed.items():
+            original = hashes[source['workshopId']]
+            for i, digest in enumerate(original.digests()):
+                self.postings.setdefault(bytes(digest), []).append((mod_id, original.name(i)))
+            self.originals[mod_id] = dict(source, files=len(original))
+        self.dirty = True
+        log(f"[Index] Originals index: {len(changed)} re-indexed, {len(self.originals)} originals, "
+            f"{len(self.postings)} distinct hashes")
+
+    def resolve(self, suspect, exclude_workshop=None):
+        """{mod ID: [matched file names]} for every original suspect shares files with."""
+        hits = {}
+        for digest in suspect.digests():
+            for mod_id, name in self.postings.get(digest, ()):
+                hits.setdefault(mod_id, []).append(name)
+        if exclude_workshop:
+            for mod_id, info in self.originals.items():
+                if info['workshopId'] == exclude_workshop:
+                    hits.pop(mod_id, None)
+        return hits
+
+    def flush(self):
+        if not self.dirty:
             return
+        self.depot_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix('.json.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': self.VERSION,
+                'originals': self.originals,
+                'hashes': {d.hex(): hits for d, hits in self.postings.items()},
+            }, f)
+        os.replace(tmp, self.path)
+        self.dirty = False
+
+# ============================================================================
+# SIMILARITY (MinHash + LSH)
+# Exact SHA matching scores 0% for a reupload that touched every file. The
+# file layout survives that, so each manifest also gets a MinHash signature
+# over its normalised paths and (file name, size) pairs. LSH banding over
+# the originals' signatures finds candidate originals for a suspect without
+# comparing it against every one.
+#
+# Manifests are all we download (-manifest-only), so there is no file
+# content to shingle - path and size features are what's available.
+# ============================================================================
+
+MINHASH_PERMUTATIONS = 64
+LSH_BANDS = 16  # x 4 rows: 50% Jaccard -> ~64% odds of sharing a bucket, 70% -> ~99%
+MINHASH_PRIME = (1 << 61) - 1
+
+def _minhash_coeff(tag, modulus):
+    return int.from_bytes(hashlib.blake2b(tag.encode(), digest_size=8).digest(), 'little') % modulus
+
+# Fixed (a, b) pairs for h(x) = (a*x + b) mod p - signatures stored in
+# sidecars are only comparable as long as these never change
+MINHASH_COEFFS = [(_minhash_coeff(f'a{i}', MINHASH_PRIME - 1) + 1, _minhash_coeff(f'b{i}', MINHASH_PRIME))
+                  for i in range(MINHASH_PERMUTATIONS)]
+
+MOD_ROOT_RE = re.compile(r'^(?:.*/)?mods/[^/]+/')
+
+def manifest_features(manifest_path):
+    """Path and (name, size) features of a manifest, for MinHash.
+
+    Paths are lower-cased and lose their leading mods/<folder>/ part, since
+    renaming the mod folder is the first thing a reupload does.
+    """
+    features = set()
+    for sha, size, flags, name in iter_manifest_rows(manifest_path):
+        if flags in (40, 64) or size == 0:
+            continue
+        path = MOD_ROOT_RE.sub('', name.replace('\\', '/').lower())
+        features.add('p:' + path)
+        features.add(f"s:{path.rsplit('/', 1)[-1]}:{size}")
+    return features
+
+def minhash_signature(features):
+    """MINHASH_PERMUTATIONS minimum hash values over features."""
+    if not features:
+        return None
+    base = [int.from_bytes(hashlib.blake2b(f.encode('utf-8'), digest_size=8).digest(), 'little')
+            for f in features]
+    return [min((a * x + b) % MINHASH_PRIME for x in base) & 0xFFFFFFFF for a, b in MINHASH_COEFFS]
+
+def signature_similarity(sig_a, sig_b):
+    """Estimated Jaccard similarity of two signatures, as a percentage."""
+    if not sig_a or not sig_b:
+        return 0
+    same = sum(1 for x, y in zip(sig_a, sig_b) if x == y)
+    return round(same / len(sig_a) * 100, 1)
+
+def get_minhash_sidecar(manifest_path):
+    return manifest_path.with_name(manifest_path.name + '.minhash.bin')
+
+def load_minhash_signature(manifest_path):
+    """MinHash signature of a manifest, cached in a sidecar keyed like the
+    hash sidecar (source size + mtime_ns). None for an empty manifest."""
+    manifest_path = Path(manifest_path)
+    st = manifest_path.stat()
+    sidecar = get_minhash_sidecar(manifest_path)
+    header = struct.Struct('<4sHHQq')
+    try:
+        raw = sidecar.read_bytes()
+        magic, version, perms, size, mtime_ns = header.unpack_from(raw, 0)
+        if (magic, version, perms, size, mtime_ns) == (b'PZMM', 1, MINHASH_PERMUTATIONS, st.st_size, st.st_mtime_ns):
+            if len(raw) == header.size:
+                return None
+            return list(struct.unpack_from(f'<{perms}I', raw, header.size))
+    except (OSError, struct.error):
+        pass
+    sig = minhash_signature(manifest_features(manifest_path))
+    tmp = sidecar.with_name(sidecar.name + '.tmp')
+    with open(tmp, 'wb') as f:
+        f.write(header.pack(b'PZMM', 1, MINHASH_PERMUTATIONS, st.st_size, st.st_mtime_ns))
+        if sig:
+            f.write(struct.pack(f'<{MINHASH_PERMUTATIONS}I', *sig))
+    os.replace(tmp, sidecar)
+    return sig
+
+class SimilarityIndex:
+    """LSH buckets over the originals' MinHash signatures."""
+
+    def __init__(self, signatures):
+        # signatures: {mod ID: signature}
+        self.signatures = {m: sig for m, sig in signatures.items() if sig}
+        self.rows = MINHASH_PERMUTATIONS // LSH_BANDS
+        self.buckets = {}
+        for mod_id, sig in self.signatures.items():
+            for key in self._band_keys(sig):
+                self.buckets.setdefault(key, set()).add(mod_id)
+
+    def _band_keys(self, sig):
+        for band in range(LSH_BANDS):
+            yield (band,) + tuple(sig[band * self.rows:(band + 1) * self.rows])
+
+    def candidates(self, sig):
+        """{mod ID: similarity %} for originals sharing at least one band."""
+        if not sig:
+            return {}
+        found = set()
+        for key in self._band_keys(sig):
+            found |= self.buckets.get(key, set())
+        return {m: signature_similarity(self.signatures[m], sig) for m in found}
+
+# ============================================================================
+# CHUNK MATCHING
+# The text manifests only carry a chunk *count* per file. The chunk SHAs
+# live in the binary manifest DepotDownloader caches next to it
+# (.DepotDownloader/<depot>_<manifest>.manifest): either Steam's own format
+# (magic-tagged protobuf sections, DepotDownloader 2.5+) or the older
+# deflated ProtoManifest, which those versions cache as <depot>_<manifest>.bin. Both are read with a minimal protobuf walker and
+# the unique chunk SHAs go into a <manifest>.chunks.bin sidecar (same
+# layout as .hashes.bin, file name per chunk). Partially copied files and
+# re-packed assets still share chunks where whole-file SHAs differ.
+# ============================================================================
+
+STEAM_MANIFEST_PAYLOAD_MAGIC = 0x71F617D0
+STEAM_MANIFEST_END_MAGIC = 0x32C415AB
+
+def _pb_varint(buf, pos):
+    result = shift = 0
+    while True:
+        b = buf[pos]
+        pos += 1
+        result |= (b & 0x7F) << shift
+        if not b & 0x80:
+            return result, pos
+        shift += 7
+
+def _pb_fields(buf):
+    """Yield (field number, value) for one protobuf message. Length-
+    delimited values come back as memoryview slices, others as ints."""
+    buf = memoryview(buf)
+    pos, end = 0, len(buf)
+    while pos < end:
+        key, pos = _pb_varint(buf, pos)
+        field, wire = key >> 3, key & 7
+        if wire == 0:
+            value, pos = _pb_varint(buf, pos)
+        elif wire == 1:
+            value, pos = int.from_bytes(buf[pos:pos + 8], 'little'), pos + 8
+        elif wire == 2:
+            length, pos = _pb_varint(buf, pos)
+            value, pos = buf[pos:pos + length], pos + length
+        elif wire == 5:
+            value, pos = int.from_bytes(buf[pos:pos + 4], 'little'), pos + 4
+        else:
+            raise ValueError(f"Unsupported protobuf wire type {wire}")
+        yield field, value
+
+def get_binary_manifest_names(manifest_path):
+    """manifest_<depot>_<id>.txt -> (<depot>_<id>.manifest, <depot>_<id>.bin)"""
+    base = manifest_path.stem[len('manifest_'):]
+    return base + '.manifest', base + '.bin'
+
+def find_binary_manifest(manifest_path):
+    for name in get_binary_manifest_names(manifest_path):
+        for candidate in (manifest_path.parent / name,
+                          manifest_path.parent / '.DepotDownloader' / name):
+            if candidate.exists():
+                return candidate
+    return None
 
-        log(f"[VERIFY] Input file: {dmca_path}")
-
-        if not dmca_path.exists():
-            log(f"ERROR: Input file does not exist: {dmca_path}")
-            raise Exception(f"Input file not found: {dmca_path}")
-
-        log(f"[VERIFY] Reading input file...")
-        with open(dmca_path, 'r', encoding='utf-8') as f:
-            dmca_data = json.load(f)
-        log(f"[VERIFY] Successfully loaded JSON")
-
-        entries = dmca_data.get('entries', [])
-        log(f"[VERIFY] Found {len(entries)} entries in input")
-
-        if args.pending_only:
-            entries = [e for e in entries if not e.get('filedDate') and not e.get('takenDownDate')]
-            log(f"[VERIFY] Filtered to {len(entries)} pending entries")
-
-        tracked_mods = {m['modId']: m['workshopId'] for m in dmca_data.get('trackedMods', [])
-                        if m.get('modId') and m.get('workshopId')}
-        log(f"[VERIFY] Found {len(tracked_mods)} tracked mods")
-
-        needed_mods = set()
-        for e in entries:
-            needed_mods.update(e.get('containsModIds', []))
-
-        log(f"[VERIFY] Need {len(needed_mods)} original mods for comparison")
-
-        all_items = {}
+def parse_binary_manifest_chunks(data):
+    """{chunk sha hex: file name} from a binary depot manifest."""
+    if data[:2] == b'PK':
+        with zipfile.ZipFile(io.BytesIO(data)) as zf:
+            data = zf.read(zf.namelist()[0])
+
+    chunks = {}
+    if len(data) >= 4 and struct.unpack_from('<I', data, 0)[0] == STEAM_MANIFEST_PAYLOAD_MAGIC:
+        # Steam format: ContentManifestPayload.mappings(1) -> filename(1), chunks(6) -> sha(1)
+        pos = 0
+        while pos + 4 <= len(data):
+            magic = struct.unpack_from('<I', data, pos)[0]
+            if magic == STEAM_MANIFEST_END_MAGIC:
+                break
+            length = struct.unpack_from('<I', data, pos + 4)[0]
+            section = data[pos + 8:pos + 8 + length]
+            pos += 8 + length
+            if magic != STEAM_MANIFEST_PAYLOAD_MAGIC:
+                continue
+            for field, mapping in _pb_fields(section):
+                if field != 1:
+                    continue
+                filename, shas = '', []
+                for f, value in _pb_fields(mapping):
+                    if f == 1:
+                        filename = bytes(value).decode('utf-8', errors='replace')
+                    elif f == 6:
+                        shas.extend(bytes(v) for cf, v in _pb_fields(value) if cf == 1)
+                for sha in shas:
+                    chunks[sha.hex()] = filename
+        return chunks
+
+    # Older DepotDownloader: deflated ProtoManifest.files(1) -> name(1), chunks(2) -> id(1)
+    payload = zlib.decompress(data, -15)
+    for field, file_data in _pb_fields(payload):
+        if field != 1:
+            continue
+        filename, shas = '', []
+        for f, value in _pb_fields(file_data):
+            if f == 1:
+                filename = bytes(value).decode('utf-8', errors='replace')
+            elif f == 2:
+                shas.extend(bytes(v) for cf, v in _pb_fields(value) if cf == 1)
+        for sha in shas:
+            chunks[sha.hex()] = filename
+    return chunks
+
+def get_chunk_sidecar(manifest_path):
+    return manifest_path.with_name(manifest_path.name + '.chunks.bin')
+
+def load_manifest_chunks(manifest_path):
+    """ManifestHashes of a manifest's chunk SHAs, or None when there is no
+    binary manifest to read them from."""
+    manifest_path = Path(manifest_path)
+    binary = find_binary_manifest(manifest_path)
+    if not binary:
+        return None
+    st = binary.stat()
+    sidecar = get_chunk_sidecar(manifest_path)
+    if sidecar.exists():
+        try:
+            chunks = ManifestHashes(sidecar)
+            if chunks.source_size == st.st_size and chunks.source_mtime_ns == st.st_mtime_ns:
+                return chunks
+            chunks.close()
+        except (OSError, ValueError, struct.error) as e:
+            log(f"[Warning] Rebuilding chunk sidecar {sidecar.name}: {e}")
+    ManifestHashes.write(sidecar, parse_binary_manifest_chunks(binary.read_bytes()), st)
+    return ManifestHashes(sidecar)
+
+class ChunkIndex:
+    """Chunk SHA -> original mod IDs, over the originals that have chunk data."""
+
+    def __init__(self, tracked_mods, workshop_chunks):
+        self.totals = {}
+        self.workshops = {}
+        self.postings = {}
         for mod_id, ws_id in tracked_mods.items():
-            if mod_id in needed_mods:
-                all_items[ws_id] = ('original', mod_id)
-        for e in entries:
-            if e['workshopId'] not in all_items:
-                # Use ASCII-safe representation for logging
-                title = e.get('title', 'Unknown')
-                safe_title = title.encode('ascii', errors='replace').decode('ascii')
-                all_items[e['workshopId']] = ('suspect', safe_title)
-
-        log(f"\n[Download] Processing {len(all_items)} workshop items...")
-        workshop_to_manifest = {}
-
-        for i, (ws_id, (item_type, name)) in enumerate(all_items.items(), 1):
+            chunks = workshop_chunks.get(ws_id)
+            if not chunks:
+                continue
+            self.totals[mod_id] = len(chunks)
+            self.workshops[mod_id] = ws_id
+            for digest in chunks.digests():
+                self.postings.setdefault(bytes(digest), []).append(mod_id)
+
+    def resolve(self, suspect, exclude_workshop=None):
+        """{mod ID: chunks shared with suspect}"""
+        counts = {}
+        for digest in suspect.digests():
+            for mod_id in self.postings.get(digest, ()):
+                counts[mod_id] = counts.get(mod_id, 0) + 1
+        for mod_id, ws_id in self.workshops.items():
+            if ws_id == exclude_workshop:
+                counts.pop(mod_id, None)
+        return counts
+
+def run_verification(dmca_data, depot_path, pending_only=False, on_event=emit, should_stop=None,
+                     max_concurrent_downloads=None, similarity=None,
+                     chunk_matching=None, force=False, details_lookup=None):
+    """Verify DMCA entries in memory - entries in, results out.
+
+    dmca_data is the same shape as the export file ({'trackedMods': [...],
+    'entries': [...]}). Each checked entry gets a 'verification' block
+    added in place, and dmca_data is returned. Progress goes to on_event
+    (defaults to JSON lines on stdout, see emit()). should_stop, if given,
+    is polled between items so a running verification can be cut short.
+
+    Manifests that aren't cached yet are downloaded by a pool of up to
+    max_concurrent_downloads DepotDownloader jobs (default: from config,
+    see get_max_concurrent_downloads()). similarity turns the MinHash
+    score on/off (default: from config, see similarity_enabled()), and
+    chunk_matching the chunk overlap (see chunk_matching_enabled()).
+
+    Each result records the manifests (and options) it was computed from
+    under 'sources'. An entry whose stored sources match this run's is
+    reused as-is instead of re-compared, unless force is set.
+
+    details_lookup replaces the direct GetPublishedFileDetails calls (see
+    get_published_file_details) - the server passes one that goes through
+    its details cache and shared Web API rate limiter.
+    """
+    depot_path = Path(depot_path)
+    depot_dir = get_depot_dir(depot_path)
+    log(f"[VERIFY] DepotDownloader path: {depot_path}")
+    log(f"[VERIFY] Depot directory: {depot_dir}")
+
+    def stop_requested():
+        if should_stop and should_stop():
+            log("[VERIFY] Stop requested - finishing early")
+            return True
+        return False
+
+    entries = dmca_data.get('entries', [])
+    log(f"[VERIFY] Found {len(entries)} entries in input")
+
+    if similarity is None:
+        similarity = similarity_enabled()
+    if chunk_matching is None:
+        chunk_matching = chunk_matching_enabled()
+
+    if pending_only:
+        entries = [e for e in entries if not e.get('filedDate') and not e.get('takenDownDate')]
+        log(f"[VERIFY] Filtered to {len(entries)} pending entries")
+
+    tracked_mods = {m['modId']: m['workshopId'] for m in dmca_data.get('trackedMods', [])
+                    if m.get('modId') and m.get('workshopId')}
+    log(f"[VERIFY] Found {len(tracked_mods)} tracked mods")
+
+    needed_mods = set()
+    for e in entries:
+        needed_mods.update(e.get('containsModIds', []))
+
+    log(f"[VERIFY] Entries are tagged with {len(needed_mods)} mods; comparing against all {len(tracked_mods)} originals")
+
+    all_items = {}
+    # Every tracked original is fetched, not just the tagged ones - the
+    # originals index needs them all to catch untagged matches
+    for mod_id, ws_id in tracked_mods.items():
+        all_items[ws_id] = ('original', mod_id)
+    for e in entries:
+        if e['workshopId'] not in all_items:
+            # Use ASCII-safe representation for logging
+            title = e.get('title', 'Unknown')
+            safe_title = title.encode('ascii', errors='replace').decode('ascii')
+            all_items[e['workshopId']] = ('suspect', safe_title)
+
+    log(f"\n[Download] Processing {len(all_items)} workshop items...")
+    on_event("start", entries=len(entries), items=len(all_items))
+    workshop_to_manifest = {}
+    to_download = []
+    index = ManifestIndex(depot_dir)
+    index.refresh()
+
+    log(f"[Details] Checking {len(all_items)} workshop items with Steam...")
+    details = get_published_file_details(all_items, lookup=details_lookup)
+    removed = {ws_id for ws_id, d in details.items() if not d['exists']}
+    log(f"[Details] {len(details)} resolved, {len(removed)} removed")
+
+    for i, (ws_id, (item_type, name)) in enumerate(all_items.items(), 1):
+        manifest_id = details.get(ws_id, {}).get('manifestId')
+        stale_path = None
+        if manifest_id:
+            # Steam told us the current manifest - only that exact one is a hit
+            manifest_path = index.find_manifest(ws_id, manifest_id)
+            if not manifest_path:
+                stale_path = index.find(ws_id)
+        else:
+            manifest_path = index.find(ws_id)
+        if ws_id in removed and (item_type == 'suspect' or not manifest_path):
+            # Gone from the workshop: nothing to download, and a removed
+            # suspect is reported as taken down below. A cached original
+            # is still good to compare against.
             log(f"[{i}/{len(all_items)}] {item_type.upper()}: {name} ({ws_id})")
+            log(f"  [SKIP] Item removed")
+            on_event("item_removed", workshopId=ws_id)
+            continue
+        if not manifest_path:
+            to_download.append((i, ws_id, item_type, name, manifest_id, stale_path))
+            continue
+        log(f"[{i}/{len(all_items)}] {item_type.upper()}: {name} ({ws_id})")
+        log(f"  [CACHED] {manifest_path.name}")
+        on_event("item_started", current=i, total=len(all_items), workshopId=ws_id, kind=item_type, name=name)
+        on_event("manifest_cached", workshopId=ws_id, manifest=manifest_path.name)
+        workshop_to_manifest[ws_id] = manifest_path
+
+    def fetch(i, ws_id, item_type, name, manifest_id, stale_path):
+        # Runs on a pool thread; returns (manifest_path or None, event, data)
+        if stop_requested():
+            return None, None, {}
+        log(f"[{i}/{len(all_items)}] {item_type.upper()}: {name} ({ws_id})")
+        on_event("item_started", current=i, total=len(all_items), workshopId=ws_id, kind=item_type, name=name)
+
+        if stale_path:
+            log(f"  [UPDATED] {ws_id}: cached {stale_path.name} is outdated, now {manifest_id}")
+        success, error, manifest_path = download_workshop_manifest(depot_path, ws_id, index, manifest_id=manifest_id,
+                                                                   should_stop=should_stop)
+        if error == "Stopped":
+            log(f"  [STOPPED] {ws_id}: download cut short")
+            return None, None, {}
+        if success and manifest_path:
+            log(f"  [DOWNLOADED] {ws_id}: {manifest_path.name}")
+            time.sleep(2)
+            return manifest_path, "manifest_downloaded", {"manifest": manifest_path.name}
+        log(f"  [ERROR] {ws_id}: {error}")
+        if stale_path:
+            # Better to compare against the previous version than nothing
+            log(f"  [CACHED] {ws_id}: falling back to outdated {stale_path.name}")
+            return stale_path, "manifest_cached", {"manifest": stale_path.name, "outdated": True}
+        return None, "manifest_error", {"error": error}
+
+    if to_download:
+        workers = min(max_concurrent_downloads or get_max_concurrent_downloads(), len(to_download))
+        log(f"[Download] Fetching {len(to_download)} manifests with {workers} concurrent job(s)")
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(fetch, *job): job[1] for job in to_download}
+            for future in as_completed(futures):
+                ws_id = futures[future]
+                try:
+                    manifest_path, event, data = future.result()
+                except Exception as e:
+                    manifest_path, event, data = None, "manifest_error", {"error": str(e)}
+                if manifest_path:
+                    workshop_to_manifest[ws_id] = manifest_path
+                if event:
+                    on_event(event, workshopId=ws_id, **data)
 
-            manifest_path = find_manifest_for_workshop(depot_dir, ws_id)
-            if manifest_path:
-                log(f"  [CACHED] {manifest_path.name}")
-                workshop_to_manifest[ws_id] = manifest_path
-                continue
+    try:
+        index.flush()
+    except Exception as e:
+        log(f"[Warning] Failed to save manifest index: {e}")
 
-            exists, _ = check_workshop_exists(ws_id)
-            if not exists:
-                log(f"  [SKIP] Item removed")
-                continue
+    identities = {ws_id: index.identity(path) for ws_id, path in workshop_to_manifest.items()}
+    original_sources = {m: identities.get(w) for m, w in sorted(tracked_mods.items())}
 
-            success, error, manifest_path = download_workshop_manifest(depot_path, ws_id, depot_dir)
-            if success and manifest_path:
-                workshop_to_manifest[ws_id] = manifest_path
-                log(f"  [DOWNLOADED] {manifest_path.name}")
-                time.sleep(2)
-            else:
-                log(f"  [ERROR] {error}")
+    def result_sources(entry):
+        return {
+            'suspect': identities.get(entry['workshopId']),
+            'originals': original_sources,
+            'tagged': sorted(entry.get('containsModIds', [])),
+            'options': {'similarity': bool(similarity), 'chunkMatching': bool(chunk_matching)},
+        }
 
-        log(f"\n[Read] Parsing {len(workshop_to_manifest)} manifests...")
-        workshop_hashes = {}
-        for ws_id, manifest_path in workshop_to_manifest.items():
+    reusable = set()
+    if not force:
+        for e in entries:
+            previous = e.get('verification') or {}
+            if previous.get('verified') and identities.get(e['workshopId']) \
+                    and previous.get('sources') == result_sources(e):
+                reusable.add(e['workshopId'])
+        if reusable:
+            log(f"[VERIFY] {len(reusable)} entries unchanged since their last verification - reusing")
+
+    # Originals are always needed (the originals index spans all of them);
+    # suspects only when their entry is actually re-compared
+    to_read = {ws_id: path for ws_id, path in workshop_to_manifest.items()
+               if ws_id in tracked_mods.values() or ws_id not in reusable}
+
+    log(f"\n[Read] Parsing {len(to_read)} manifests...")
+    # Sidecars stay mapped for the whole comparison; the finally makes sure
+    # an exception or early stop never leaks the mappings (or, on Windows,
+    # the lock they hold on the sidecar files).
+    workshop_hashes = {}
+    workshop_chunks = {}
+    try:
+        for i, (ws_id, manifest_path) in enumerate(to_read.items(), 1):
             try:
-                content = manifest_path.read_text(encoding='utf-8', errors='ignore')
-                hashes = parse_manifest_fast(content)
+                hashes = load_manifest_hashes(manifest_path)
                 workshop_hashes[ws_id] = hashes
                 log(f"  {ws_id}: {len(hashes)} files")
             except Exception as e:
                 log(f"  {ws_id}: ERROR - {e}")
-                workshop_hashes[ws_id] = {}
+            on_event("manifest_read", current=i, total=len(to_read),
+                     workshopId=ws_id, files=len(workshop_hashes.get(ws_id, ())))
 
-        original_hashes = {}
-        for mod_id, ws_id in tracked_mods.items():
-            if mod_id in needed_mods and ws_id in workshop_hashes:
-                original_hashes[mod_id] = workshop_hashes[ws_id]
+        originals = OriginalsIndex(depot_dir)
+        originals.update(tracked_mods, workshop_to_manifest, workshop_hashes)
+        try:
+            originals.flush()
+        except Exception as e:
+            log(f"[Warning] Failed to save originals index: {e}")
+
+        signatures = {}
+        if similarity:
+            for ws_id, manifest_path in to_read.items():
+                try:
+                    signatures[ws_id] = load_minhash_signature(manifest_path)
+                except Exception as e:
+                    log(f"  {ws_id}: MinHash ERROR - {e}")
+        similar = SimilarityIndex({m: signatures.get(w) for m, w in tracked_mods.items()})
+
+        if chunk_matching:
+            missing = 0
+            for ws_id, manifest_path in to_read.items():
+                try:
+                    chunks = load_manifest_chunks(manifest_path)
+                    if chunks is not None:
+                        workshop_chunks[ws_id] = chunks
+                    else:
+                        missing += 1
+                except Exception as e:
+                    log(f"  {ws_id}: chunk data ERROR - {e}")
+            log(f"[Chunks] Chunk data for {len(workshop_chunks)}/{len(to_read)} manifests"
+                + (f" ({missing} without a binary manifest - chunk overlap unavailable)" if missing else ""))
+        chunk_index = ChunkIndex(tracked_mods, workshop_chunks)
 
         log(f"\n[Verify] Comparing {len(entries)} suspects...")
         verified_count = 0
 
         for i, entry in enumerate(entries, 1):
+            if stop_requested():
+                break
             ws_id = entry['workshopId']
             title = entry.get('title', 'Unknown')
             safe_title = title.encode('ascii', errors='replace').decode('ascii')
             log(f"[{i}/{len(entries)}] {safe_title}")
 
-            suspect_hashes = workshop_hashes.get(ws_id, {})
+            if ws_id in removed:
+                entry['verification'] = {
+                    'verified': True,
+                    'takenDown': True,
+                    'verifiedDate': datetime.utcnow().isoformat() + 'Z',
+                }
+                verified_count += 1
+                log(f"  TAKEN DOWN: no longer on the workshop")
+                on_event("entry_result", current=i, total=len(entries), workshopId=ws_id,
+                         title=safe_title, verification=entry['verification'])
+                continue
+
+            if ws_id in reusable:
+                verified_count += 1
+                log(f"  REUSED: {entry['verification'].get('matchPercentage', 0)}% (manifests unchanged)")
+                on_event("entry_result", current=i, total=len(entries), workshopId=ws_id,
+                         title=safe_title, verification=entry['verification'], reused=True)
+                continue
+
+            suspect_hashes = workshop_hashes.get(ws_id, ())
             if not suspect_hashes:
                 entry['verification'] = {'verified': False, 'error': 'No manifest'}
                 log(f"  SKIP: No manifest found")
+                on_event("entry_result", current=i, total=len(entries), workshopId=ws_id,
+                         title=safe_title, verification=entry['verification'])
                 continue
 
+            hits = originals.resolve(suspect_hashes, exclude_workshop=ws_id)
+            suspect_chunks = workshop_chunks.get(ws_id)
+            chunk_hits = chunk_index.resolve(suspect_chunks, exclude_workshop=ws_id) if suspect_chunks else None
+
+            def add_chunk_overlap(r, mod_id):
+                matched, total = chunk_hits.get(mod_id, 0), chunk_index.totals[mod_id]
+                r['chunkOverlap'] = round(matched / total * 100, 1) if total > 0 else 0
+                r['matchedChunks'] = matched
+                r['totalChunks'] = total
+
+            def mod_result(mod_id):
+                files = hits.get(mod_id, [])
+                total = originals.originals[mod_id]['files']
+                return {
+                    'matchPercentage': round(len(files) / total * 100, 1) if total > 0 else 0,
+                    'matchedFiles': len(files),
+                    'totalFiles': total,
+                    'sampleMatches': files[:5]
+                }
+
             mod_results = {}
             total_matched, total_files = 0, 0
+            tagged = entry.get('containsModIds', [])
 
-            for mod_id in entry.get('containsModIds', []):
-                if mod_id not in original_hashes:
+            suspect_sig = signatures.get(ws_id)
+            similar_mods = {m: pct for m, pct in similar.candidates(suspect_sig).items()
+                            if tracked_mods.get(m) != ws_id}
+
+            for mod_id in tagged:
+                if mod_id not in originals.originals:
                     continue
-                matched, total, files = compare_hashes(original_hashes[mod_id], suspect_hashes)
-                pct = round(matched / total * 100, 1) if total > 0 else 0
-                mod_results[mod_id] = {
-                    'matchPercentage': pct,
-                    'matchedFiles': matched,
-                    'totalFiles': total,
-                    'sampleMatches': files[:5]
-                }
-                total_matched += matched
-                total_files += total
-                log(f"  {mod_id}: {pct}% ({matched}/{total})")
+                mod_results[mod_id] = r = mod_result(mod_id)
+                if similarity:
+                    r['similarity'] = signature_similarity(signatures.get(tracked_mods.get(mod_id)), suspect_sig)
+                if chunk_hits is not None and mod_id in chunk_index.totals:
+                    add_chunk_overlap(r, mod_id)
+                total_matched += r['matchedFiles']
+                total_files += r['totalFiles']
+                log(f"  {mod_id}: {r['matchPercentage']}% ({r['matchedFiles']}/{r['totalFiles']})")
+
+            untagged = {}
+            for mod_id in sorted(hits, key=lambda m: -len(hits[m])):
+                if mod_id not in tagged and mod_id in tracked_mods:
+                    untagged[mod_id] = r = mod_result(mod_id)
+                    if similarity:
+                        r['similarity'] = signature_similarity(signatures.get(tracked_mods[mod_id]), suspect_sig)
+                    if chunk_hits is not None and mod_id in chunk_index.totals:
+                        add_chunk_overlap(r, mod_id)
+                    log(f"  UNTAGGED {mod_id}: {r['matchPercentage']}% ({r['matchedFiles']}/{r['totalFiles']})")
 
             overall_pct = round(total_matched / total_files * 100, 1) if total_files > 0 else 0
             entry['verification'] = {
@@ -411,10 +1420,126 @@ def main():
                 'matchedFiles': total_matched,
                 'totalFiles': total_files,
                 'verifiedDate': datetime.utcnow().isoformat() + 'Z',
-                'modResults': mod_results
+                'modResults': mod_results,
+                'untaggedMatches': untagged,
+                'sources': result_sources(entry)
             }
+            chunked = [r for r in mod_results.values() if 'totalChunks' in r]
+            if chunked:
+                matched_chunks = sum(r['matchedChunks'] for r in chunked)
+                total_chunks = sum(r['totalChunks'] for r in chunked)
+                entry['verification']['chunkOverlap'] = round(matched_chunks / total_chunks * 100, 1) if total_chunks else 0
+                log(f"  CHUNKS: {entry['verification']['chunkOverlap']}% ({matched_chunks}/{total_chunks})")
+            if similarity:
+                tagged_sims = [r['similarity'] for r in mod_results.values()]
+                entry['verification']['similarity'] = max(tagged_sims) if tagged_sims else 0
+                entry['verification']['similarityCandidates'] = dict(
+                    sorted(similar_mods.items(), key=lambda kv: -kv[1]))
+                log(f"  SIMILARITY: {entry['verification']['similarity']}% "
+                    f"({len(similar_mods)} LSH candidate(s))")
             verified_count += 1
             log(f"  OVERALL: {overall_pct}%")
+            on_event("entry_result", current=i, total=len(entries), workshopId=ws_id,
+                     title=safe_title, verification=entry['verification'])
+
+    finally:
+        for hashes in list(workshop_hashes.values()) + list(workshop_chunks.values()):
+            hashes.close()
+
+    high = len([e for e in entries if e.get('verification', {}).get('matchPercentage', 0) >= 75])
+    med = len([e for e in entries if 50 <= e.get('verification', {}).get('matchPercentage', 0) < 75])
+    low = len([e for e in entries if 25 <= e.get('verification', {}).get('matchPercentage', 0) < 50])
+    none_match = len([e for e in entries if e.get('verification', {}).get('matchPercentage', 0) < 25])
+
+    log(f"\n{'='*70}")
+    log("VERIFICATION COMPLETE")
+    log(f"{'='*70}")
+    log(f"Verified:     {verified_count}/{len(entries)}")
+    log(f"High (75%+):  {high}")
+    log(f"Medium:       {med}")
+    log(f"Low:          {low}")
+    log(f"None:         {none_match}")
+
+    on_event("complete", verified=verified_count, total=len(entries))
+    return dmca_data
+
+def open_log(log_path):
+    """Start logging to log_path (replaces any previously open log)."""
+    global LOG_FILE
+    close_log()
+    LOG_FILE = open(log_path, 'w', encoding='utf-8')
+
+def close_log():
+    global LOG_FILE
+    if LOG_FILE:
+        LOG_FILE.close()
+        LOG_FILE = None
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--dmca-export')
+    parser.add_argument('--depot-path')
+    parser.add_argument('--pending-only', action='store_true')
+    parser.add_argument('--show-config', action='store_true')
+    parser.add_argument('--clear-cache', action='store_true')
+    parser.add_argument('--force', action='store_true',
+                        help="re-verify entries even if their manifests haven't changed")
+    parser.add_argument('--benchmark-parser', metavar='MANIFEST',
+                        help=f"measure manifest parse throughput (target {PARSER_TARGET_MB_S} MB/s) and exit")
+    args = parser.parse_args()
+
+    if args.benchmark_parser:
+        rows, size_mb, mb_s = benchmark_parser(args.benchmark_parser)
+        verdict = "OK" if mb_s >= PARSER_TARGET_MB_S else "BELOW TARGET"
+        print(f"{rows} rows, {size_mb:.1f} MB: {mb_s:.1f} MB/s (target {PARSER_TARGET_MB_S} MB/s) {verdict}")
+        return
+    if not args.dmca_export:
+        parser.error("--dmca-export is required")
+
+    # Create log file next to the export file
+    dmca_path = Path(args.dmca_export)
+    open_log(dmca_path.parent / f"{dmca_path.stem}_verify.log")
+
+    try:
+        log(f"[VERIFY] Starting verification process")
+        log(f"[VERIFY] Python version: {sys.version}")
+        log(f"[VERIFY] Working directory: {os.getcwd()}")
+
+        depot_path = Path(args.depot_path) if args.depot_path else find_depotdownloader(interactive=False)
+        if not depot_path:
+            log("ERROR: DepotDownloader not found")
+            raise Exception("DepotDownloader not found")
+
+        depot_dir = get_depot_dir(depot_path)
+
+        if args.clear_cache:
+            if depot_dir.exists():
+                shutil.rmtree(depot_dir)
+                log("Cache cleared")
+            return
+
+        if args.show_config:
+            log(f"DepotDownloader: {depot_path}")
+            log(f"Depot dir: {depot_dir}")
+            if depot_dir.exists():
+                index = ManifestIndex(depot_dir)
+                index.refresh()
+                log(f"Indexed manifests: {len(index.files)}")
+                log(f"Mapped items: {len(index.workshops)}")
+            return
+
+        log(f"[VERIFY] Input file: {dmca_path}")
+
+        if not dmca_path.exists():
+            log(f"ERROR: Input file does not exist: {dmca_path}")
+            raise Exception(f"Input file not found: {dmca_path}")
+
+        log(f"[VERIFY] Reading input file...")
+        with open(dmca_path, 'r', encoding='utf-8') as f:
+            dmca_data = json.load(f)
+        log(f"[VERIFY] Successfully loaded JSON")
+
+        run_verification(dmca_data, depot_path, pending_only=args.pending_only, force=args.force)
 
         log(f"\n[VERIFY] Writing results back to {dmca_path}...")
         with open(dmca_path, 'w', encoding='utf-8') as f:
@@ -422,25 +1547,11 @@ def main():
             f.flush()
             os.fsync(f.fileno())
         log(f"[VERIFY] Successfully wrote {dmca_path.stat().st_size} bytes")
-
-        high = len([e for e in entries if e.get('verification', {}).get('matchPercentage', 0) >= 75])
-        med = len([e for e in entries if 50 <= e.get('verification', {}).get('matchPercentage', 0) < 75])
-        low = len([e for e in entries if 25 <= e.get('verification', {}).get('matchPercentage', 0) < 50])
-        none_match = len([e for e in entries if e.get('verification', {}).get('matchPercentage', 0) < 25])
-
-        log(f"\n{'='*70}")
-        log("VERIFICATION COMPLETE")
-        log(f"{'='*70}")
-        log(f"Verified:     {verified_count}/{len(entries)}")
-        log(f"High (75%+):  {high}")
-        log(f"Medium:       {med}")
-        log(f"Low:          {low}")
-        log(f"None:         {none_match}")
         log(f"\nOutput saved: {dmca_path}")
         log(f"File size: {dmca_path.stat().st_size} bytes")
 
         # Print success to stdout so server knows it worked
-        print("VERIFICATION_COMPLETE")
+        print("VERIFICATION_COMPLETE", flush=True)
 
     except Exception as e:
         log(f"\nFATAL ERROR: {e}")
@@ -448,8 +1559,7 @@ def main():
         log(traceback.format_exc())
         raise
     finally:
-        if LOG_FILE:
-            LOG_FILE.close()
+        close_log()
 
 if __name__ == '__main__':
     try: